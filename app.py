@@ -1,566 +1,4508 @@
-#Resume parser internship project- Codec technologies
-import os
-import re
-import json
-import sqlite3
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-
-import spacy
-import pdfplumber
-from docx import Document
-from flask import Flask, request, jsonify, render_template_string
-import pandas as pd
-
-
-@dataclass
-class ContactInfo:
-    name: Optional[str] = None
-    email: Optional[str] = None
-    phone: Optional[str] = None
-    address: Optional[str] = None
-    linkedin: Optional[str] = None
-
-@dataclass
-class Education:
-    degree: Optional[str] = None
-    institution: Optional[str] = None
-    year: Optional[str] = None
-    gpa: Optional[str] = None
-
-@dataclass
-class Experience:
-    title: Optional[str] = None
-    company: Optional[str] = None
-    duration: Optional[str] = None
-    description: Optional[str] = None
-
-@dataclass
-class ParsedResume:
-    contact_info: ContactInfo
-    skills: List[str]
-    education: List[Education]
-    experience: List[Experience]
-    summary: Optional[str] = None
-    raw_text: Optional[str] = None
-
-class ResumeParser:
-    def __init__(self):
-      
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("⚠️  Please install spaCy English model: python -m spacy download en_core_web_sm")
-            self.nlp = None
-        
-        self.skill_keywords = {
-            'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift'],
-            'web': ['html', 'css', 'react', 'vue', 'angular', 'node.js', 'django', 'flask', 'spring'],
-            'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'sqlite'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform'],
-            'data': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'tableau', 'powerbi'],
-            'tools': ['git', 'jenkins', 'jira', 'confluence', 'slack', 'trello', 'vscode']
-        }
-        
-       
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file using PDFPlumber."""
-        text = ""
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            print(f"Error extracting PDF: {e}")
-        return text
-
-    def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from Word document."""
-        text = ""
-        try:
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-        except Exception as e:
-            print(f"Error extracting DOCX: {e}")
-        return text
-
-    def extract_contact_info(self, text: str) -> ContactInfo:
-        """Extract contact information from text."""
-        contact = ContactInfo()
-        
-        email_match = re.search(self.email_pattern, text, re.IGNORECASE)
-        if email_match:
-            contact.email = email_match.group()
-        
-        
-        phone_match = re.search(self.phone_pattern, text)
-        if phone_match:
-            contact.phone = phone_match.group()
-        
-       
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin_match = re.search(linkedin_pattern, text, re.IGNORECASE)
-        if linkedin_match:
-            contact.linkedin = linkedin_match.group()
-        
-        if self.nlp:
-            doc = self.nlp(text[:1000])
-            persons = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
-            if persons:
-                contact.name = persons[0]
-      
-        if not contact.name:
-            lines = text.strip().split('\n')
-            if lines:
-                first_line = lines[0].strip()
-                if len(first_line.split()) <= 4 and len(first_line) < 50:
-                    contact.name = first_line
-        
-        return contact
-
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract skills from text using keyword matching."""
-        text_lower = text.lower()
-        found_skills = []
-        
-        for category, skills in self.skill_keywords.items():
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    found_skills.append(skill.title())
-        
-        return list(dict.fromkeys(found_skills))
-
-    def extract_education(self, text: str) -> List[Education]:
-        """Extract education information."""
-        education_list = []
-        
-        patterns = [
-            r'(bachelor|master|phd|doctorate|associate|diploma|certificate).*?in\s+([^\n\r]+)',
-            r'(b\.?s\.?|m\.?s\.?|ph\.?d\.?|b\.?a\.?|m\.?a\.?)\s+([^\n\r]+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                education = Education(
-                    degree=match.group(1),
-                    institution=match.group(2).strip()
-                )
-                education_list.append(education)
-        
-        return education_list
-
-    def extract_experience(self, text: str) -> List[Experience]:
-        """Extract work experience."""
-        experience_list = []
-        
-        job_patterns = [
-            r'(software engineer|developer|analyst|manager|director|coordinator|specialist)',
-            r'(intern|senior|junior|lead|principal|chief)'
-        ]
-        
-        lines = text.split('\n')
-        current_exp = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            for pattern in job_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if current_exp:
-                        experience_list.append(current_exp)
-                    current_exp = Experience(title=line)
-                    break
-        
-        if current_exp:
-            experience_list.append(current_exp)
-        
-        return experience_list
-
-    def parse_resume(self, file_path: str) -> ParsedResume:
-        """Main method to parse a resume file."""
-        if file_path.lower().endswith('.pdf'):
-            raw_text = self.extract_text_from_pdf(file_path)
-        elif file_path.lower().endswith(('.docx', '.doc')):
-            raw_text = self.extract_text_from_docx(file_path)
-        else:
-            raise ValueError("Unsupported file format. Use PDF or DOCX.")
-        
-        contact_info = self.extract_contact_info(raw_text)
-        skills = self.extract_skills(raw_text)
-        education = self.extract_education(raw_text)
-        experience = self.extract_experience(raw_text)
-        
-        return ParsedResume(
-            contact_info=contact_info,
-            skills=skills,
-            education=education,
-            experience=experience,
-            raw_text=raw_text
-        )
-
-class SQLiteDatabaseManager:
-    def __init__(self, db_path: str = "resumes.db"):
-        self.db_path = db_path
-        self.init_database()
-    
-    def get_connection(self):
-        """Get SQLite database connection."""
-        return sqlite3.connect(self.db_path)
-    
-    def init_database(self):
-        """Initialize SQLite database tables."""
-        with self.get_connection() as conn:
-            conn.executescript("""
-            CREATE TABLE IF NOT EXISTS resumes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                email TEXT,
-                phone TEXT,
-                address TEXT,
-                linkedin TEXT,
-                skills TEXT,
-                raw_text TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            CREATE TABLE IF NOT EXISTS education (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                resume_id INTEGER,
-                degree TEXT,
-                institution TEXT,
-                year TEXT,
-                gpa TEXT,
-                FOREIGN KEY (resume_id) REFERENCES resumes (id)
-            );
-            
-            CREATE TABLE IF NOT EXISTS experience (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                resume_id INTEGER,
-                title TEXT,
-                company TEXT,
-                duration TEXT,
-                description TEXT,
-                FOREIGN KEY (resume_id) REFERENCES resumes (id)
-            );
-            
-            CREATE INDEX IF NOT EXISTS idx_resumes_email ON resumes(email);
-            CREATE INDEX IF NOT EXISTS idx_resumes_skills ON resumes(skills);
-            """)
-    
-    def store_resume(self, parsed_resume: ParsedResume) -> int:
-        """Store parsed resume in SQLite database."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            skills_json = json.dumps(parsed_resume.skills)
-            
-           
-            cursor.execute("""
-                INSERT INTO resumes (name, email, phone, address, linkedin, skills, raw_text)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                parsed_resume.contact_info.name,
-                parsed_resume.contact_info.email,
-                parsed_resume.contact_info.phone,
-                parsed_resume.contact_info.address,
-                parsed_resume.contact_info.linkedin,
-                skills_json,
-                parsed_resume.raw_text
-            ))
-            
-            resume_id = cursor.lastrowid
-            
-         
-            for edu in parsed_resume.education:
-                cursor.execute("""
-                    INSERT INTO education (resume_id, degree, institution, year, gpa)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (resume_id, edu.degree, edu.institution, edu.year, edu.gpa))
-            
-          
-            for exp in parsed_resume.experience:
-                cursor.execute("""
-                    INSERT INTO experience (resume_id, title, company, duration, description)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (resume_id, exp.title, exp.company, exp.duration, exp.description))
-            
-            conn.commit()
-            return resume_id
-    
-    def search_resumes(self, query: str = None, skills: List[str] = None) -> List[Dict]:
-        """Search resumes by text query or skills."""
-        with self.get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            if skills:
-                
-                skill_conditions = []
-                params = []
-                for skill in skills:
-                    skill_conditions.append("r.skills LIKE ?")
-                    params.append(f'%"{skill.lower()}"%')
-                
-                sql = f"""
-                SELECT r.*, GROUP_CONCAT(e.degree) as degrees, GROUP_CONCAT(ex.title) as job_titles
-                FROM resumes r
-                LEFT JOIN education e ON r.id = e.resume_id
-                LEFT JOIN experience ex ON r.id = ex.resume_id
-                WHERE {' OR '.join(skill_conditions)}
-                GROUP BY r.id
-                ORDER BY r.created_at DESC
-                """
-                cursor.execute(sql, params)
-                
-            elif query:
-                
-                cursor.execute("""
-                    SELECT r.*, GROUP_CONCAT(e.degree) as degrees, GROUP_CONCAT(ex.title) as job_titles
-                    FROM resumes r
-                    LEFT JOIN education e ON r.id = e.resume_id
-                    LEFT JOIN experience ex ON r.id = ex.resume_id
-                    WHERE r.raw_text LIKE ? OR r.name LIKE ?
-                    GROUP BY r.id
-                    ORDER BY r.created_at DESC
-                """, (f"%{query}%", f"%{query}%"))
-                
-            else:
-              
-                cursor.execute("""
-                    SELECT r.*, GROUP_CONCAT(e.degree) as degrees, GROUP_CONCAT(ex.title) as job_titles
-                    FROM resumes r
-                    LEFT JOIN education e ON r.id = e.resume_id
-                    LEFT JOIN experience ex ON r.id = ex.resume_id
-                    GROUP BY r.id
-                    ORDER BY r.created_at DESC
-                """)
-            
-            results = []
-            for row in cursor.fetchall():
-                result_dict = dict(row)
-                
-                if result_dict['skills']:
-                    try:
-                        result_dict['skills'] = json.loads(result_dict['skills'])
-                    except:
-                        result_dict['skills'] = []
-                results.append(result_dict)
-            
-            return results
-
-
-app = Flask(__name__)
-
-# Initialize components
-parser = ResumeParser()
-db_manager = SQLiteDatabaseManager()
-
-@app.route('/')
-def index():
-    """Main page with upload form and search."""
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Resume Parser - VS Code Version</title>
-        <style>
-            body { 
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-                margin: 0; padding: 20px; background: #f5f5f5; 
-            }
-            .container { 
-                max-width: 1000px; margin: 0 auto; background: white; 
-                padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }
-            .header { text-align: center; margin-bottom: 40px; }
-            .header h1 { color: #007ACC; margin: 0; }
-            .header p { color: #666; margin: 10px 0 0 0; }
-            .section { 
-                margin: 30px 0; padding: 25px; border: 2px solid #e1e1e1; 
-                border-radius: 8px; background: #fafafa;
-            }
-            .section h2 { color: #333; margin-top: 0; }
-            input[type="file"], input[type="text"] { 
-                padding: 12px; margin: 8px; border: 2px solid #ddd; 
-                border-radius: 5px; font-size: 14px; width: 300px;
-            }
-            button { 
-                padding: 12px 20px; margin: 8px; background: #007ACC; 
-                color: white; border: none; border-radius: 5px; 
-                cursor: pointer; font-size: 14px; font-weight: bold;
-            }
-            button:hover { background: #005a9e; }
-            .status { 
-                padding: 15px; margin: 15px 0; border-radius: 5px; 
-                font-weight: bold;
-            }
-            .success { background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
-            .error { background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
-            .info { background: #d1ecf1; color: #0c5460; border: 1px solid #bee5eb; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>📄 Resume Parser System</h1>
-                <p>VS Code Ready • SQLite Database • No PostgreSQL Required</p>
-            </div>
-            
-            <div class="section">
-                <h2>📤 Upload Resume</h2>
-                <p>Upload a PDF or Word document to extract candidate information.</p>
-                <form action="/upload" method="post" enctype="multipart/form-data">
-                    <input type="file" name="resume" accept=".pdf,.docx,.doc" required>
-                    <button type="submit">Parse Resume</button>
-                </form>
-            </div>
-            
-            <div class="section">
-                <h2>🔍 Search Resumes</h2>
-                <p>Search through all parsed resumes in your database.</p>
-                
-                <form action="/search" method="get" style="margin-bottom: 15px;">
-                    <input type="text" name="q" placeholder="Search by name, skills, or content">
-                    <button type="submit">Search All</button>
-                </form>
-                
-                <form action="/search" method="get">
-                    <input type="text" name="skills" placeholder="Search by skills (e.g., python,javascript,react)">
-                    <button type="submit">Search by Skills</button>
-                </form>
-            </div>
-            
-            <div class="section">
-                <h2>📊 Quick Actions</h2>
-                <a href="/api/stats" style="text-decoration: none;">
-                    <button type="button">View Database Stats</button>
-                </a>
-                <a href="/search" style="text-decoration: none;">
-                    <button type="button">View All Resumes</button>
-                </a>
-            </div>
-        </div>
-        
-        <script>
-            // Add some basic client-side functionality
-            document.querySelector('form[action="/upload"]').onsubmit = function() {
-                const button = this.querySelector('button');
-                button.textContent = 'Processing...';
-                button.disabled = true;
-            };
-        </script>
-    </body>
-    </html>
-    """
-    return render_template_string(html_template)
-
-@app.route('/upload', methods=['POST'])
-def upload_resume():
-    """Handle resume upload and parsing."""
-    if 'resume' not in request.files:
-        return jsonify({'error': 'No file uploaded'}), 400
-    
-    file = request.files['resume']
-    if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
-    
-    try:
-
-        os.makedirs('uploads', exist_ok=True)
-        
-     
-        filename = f"resume_{datetime.now().timestamp()}_{file.filename}"
-        file_path = os.path.join('uploads', filename)
-        file.save(file_path)
-        
-        
-        parsed_resume = parser.parse_resume(file_path)
-        
-       
-        resume_id = db_manager.store_resume(parsed_resume)
-        
-        return jsonify({
-            'success': True,
-            'message': f'Resume parsed successfully! Resume ID: {resume_id}',
-            'resume_id': resume_id,
-            'extracted_data': {
-                'name': parsed_resume.contact_info.name,
-                'email': parsed_resume.contact_info.email,
-                'skills_count': len(parsed_resume.skills),
-                'skills': parsed_resume.skills[:5],  # First 5 skills
-                'education_count': len(parsed_resume.education),
-                'experience_count': len(parsed_resume.experience)
-            }
-        })
-        
-    except Exception as e:
-        return jsonify({'error': f'Processing failed: {str(e)}'}), 500
-
-@app.route('/search')
-def search_resumes():
-    """Search resumes endpoint."""
-    query = request.args.get('q')
-    skills_param = request.args.get('skills')
-    
-    skills = None
-    if skills_param:
-        skills = [s.strip() for s in skills_param.split(',')]
-    
-    try:
-        results = db_manager.search_resumes(query=query, skills=skills)
-        return jsonify({
-            'success': True,
-            'count': len(results),
-            'query': query,
-            'skills_filter': skills,
-            'results': results
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/stats')
-def get_stats():
-    """Get database statistics."""
-    try:
-        with db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM resumes")
-            total_resumes = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM education")
-            total_education = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM experience")
-            total_experience = cursor.fetchone()[0]
-            
-            return jsonify({
-                'success': True,
-                'stats': {
-                    'total_resumes': total_resumes,
-                    'total_education_records': total_education,
-                    'total_experience_records': total_experience,
-                    'database_file': db_manager.db_path
-                }
-            })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-if __name__ == '__main__':
-    print("🚀 Resume Parser System Starting...")
-    print("📂 Database: SQLite (resumes.db)")
-    print("🌐 Web Interface: http://localhost:5000")
-    print("💻 Perfect for VS Code development!")
-    print("\n" + "="*50)
-    
+#Resume parser internship project- Codec technologies
+import io
+import os
+import re
+import glob
+import json
+import math
+import time
+import bisect
+import inspect
+import functools
+import shutil
+import tempfile
+import base64
+import hashlib
+import uuid
+import zlib
+import random
+import struct
+import queue
+import sqlite3
+import threading
+import multiprocessing
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict
+
+import click
+from flask import (Blueprint, Flask, Response, current_app, request, jsonify,
+                   render_template_string, stream_with_context)
+from werkzeug.utils import secure_filename
+from xml.etree import ElementTree
+
+# spaCy and pdfplumber are imported on first use so the web app can start
+# serving search requests without loading them. Word files are read with
+# the standard library.
+
+
+@dataclass
+class ContactInfo:
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+    linkedin: Optional[str] = None
+
+@dataclass
+class Education:
+    degree: Optional[str] = None
+    institution: Optional[str] = None
+    year: Optional[str] = None
+    gpa: Optional[str] = None
+
+@dataclass
+class Experience:
+    title: Optional[str] = None
+    company: Optional[str] = None
+    duration: Optional[str] = None
+    description: Optional[str] = None
+
+@dataclass
+class ExtractionResult:
+    """Outcome of extracting text from a file.
+
+    ``status`` is one of ``ok``, ``truncated`` (page limit hit),
+    ``timed_out`` (time budget spent), ``memory_limit`` (text size cap hit),
+    ``stopped_early`` (contact details found), ``empty`` (no text layer,
+    usually a scanned file) or ``error``.
+    """
+    text: str = ""
+    status: str = "ok"
+    pages_read: int = 0
+    page_count: Optional[int] = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    size_bytes: int = 0
+
+@dataclass
+class ParsedResume:
+    contact_info: ContactInfo
+    skills: List[str]
+    education: List[Education]
+    experience: List[Experience]
+    summary: Optional[str] = None
+    raw_text: Optional[str] = None
+    extraction: Optional[ExtractionResult] = None
+    # ResumeParser.version of the text-level extractors that produced this.
+    extractor_version: Optional[str] = None
+
+
+class ExtractionError(Exception):
+    """Raised when no text could be read from a resume file."""
+
+    def __init__(self, result: ExtractionResult):
+        super().__init__(f"Could not extract text: {result.error}")
+        self.result = result
+
+
+def parsed_resume_from_dict(data: Dict) -> ParsedResume:
+    """Rebuild a ParsedResume from the output of ``dataclasses.asdict``."""
+    return ParsedResume(
+        contact_info=ContactInfo(**data['contact_info']),
+        skills=list(data['skills']),
+        education=[Education(**edu) for edu in data['education']],
+        experience=[Experience(**exp) for exp in data['experience']],
+        summary=data.get('summary'),
+        raw_text=data.get('raw_text'),
+        extraction=ExtractionResult(**data['extraction']) if data.get('extraction') else None,
+        extractor_version=data.get('extractor_version'),
+    )
+
+
+@dataclass
+class SkillMatch:
+    name: str
+    category: str
+    count: int = 0
+
+
+SKILL_TAXONOMY_PATH = os.environ.get(
+    'RESUME_SKILL_TAXONOMY',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills.json')
+)
+
+
+class SkillMatcher:
+    """Find taxonomy skills in text in a single pass.
+
+    Every canonical skill name and alias is tokenized the same way as the
+    resume text and compiled into a trie keyed by token. Matching walks the
+    token stream once, taking the longest alias that starts at each
+    position, so "java" never matches inside "javascript" and multi-word
+    aliases like "machine learning" are matched as a unit. Aliases listed in
+    ``case_sensitive`` (names that double as English words, such as "Go")
+    only match when written exactly as given.
+    """
+
+    _TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+    # The same tokens with their case kept, for the case-sensitive aliases.
+    _CASED_TOKEN_RE = re.compile(_TOKEN_RE.pattern, re.IGNORECASE)
+    _END = ''
+
+    def __init__(self, taxonomy: Dict[str, Dict[str, List[str]]], version: Optional[str] = None,
+                 case_sensitive: Optional[List[str]] = None):
+        self._trie = {}
+        # Lowercase token tuple -> the exact tokens a case-sensitive alias must appear as.
+        self._exact = {}
+        self.categories = {}
+        for category, skills in taxonomy.items():
+            for canonical, aliases in skills.items():
+                self.categories[canonical] = category
+                for alias in [canonical, *aliases]:
+                    self.add_alias(alias, canonical)
+        for alias in case_sensitive or ():
+            tokens = tuple(self._CASED_TOKEN_RE.findall(alias))
+            self._exact[tuple(token.lower() for token in tokens)] = tokens
+
+        definition = {'categories': taxonomy, 'case_sensitive': sorted(case_sensitive)} if case_sensitive else taxonomy
+        fingerprint = hashlib.sha256(json.dumps(definition, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        self.version = f"{version}-{fingerprint}" if version else fingerprint
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SkillMatcher':
+        """Load a taxonomy file of the form ``{"version": ..., "categories": {category: {skill: [aliases]}}}``.
+
+        An optional ``"case_sensitive"`` list names the aliases that must match exactly.
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['categories'], version=data.get('version'), case_sensitive=data.get('case_sensitive'))
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Split text into lowercase tokens, keeping symbols such as c++, c# and node.js intact."""
+        return cls._TOKEN_RE.findall(text.lower())
+
+    def add_alias(self, alias: str, canonical: str):
+        """Register an alias for a canonical skill name."""
+        tokens = self.tokenize(alias)
+        if not tokens:
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[self._END] = canonical
+
+    def canonical(self, alias: str) -> Optional[str]:
+        """Return the canonical skill name for an exact alias, if known."""
+        node = self._trie
+        for token in self.tokenize(alias):
+            node = node.get(token)
+            if node is None:
+                return None
+        return node.get(self._END)
+
+    def find(self, text: str) -> List[SkillMatch]:
+        """Return the skills found in ``text`` in order of first appearance."""
+        exact = self._exact
+        if exact:
+            originals = self._CASED_TOKEN_RE.findall(text)
+            tokens = [token.lower() for token in originals]
+        else:
+            tokens = self.tokenize(text)
+        found = {}
+        i, n = 0, len(tokens)
+        while i < n:
+            node = self._trie.get(tokens[i])
+            j = i
+            match_end, canonical = None, None
+            while node is not None:
+                j += 1
+                if self._END in node:
+                    required = exact.get(tuple(tokens[i:j])) if exact else None
+                    if required is None or required == tuple(originals[i:j]):
+                        match_end, canonical = j, node[self._END]
+                if j >= n:
+                    break
+                node = node.get(tokens[j])
+
+            if canonical is None:
+                i += 1
+                continue
+            if canonical not in found:
+                found[canonical] = SkillMatch(canonical, self.categories[canonical])
+            found[canonical].count += 1
+            i = match_end
+        return list(found.values())
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill name for indexing and lookups."""
+    return ' '.join(str(skill).lower().split())
+
+
+_FTS_PHRASE_RE = re.compile(r'"([^"]*)"|(\S+)')
+_FTS_OPERATORS = {'OR', 'AND', 'NOT'}
+
+
+def build_fts_query(query: str) -> str:
+    """Turn a user search string into a safe FTS5 MATCH expression.
+
+    Quoted text becomes a phrase query, a trailing ``*`` becomes a prefix
+    query, and upper-case OR/AND/NOT are kept as operators. Everything else
+    is quoted so punctuation in the input cannot break the query syntax.
+    """
+    parts = []
+    for phrase, word in _FTS_PHRASE_RE.findall(query):
+        if phrase:
+            parts.append('"' + phrase.replace('"', '""') + '"')
+            continue
+        if word in _FTS_OPERATORS:
+            if parts and parts[-1] not in _FTS_OPERATORS:
+                parts.append(word)
+            continue
+        prefix = word.endswith('*')
+        word = word.rstrip('*').replace('"', '""')
+        if word:
+            parts.append(f'"{word}"' + ('*' if prefix else ''))
+    while parts and parts[-1] in _FTS_OPERATORS:
+        parts.pop()
+    return ' '.join(parts) or '""'
+
+
+def encode_cursor(values: List) -> str:
+    """Encode keyset pagination values as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(token: str) -> List:
+    """Decode a token produced by :func:`encode_cursor`."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+class Metrics:
+    """In-process timing histograms and counters, rendered in Prometheus text format.
+
+    Stage timings are recorded by the :func:`timed` decorator; counters by
+    :meth:`inc`. Values are per process, so bulk-ingest worker processes
+    keep their own.
+    """
+
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    COUNTERS = {
+        'documents_total': 'Documents extracted, by format and extraction status.',
+        'pages_total': 'PDF pages read, by format.',
+        'bytes_total': 'Bytes of documents extracted, by format.',
+        'errors_total': 'Errors by stage and exception type.',
+        'duplicates_total': 'Stored resumes flagged as near-duplicates of an earlier one.',
+    }
+
+    def __init__(self, namespace: str = 'resume_parser'):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._local = threading.local()
+
+    def observe(self, stage: str, seconds: float):
+        """Record one timing for ``stage``, and add it to this thread's active trace."""
+        index = bisect.bisect_left(self.BUCKETS, seconds)
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                # One count per bucket plus +Inf, then the running sum.
+                histogram = self._histograms[stage] = [0] * (len(self.BUCKETS) + 1) + [0.0]
+            histogram[index] += 1
+            histogram[-1] += seconds
+        trace = getattr(self._local, 'trace', None)
+        if trace is not None:
+            trace[stage] = trace.get(stage, 0.0) + seconds
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        """Add ``amount`` to the counter ``name`` with the given labels."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    @contextmanager
+    def trace(self) -> Iterator[Dict[str, float]]:
+        """Collect the seconds spent per stage on this thread inside the block."""
+        previous = getattr(self._local, 'trace', None)
+        stages = {}
+        self._local.trace = stages
+        try:
+            yield stages
+        finally:
+            self._local.trace = previous
+
+    def render(self, gauges: Optional[List[Tuple[str, str, float]]] = None) -> str:
+        """Return all metrics, plus any ``(name, help, value)`` gauges, as Prometheus text."""
+        with self._lock:
+            histograms = {stage: list(values) for stage, values in self._histograms.items()}
+            counters = dict(self._counters)
+
+        ns = self.namespace
+        lines = [f"# HELP {ns}_stage_seconds Time spent in each parsing, storage and search stage.",
+                 f"# TYPE {ns}_stage_seconds histogram"]
+        for stage in sorted(histograms):
+            values = histograms[stage]
+            cumulative = 0
+            for bound, count in zip((*self.BUCKETS, '+Inf'), values):
+                cumulative += count
+                lines.append(f'{ns}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{ns}_stage_seconds_sum{{stage="{stage}"}} {values[-1]:.6f}')
+            lines.append(f'{ns}_stage_seconds_count{{stage="{stage}"}} {cumulative}')
+
+        for name, help_text in self.COUNTERS.items():
+            lines += [f"# HELP {ns}_{name} {help_text}", f"# TYPE {ns}_{name} counter"]
+            for (counter, labels), value in sorted(counters.items()):
+                if counter == name:
+                    label_text = ','.join(f'{key}="{_escape_label(val)}"' for key, val in labels)
+                    lines.append(f"{ns}_{name}{{{label_text}}} {value}" if label_text else f"{ns}_{name} {value}")
+
+        for name, help_text, value in gauges or ():
+            lines += [f"# HELP {ns}_{name} {help_text}", f"# TYPE {ns}_{name} gauge", f"{ns}_{name} {value}"]
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+METRICS = Metrics()
+
+
+def timed(stage: str):
+    """Record the decorated function's run time in :data:`METRICS` under ``stage``.
+
+    Exceptions are counted in ``errors_total`` and re-raised. For generator
+    functions only the time spent producing items is measured, not the
+    time the caller spends between them.
+    """
+    def decorator(fn):
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                elapsed = 0.0
+                generator = fn(*args, **kwargs)
+                try:
+                    while True:
+                        started = time.perf_counter()
+                        try:
+                            item = next(generator)
+                        except StopIteration:
+                            return
+                        finally:
+                            elapsed += time.perf_counter() - started
+                        yield item
+                except Exception as e:
+                    METRICS.inc('errors_total', stage=stage, type=type(e).__name__)
+                    raise
+                finally:
+                    generator.close()
+                    METRICS.observe(stage, elapsed)
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                METRICS.inc('errors_total', stage=stage, type=type(e).__name__)
+                raise
+            finally:
+                METRICS.observe(stage, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+class SlowParseLog:
+    """Append a JSON line for each document that took at least ``threshold`` seconds to parse.
+
+    Each record has the file name and size, page counts, the extraction
+    status and the seconds spent in every stage.
+    """
+
+    def __init__(self, path: str, threshold: float = 5.0):
+        self.path = path
+        self.threshold = threshold
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, filename: Optional[str], stages: Dict[str, float],
+               extraction: Optional[ExtractionResult] = None, **extra):
+        """Write a record if ``elapsed`` is over the threshold."""
+        if elapsed < self.threshold:
+            return
+        entry = {
+            'logged_at': datetime.now().isoformat(timespec='seconds'),
+            'filename': filename,
+            'elapsed': round(elapsed, 3),
+            'size_bytes': extraction.size_bytes if extraction else None,
+            'page_count': extraction.page_count if extraction else None,
+            'pages_read': extraction.pages_read if extraction else None,
+            'status': extraction.status if extraction else None,
+            'stages': {stage: round(seconds, 4) for stage, seconds in sorted(stages.items())},
+            **extra,
+        }
+        line = json.dumps(entry)
+        try:
+            with self._lock:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+        except OSError as e:
+            # Diagnostics must never fail the parse they describe.
+            print(f"⚠️  Could not write slow parse log {self.path}: {e}")
+
+
+# Bump whenever extraction rules change so cached parses are not reused.
+PARSER_VERSION = "3"
+
+# A resume file: a filesystem path or a seekable binary file object.
+Source = Union[str, BinaryIO]
+
+
+def source_size(source: Source) -> int:
+    """Size in bytes of a path or seekable file object, or 0 if it cannot be told."""
+    try:
+        if isinstance(source, str):
+            return os.path.getsize(source)
+        position = source.tell()
+        size = source.seek(0, io.SEEK_END)
+        source.seek(position)
+        return size
+    except (OSError, AttributeError, ValueError):
+        return 0
+
+
+# Leading bytes of the OLE2 container used by Word 97-2003 .doc (and encrypted .docx) files.
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+
+def source_magic(source: Source, size: int = 8) -> bytes:
+    """The first ``size`` bytes of a path or seekable file object, leaving its position unchanged."""
+    try:
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                return f.read(size)
+        position = source.tell()
+        source.seek(0)
+        magic = source.read(size)
+        source.seek(position)
+        return magic
+    except (OSError, AttributeError, ValueError):
+        return b''
+
+
+DEFAULT_SKILL_KEYWORDS = {
+    'programming': ['Python', 'Java', 'JavaScript', 'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift'],
+    'web': ['HTML', 'CSS', 'React', 'Vue', 'Angular', 'Node.js', 'Django', 'Flask', 'Spring'],
+    'database': ['SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Elasticsearch', 'SQLite'],
+    'cloud': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform'],
+    'data': ['Pandas', 'NumPy', 'scikit-learn', 'TensorFlow', 'PyTorch', 'Tableau', 'PowerBI'],
+    'tools': ['Git', 'Jenkins', 'Jira', 'Confluence', 'Slack', 'Trello', 'VSCode']
+}
+# Skill names that are also everyday words; matched only as written.
+DEFAULT_CASE_SENSITIVE_SKILLS = ['Go', 'Rust', 'Swift']
+
+class ResumeParser:
+    # Section headings recognised by segment_sections. Headings under
+    # "other" (projects, awards, ...) only end the previous section.
+    SECTION_HEADINGS = {
+        'contact': ['contact', 'contact information', 'contact details', 'personal details', 'personal information'],
+        'summary': ['summary', 'professional summary', 'profile', 'professional profile', 'objective',
+                    'career objective', 'about me'],
+        'education': ['education', 'academic background', 'academics', 'academic qualification',
+                      'academic qualifications', 'educational qualification', 'educational qualifications',
+                      'qualification', 'qualifications', 'other qualification', 'other qualifications',
+                      'education and training'],
+        'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                       'employment history', 'work history', 'internships', 'internship', 'career history'],
+        'skills': ['skills', 'technical skills', 'key skills', 'core competencies', 'technologies',
+                   'skills and tools', 'technical proficiency'],
+        'other': ['projects', 'academic projects', 'personal projects', 'certifications', 'certificates',
+                  'achievements', 'awards', 'honors', 'publications', 'languages', 'interests', 'hobbies',
+                  'extracurricular activities', 'activities', 'references', 'declaration', 'volunteering'],
+    }
+    SECTION_HEADING_RE = re.compile(
+        r'^[ \t]*(?:' + '|'.join(
+            f"(?P<{section}>" + '|'.join(re.escape(h).replace(r'\ ', r'[ \t]+') for h in headings) + ')'
+            for section, headings in SECTION_HEADINGS.items()
+        ) + r')[ \t]*:?[ \t]*$',
+        re.IGNORECASE | re.MULTILINE
+    )
+
+    EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE)
+    PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+    LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+    EDUCATION_RES = (
+        re.compile(r'(bachelor|master|phd|doctorate|associate|diploma|certificate).*?in\s+([^\n\r]+)', re.IGNORECASE),
+        re.compile(r'(b\.?s\.?|m\.?s\.?|ph\.?d\.?|b\.?a\.?|m\.?a\.?)\s+([^\n\r]+)', re.IGNORECASE),
+    )
+    JOB_TITLE_RE = re.compile(
+        r'(software engineer|developer|analyst|manager|director|coordinator|specialist)'
+        r'|(intern|senior|junior|lead|principal|chief)',
+        re.IGNORECASE
+    )
+
+    # Only the NER component is needed (for the candidate's name), so the
+    # rest of the pipeline is never loaded.
+    NLP_EXCLUDE = ("tagger", "parser", "attribute_ruler", "lemmatizer", "senter")
+    NER_BATCH_SIZE = 32
+
+    def __init__(self, taxonomy_path: Optional[str] = None, max_pages: Optional[int] = 50,
+                 time_budget: Optional[float] = 30.0, max_chars: Optional[int] = 500_000,
+                 slow_log: Optional[SlowParseLog] = None):
+        # Limits for PDF extraction; None disables a limit.
+        self.max_pages = max_pages
+        self.time_budget = time_budget
+        self.max_chars = max_chars
+        self.slow_log = slow_log
+
+        self._nlp = None
+        self._nlp_loaded = False
+        self._nlp_lock = threading.Lock()
+        
+        try:
+            self.skill_matcher = SkillMatcher.from_file(taxonomy_path or SKILL_TAXONOMY_PATH)
+        except OSError:
+            print(f"⚠️  Skill taxonomy not found at {taxonomy_path or SKILL_TAXONOMY_PATH}, using built-in keywords")
+            self.skill_matcher = SkillMatcher({
+                category: {skill: [] for skill in skills}
+                for category, skills in DEFAULT_SKILL_KEYWORDS.items()
+            }, case_sensitive=DEFAULT_CASE_SENSITIVE_SKILLS)
+        
+       
+        self.email_pattern = self.EMAIL_RE.pattern
+        self.phone_pattern = self.PHONE_RE.pattern
+
+    @property
+    def version(self) -> str:
+        """Parser version combined with the skill taxonomy version."""
+        return f"{PARSER_VERSION}-{self.skill_matcher.version}"
+
+    @property
+    def nlp(self):
+        """The spaCy pipeline, loaded on first access (None if the model is missing)."""
+        if not self._nlp_loaded:
+            self.load()
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
+        self._nlp_loaded = True
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the spaCy model has been loaded (or found to be missing)."""
+        return self._nlp_loaded
+
+    def load(self):
+        """Import spaCy and load the NER model; safe to call from several threads."""
+        with self._nlp_lock:
+            if self._nlp_loaded:
+                return
+            import spacy
+            try:
+                nlp = spacy.load("en_core_web_sm", exclude=list(self.NLP_EXCLUDE))
+                if "tok2vec" in nlp.pipe_names and not nlp.get_pipe("tok2vec").listening_components:
+                    nlp.disable_pipe("tok2vec")
+            except OSError:
+                print("⚠️  Please install spaCy English model: python -m spacy download en_core_web_sm")
+                nlp = None
+            self._nlp = nlp
+            self._nlp_loaded = True
+
+    def iter_pdf_pages(self, source: Source, max_pages: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """Yield ``(page_number, page_count, text)`` one page at a time.
+
+        ``source`` is a path or a seekable binary file object. Each page's
+        parsed layout is released once its text has been read, so memory
+        stays flat however long the document is.
+        """
+        import pdfplumber
+
+        with pdfplumber.open(source) as pdf:
+            page_count = len(pdf.pages)
+            for number, page in enumerate(pdf.pages, start=1):
+                if max_pages and number > max_pages:
+                    return
+                try:
+                    text = page.extract_text() or ""
+                finally:
+                    page.close()
+                yield number, page_count, text
+
+    @timed('extract_pdf')
+    def extract_pdf(self, source: Source, max_pages: Optional[int] = None, time_budget: Optional[float] = None,
+                    max_chars: Optional[int] = None, stop_when_contact_found: bool = False) -> ExtractionResult:
+        """Extract text from a PDF within page, time and size limits.
+
+        Limits default to the parser's ``max_pages``, ``time_budget`` and
+        ``max_chars``; pass 0 to disable one. Hitting a limit stops
+        extraction and is reported in the result's ``status`` along with
+        whatever text was read so far.
+        """
+        max_pages = max_pages if max_pages is not None else self.max_pages
+        time_budget = time_budget if time_budget is not None else self.time_budget
+        max_chars = max_chars if max_chars is not None else self.max_chars
+
+        started = time.monotonic()
+        result = ExtractionResult()
+        parts = []
+        chars = 0
+        has_email = has_phone = False
+        try:
+            for number, page_count, page_text in self.iter_pdf_pages(source, max_pages=max_pages):
+                result.page_count = page_count
+                result.pages_read = number
+                if page_text:
+                    parts.append(page_text)
+                    chars += len(page_text) + 1
+                if max_chars and chars > max_chars:
+                    result.status = 'memory_limit'
+                    break
+                if time_budget and time.monotonic() - started > time_budget and number < page_count:
+                    result.status = 'timed_out'
+                    break
+                if stop_when_contact_found:
+                    # Only the new page is searched; the details may be split across pages.
+                    has_email = has_email or bool(self.EMAIL_RE.search(page_text))
+                    has_phone = has_phone or bool(self.PHONE_RE.search(page_text))
+                    if has_email and has_phone:
+                        if number < page_count:
+                            result.status = 'stopped_early'
+                        break
+            if (result.status == 'ok' and max_pages and result.page_count is not None
+                    and result.page_count > result.pages_read >= max_pages):
+                result.status = 'truncated'
+        except Exception as e:
+            result.status = 'error'
+            result.error = f"{type(e).__name__}: {e}"
+            METRICS.inc('errors_total', stage='extract_pdf', type=type(e).__name__)
+
+        result.text = '\n'.join(parts) + '\n' if parts else ""
+        if max_chars and len(result.text) > max_chars:
+            result.text = result.text[:max_chars]
+        if result.status == 'ok' and not result.text.strip():
+            result.status = 'empty'
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def extract_text_from_pdf(self, file_path: str) -> str:
+        """Extract text from PDF file using PDFPlumber."""
+        return self.extract_pdf(file_path).text
+
+    # WordprocessingML namespace and the tags the DOCX reader acts on.
+    _W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+    _DOCX_TEXT = {_W + 't'}
+    _DOCX_BREAKS = {_W + 'br': '\n', _W + 'cr': '\n', _W + 'tab': '\t', _W + 'noBreakHyphen': '-'}
+    # Text boxes come twice: as DrawingML in mc:Choice and as VML in mc:Fallback.
+    _DOCX_SKIP = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+    _DOCX_PART_RE = re.compile(r'word/(header|footer)(\d*)\.xml$')
+
+    def docx_parts(self, archive: zipfile.ZipFile) -> List[str]:
+        """Parts holding a document's text in reading order: headers, the body, then footers."""
+        names = archive.namelist()
+        extras = {'header': [], 'footer': []}
+        for name in names:
+            match = self._DOCX_PART_RE.match(name)
+            if match:
+                extras[match.group(1)].append((int(match.group(2) or 0), name))
+        return ([name for _, name in sorted(extras['header'])]
+                + ['word/document.xml']
+                + [name for _, name in sorted(extras['footer'])])
+
+    def iter_docx_paragraphs(self, source: Source) -> Iterator[str]:
+        """Yield a Word document's paragraphs one at a time without building the object model.
+
+        Each XML part is streamed with ``iterparse`` and elements are
+        discarded as soon as they are read, so memory stays flat on long
+        documents. Paragraphs inside tables (cell by cell, row by row), text
+        boxes and content controls are included, as are headers and footers.
+        A header or footer repeated across sections is only yielded once.
+        """
+        with zipfile.ZipFile(source) as archive:
+            seen_extras = set()
+            for name in self.docx_parts(archive):
+                extra = name != 'word/document.xml'
+                paragraphs = []
+                for paragraph in self._iter_docx_part(archive, name):
+                    if extra:
+                        paragraphs.append(paragraph)
+                    else:
+                        yield paragraph
+                if extra:
+                    key = '\n'.join(paragraphs)
+                    if key.strip() and key not in seen_extras:
+                        seen_extras.add(key)
+                        yield from paragraphs
+
+    def _iter_docx_part(self, archive: zipfile.ZipFile, name: str) -> Iterator[str]:
+        # One list of text pieces per open paragraph; text boxes nest paragraphs inside paragraphs.
+        open_paragraphs = []
+        elements = []
+        skipping = 0
+        with archive.open(name) as part:
+            for event, element in ElementTree.iterparse(part, events=('start', 'end')):
+                tag = element.tag
+                if event == 'start':
+                    elements.append(element)
+                    if tag == self._DOCX_SKIP:
+                        skipping += 1
+                    elif tag == self._W + 'p' and not skipping:
+                        open_paragraphs.append([])
+                    continue
+
+                elements.pop()
+                if tag == self._DOCX_SKIP:
+                    skipping -= 1
+                elif skipping:
+                    pass
+                elif tag in self._DOCX_TEXT:
+                    if open_paragraphs and element.text:
+                        open_paragraphs[-1].append(element.text)
+                elif tag in self._DOCX_BREAKS:
+                    if open_paragraphs:
+                        open_paragraphs[-1].append(self._DOCX_BREAKS[tag])
+                elif tag == self._W + 'p':
+                    yield ''.join(open_paragraphs.pop())
+                # Drop what has been read so the tree never grows.
+                element.clear()
+                if elements:
+                    elements[-1].remove(element)
+
+    @timed('extract_docx')
+    def extract_docx(self, source: Source, max_chars: Optional[int] = None) -> ExtractionResult:
+        """Extract text from a Word document (path or binary file object) with a structured status.
+
+        Reads the document's XML directly (see :meth:`iter_docx_paragraphs`),
+        stopping with status ``memory_limit`` once ``max_chars`` (default:
+        the parser's) have been read.
+        """
+        max_chars = max_chars if max_chars is not None else self.max_chars
+
+        started = time.monotonic()
+        result = ExtractionResult()
+        parts = []
+        chars = 0
+        try:
+            for paragraph in self.iter_docx_paragraphs(source):
+                parts.append(paragraph)
+                chars += len(paragraph) + 1
+                if max_chars and chars > max_chars:
+                    result.status = 'memory_limit'
+                    break
+        except Exception as e:
+            result.status = 'error'
+            result.error = f"{type(e).__name__}: {e}"
+            METRICS.inc('errors_total', stage='extract_docx', type=type(e).__name__)
+
+        result.text = '\n'.join(parts) + '\n' if parts else ""
+        if max_chars and len(result.text) > max_chars:
+            result.text = result.text[:max_chars]
+        if result.status == 'ok' and not result.text.strip():
+            result.status = 'empty'
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def extract_text_from_docx(self, file_path: str) -> str:
+        """Extract text from Word document."""
+        return self.extract_docx(file_path).text
+
+    @timed('ner')
+    def extract_names(self, texts: List[str], batch_size: Optional[int] = None,
+                      n_process: int = 1) -> List[Optional[str]]:
+        """Find the first PERSON entity near the top of each text using ``nlp.pipe``."""
+        if not self.nlp:
+            return [None] * len(texts)
+        docs = self.nlp.pipe(
+            (text[:1000] for text in texts),
+            batch_size=batch_size or self.NER_BATCH_SIZE,
+            n_process=n_process
+        )
+        return [
+            next((ent.text for ent in doc.ents if ent.label_ == "PERSON"), None)
+            for doc in docs
+        ]
+
+    @timed('extract_contact_info')
+    def extract_contact_info(self, text: str, name: Optional[str] = None, use_ner: bool = True) -> ContactInfo:
+        """Extract contact information from text.
+
+        Pass ``use_ner=False`` with a ``name`` found by :meth:`extract_names`
+        to skip the per-document spaCy call.
+        """
+        contact = ContactInfo(name=name)
+        
+        email_match = self.EMAIL_RE.search(text)
+        if email_match:
+            contact.email = email_match.group()
+        
+        
+        phone_match = self.PHONE_RE.search(text)
+        if phone_match:
+            contact.phone = phone_match.group()
+        
+       
+        linkedin_match = self.LINKEDIN_RE.search(text)
+        if linkedin_match:
+            contact.linkedin = linkedin_match.group()
+        
+        if use_ner and not contact.name:
+            contact.name = self.extract_names([text])[0]
+      
+        if not contact.name:
+            lines = text.strip().split('\n')
+            if lines:
+                first_line = lines[0].strip()
+                if len(first_line.split()) <= 4 and len(first_line) < 50:
+                    contact.name = first_line
+        
+        return contact
+
+    @timed('extract_skills')
+    def extract_skills(self, text: str) -> List[str]:
+        """Extract canonical skill names from text using the skill taxonomy."""
+        return [match.name for match in self.skill_matcher.find(text)]
+
+    def extract_skill_matches(self, text: str) -> List[SkillMatch]:
+        """Extract skills with their category and number of mentions."""
+        return self.skill_matcher.find(text)
+
+    @timed('extract_education')
+    def extract_education(self, text: str) -> List[Education]:
+        """Extract education information."""
+        education_list = []
+        
+        for pattern in self.EDUCATION_RES:
+            for match in pattern.finditer(text):
+                education = Education(
+                    degree=match.group(1),
+                    institution=match.group(2).strip()
+                )
+                education_list.append(education)
+        
+        return education_list
+
+    @timed('extract_experience')
+    def extract_experience(self, text: str) -> List[Experience]:
+        """Extract work experience."""
+        experience_list = []
+        
+        lines = text.split('\n')
+        current_exp = None
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+                
+            if self.JOB_TITLE_RE.search(line):
+                if current_exp:
+                    experience_list.append(current_exp)
+                current_exp = Experience(title=line)
+        
+        if current_exp:
+            experience_list.append(current_exp)
+        
+        return experience_list
+
+    def extract(self, source: Source, time_budget: Optional[float] = None,
+                filename: Optional[str] = None) -> ExtractionResult:
+        """Extract raw text from a PDF or Word file, reporting how it went.
+
+        ``source`` is a path or a seekable binary file object; for a file
+        object pass ``filename`` so the format can be told from its extension.
+        """
+        filename = (filename or (source if isinstance(source, str) else '')).lower()
+        size_bytes = source_size(source)
+        if filename.endswith('.pdf'):
+            doc_format = 'pdf'
+            result = self.extract_pdf(source, time_budget=time_budget)
+        elif filename.endswith(('.docx', '.doc')):
+            doc_format = 'docx'
+            if source_magic(source).startswith(OLE_MAGIC):
+                # Not a ZIP package: reject it here instead of failing inside the DOCX reader.
+                doc_format = 'doc'
+                result = ExtractionResult(
+                    status='error',
+                    error="Word 97-2003 (.doc) and password-protected files are not supported; "
+                          "save the resume as .docx or PDF",
+                )
+                METRICS.inc('errors_total', stage='extract', type='UnsupportedFormat')
+            else:
+                result = self.extract_docx(source)
+        else:
+            raise ValueError("Unsupported file format. Use PDF or DOCX.")
+
+        result.size_bytes = size_bytes
+        METRICS.inc('documents_total', format=doc_format, status=result.status)
+        METRICS.inc('bytes_total', result.size_bytes, format=doc_format)
+        if result.pages_read:
+            METRICS.inc('pages_total', result.pages_read, format=doc_format)
+        return result
+
+    def extract_text(self, file_path: str) -> str:
+        """Extract raw text from a PDF or Word file."""
+        return self.extract(file_path).text
+
+    def extract_contact_from_file(self, file_path: str) -> Tuple[ContactInfo, ExtractionResult]:
+        """Read only as many pages as needed to find the contact details."""
+        if file_path.lower().endswith('.pdf'):
+            extraction = self.extract_pdf(file_path, stop_when_contact_found=True)
+        else:
+            extraction = self.extract(file_path)
+        return self.extract_contact_info(extraction.text), extraction
+
+    @timed('segment_sections')
+    def segment_sections(self, text: str) -> Dict[str, str]:
+        """Split resume text into headed sections in a single pass.
+
+        Returns a mapping of section name (``contact``, ``summary``,
+        ``education``, ``experience``, ``skills``, ``other``) to its text.
+        Text before the first heading is treated as ``contact``. Returns an
+        empty dict when no headings are found.
+        """
+        headings = list(self.SECTION_HEADING_RE.finditer(text))
+        if not headings:
+            return {}
+
+        parts = {'contact': [text[:headings[0].start()]]}
+        for heading, following in zip(headings, headings[1:] + [None]):
+            end = following.start() if following else len(text)
+            parts.setdefault(heading.lastgroup, []).append(text[heading.end():end])
+        return {section: '\n'.join(chunks) for section, chunks in parts.items()}
+
+    @timed('parse_text')
+    def parse_text(self, raw_text: str, name: Optional[str] = None, use_ner: bool = True,
+                   extraction: Optional[ExtractionResult] = None) -> ParsedResume:
+        """Run the text-level extractors over already extracted text.
+
+        Each extractor only scans its own section(s) from
+        :meth:`segment_sections`, or the whole text when a section is missing.
+        """
+        sections = self.segment_sections(raw_text)
+
+        def section(*names: str) -> str:
+            found = [sections[name] for name in names if sections.get(name, '').strip()]
+            return '\n'.join(found) if found else raw_text
+
+        contact_info = self.extract_contact_info(section('contact'), name=name, use_ner=use_ner)
+        if sections and not (contact_info.email and contact_info.phone and contact_info.linkedin):
+            fallback = self.extract_contact_info(raw_text, use_ner=False)
+            contact_info.email = contact_info.email or fallback.email
+            contact_info.phone = contact_info.phone or fallback.phone
+            contact_info.linkedin = contact_info.linkedin or fallback.linkedin
+
+        skills = self.extract_skills(section('skills', 'summary', 'experience', 'other'))
+        education = self.extract_education(section('education'))
+        experience = self.extract_experience(section('experience'))
+        summary = sections.get('summary', '').strip() or None
+        
+        return ParsedResume(
+            contact_info=contact_info,
+            skills=skills,
+            education=education,
+            experience=experience,
+            summary=summary,
+            raw_text=raw_text,
+            extraction=extraction,
+            extractor_version=self.version,
+        )
+
+    def parse_texts(self, texts: List[str], batch_size: Optional[int] = None, n_process: int = 1,
+                    extractions: Optional[List[ExtractionResult]] = None) -> List[ParsedResume]:
+        """Parse many extracted texts, running NER for all of them in one ``nlp.pipe`` pass."""
+        names = self.extract_names(texts, batch_size=batch_size, n_process=n_process)
+        extractions = extractions or [None] * len(texts)
+        return [
+            self.parse_text(text, name=name, use_ner=False, extraction=extraction)
+            for text, name, extraction in zip(texts, names, extractions)
+        ]
+
+    @timed('parse_resume')
+    def parse_resume(self, file_path: str) -> ParsedResume:
+        """Main method to parse a resume file."""
+        return self._parse_document(file_path, os.path.basename(file_path))
+
+    @timed('parse_resume')
+    def parse_resume_bytes(self, data: Union[bytes, BinaryIO], filename: str) -> ParsedResume:
+        """Parse an upload held in memory or in an open file object, without saving it first.
+
+        ``filename`` is only used to pick the format from its extension.
+        """
+        stream = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+        return self._parse_document(stream, filename)
+
+    def _parse_document(self, source: Source, filename: str) -> ParsedResume:
+        started = time.perf_counter()
+        extraction = None
+        with METRICS.trace() as stages:
+            try:
+                extraction = self.extract(source, filename=filename)
+                if extraction.status == 'error':
+                    raise ExtractionError(extraction)
+                return self.parse_text(extraction.text, extraction=extraction)
+            finally:
+                if self.slow_log is not None:
+                    self.slow_log.record(time.perf_counter() - started, filename, stages, extraction)
+
+    def parse_resumes(self, file_paths: List[str], batch_size: Optional[int] = None,
+                      n_process: int = 1) -> List[Tuple[str, Optional[ParsedResume], Optional[str]]]:
+        """Parse many files with batched NER.
+
+        Returns ``(path, parsed_resume, error)`` for every file; a file that
+        cannot be read gets an error message instead of failing the batch.
+        """
+        extractions, errors = {}, {}
+        for path in file_paths:
+            try:
+                extraction = self.extract(path)
+            except Exception as e:
+                errors[path] = f"{type(e).__name__}: {e}"
+                continue
+            if extraction.status == 'error':
+                errors[path] = extraction.error
+            else:
+                extractions[path] = extraction
+
+        parsed = dict(zip(extractions, self.parse_texts(
+            [extraction.text for extraction in extractions.values()], batch_size, n_process,
+            extractions=list(extractions.values())
+        )))
+        return [(path, parsed.get(path), errors.get(path)) for path in file_paths]
+
+class MinHasher:
+    """MinHash signatures and LSH band keys for near-duplicate detection.
+
+    Text is split into overlapping word shingles. Each shingle is hashed
+    with CRC32, and ``num_perm`` universal hash functions keep their minimum
+    over the document. The fraction of equal signature slots estimates the
+    Jaccard similarity of two documents' shingle sets. Signatures are split
+    into ``bands`` bands; documents sharing any band key are candidates. The
+    defaults (16 bands of 8 rows) make pairs above ~0.7 similarity very
+    likely to collide.
+
+    NumPy is used when installed and gives the same signatures as the pure
+    Python fallback.
+    """
+
+    PRIME = (1 << 31) - 1
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, shingle_size: int = 4,
+                 max_shingles: int = 5000, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        # Only the first shingles are used, which bounds the cost on huge documents.
+        self.max_shingles = max_shingles
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, self.PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, self.PRIME) for _ in range(num_perm)]
+
+    def shingles(self, text: str) -> List[int]:
+        """CRC32 hashes of the distinct word shingles in ``text``, in order of appearance."""
+        words = SkillMatcher.tokenize(text or '')
+        size = min(self.shingle_size, len(words))
+        hashes = {}
+        for i in range(len(words) - size + 1 if size else 0):
+            hashes.setdefault(zlib.crc32(' '.join(words[i:i + size]).encode('utf-8')), None)
+            if len(hashes) >= self.max_shingles:
+                break
+        return list(hashes)
+
+    def signature(self, text: str) -> Optional[List[int]]:
+        """The MinHash signature of ``text``, or None when it has no words."""
+        hashes = self.shingles(text)
+        if not hashes:
+            return None
+        try:
+            import numpy as np
+        except ImportError:
+            return [min((a * h + b) % self.PRIME for h in hashes) for a, b in zip(self._a, self._b)]
+        values = np.asarray(hashes, dtype=np.uint64)
+        a = np.asarray(self._a, dtype=np.uint64)[:, None]
+        b = np.asarray(self._b, dtype=np.uint64)[:, None]
+        return [int(value) for value in ((a * values[None, :] + b) % self.PRIME).min(axis=1)]
+
+    def band_keys(self, signature: List[int]) -> List[Tuple[int, int]]:
+        """``(band, bucket)`` pairs under which a signature is indexed."""
+        keys = []
+        for band in range(self.bands):
+            chunk = struct.pack(f'<{self.rows}I', *signature[band * self.rows:(band + 1) * self.rows])
+            bucket = int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), 'little', signed=True)
+            keys.append((band, bucket))
+        return keys
+
+    def pack(self, signature: List[int]) -> bytes:
+        return struct.pack(f'<{self.num_perm}I', *signature)
+
+    def unpack(self, blob: bytes) -> List[int]:
+        return list(struct.unpack(f'<{self.num_perm}I', blob))
+
+    @staticmethod
+    def similarity(first: List[int], second: List[int]) -> float:
+        """Estimated Jaccard similarity of the documents behind two signatures."""
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+class TextCodec:
+    """Compression for the resume_text table.
+
+    ``zlib`` is always available. ``zstd`` needs the optional ``zstandard``
+    package. Either codec can use a dictionary trained on stored resumes
+    (see :meth:`train`), which helps most on short documents that share
+    headings and boilerplate. Dictionaries are kept in the
+    ``text_dictionaries`` table and referenced by id from each row, so
+    older rows stay readable after a new dictionary is trained.
+    """
+
+    CODECS = ('zlib', 'zstd')
+
+    def __init__(self, codec: str = 'zlib', level: Optional[int] = None):
+        if codec not in self.CODECS:
+            raise ValueError(f"Unknown text codec {codec!r}; expected one of {', '.join(self.CODECS)}")
+        if codec == 'zstd':
+            import zstandard  # noqa: F401 -- fail at startup rather than on the first write
+        self.codec = codec
+        self.level = level if level is not None else (6 if codec == 'zlib' else 9)
+        self.dictionary_id = None
+        self._dictionaries = {}
+        self._lock = threading.Lock()
+        # Called with a dictionary id missing from this process, e.g. one trained by the CLI.
+        self.loader = None
+
+    def add_dictionary(self, dictionary_id: int, data: bytes, use: bool = False):
+        """Register a stored dictionary, and compress new text with it when ``use`` is set."""
+        with self._lock:
+            self._dictionaries[dictionary_id] = data
+            if use:
+                self.dictionary_id = dictionary_id
+
+    def _dictionary(self, dictionary_id: int) -> bytes:
+        data = self._dictionaries.get(dictionary_id)
+        if data is None and self.loader is not None:
+            data = self.loader(dictionary_id)
+            if data is not None:
+                self.add_dictionary(dictionary_id, data)
+        if data is None:
+            raise ValueError(f"Unknown text dictionary {dictionary_id}")
+        return data
+
+    def compress(self, text: Optional[str]) -> Tuple[str, Optional[int], bytes]:
+        """Compress ``text`` into a ``(codec, dictionary_id, data)`` row."""
+        raw = (text or '').encode('utf-8')
+        dictionary_id = self.dictionary_id
+        if self.codec == 'zstd':
+            import zstandard
+            kwargs = {}
+            if dictionary_id is not None:
+                kwargs['dict_data'] = zstandard.ZstdCompressionDict(self._dictionary(dictionary_id))
+            return 'zstd', dictionary_id, zstandard.ZstdCompressor(level=self.level, **kwargs).compress(raw)
+        if dictionary_id is None:
+            return 'zlib', None, zlib.compress(raw, self.level)
+        compressor = zlib.compressobj(self.level, zdict=self._dictionary(dictionary_id))
+        return 'zlib', dictionary_id, compressor.compress(raw) + compressor.flush()
+
+    def decompress(self, codec: str, dictionary_id: Optional[int], data: Optional[bytes]) -> Optional[str]:
+        """Inverse of :meth:`compress`; also registered in SQLite as ``decompress_text``."""
+        if data is None:
+            return None
+        if codec == 'zstd':
+            import zstandard
+            kwargs = {}
+            if dictionary_id is not None:
+                kwargs['dict_data'] = zstandard.ZstdCompressionDict(self._dictionary(dictionary_id))
+            raw = zstandard.ZstdDecompressor(**kwargs).decompress(data)
+        elif dictionary_id is not None:
+            decompressor = zlib.decompressobj(zdict=self._dictionary(dictionary_id))
+            raw = decompressor.decompress(data) + decompressor.flush()
+        else:
+            raw = zlib.decompress(data)
+        return raw.decode('utf-8')
+
+    def train(self, texts: List[str], size: int = 32 * 1024) -> bytes:
+        """Build a dictionary of at most ``size`` bytes from sample texts.
+
+        zstd uses its own trainer. For zlib (whose window is 32 KiB) the
+        dictionary is the most widespread lines and word trigrams of the
+        sample, most common last, since zlib favours nearby matches.
+        """
+        if self.codec == 'zstd':
+            import zstandard
+            return zstandard.train_dictionary(size, [text.encode('utf-8') for text in texts if text]).as_bytes()
+
+        size = min(size, 32 * 1024)
+        counts = {}
+        for text in texts:
+            pieces = set()
+            for line in (text or '').splitlines():
+                line = line.strip()
+                if line:
+                    pieces.add(line)
+                    words = line.split()
+                    pieces.update(' '.join(words[i:i + 3]) for i in range(len(words) - 2))
+            for piece in pieces:
+                counts[piece] = counts.get(piece, 0) + 1
+        # Score by the bytes a piece could save across the sample; skip one-offs.
+        ranked = sorted((piece for piece, count in counts.items() if count > 1),
+                        key=lambda piece: counts[piece] * len(piece), reverse=True)
+        chosen, used = [], 0
+        for piece in ranked:
+            encoded = piece.encode('utf-8') + b'\n'
+            if used + len(encoded) > size:
+                continue
+            chosen.append(encoded)
+            used += len(encoded)
+        return b''.join(reversed(chosen))
+
+
+class SQLiteDatabaseManager:
+    # Applied to every pooled connection. WAL lets readers run alongside the
+    # single writer; NORMAL sync is durable in WAL mode except on power loss.
+    PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA cache_size = -65536",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA temp_store = MEMORY",
+    )
+
+    def __init__(self, db_path: str = "resumes.db", busy_timeout: float = 30.0,
+                 cached_statements: int = 256, minhasher: Optional[MinHasher] = None,
+                 duplicate_threshold: float = 0.8, text_codec: Optional[TextCodec] = None):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self.minhasher = minhasher or MinHasher()
+        self.duplicate_threshold = duplicate_threshold
+        self.text_codec = text_codec or TextCodec()
+        self.text_codec.loader = self._load_dictionary
+        self._local = threading.local()
+        self._has_fts = None
+        self.init_database()
+        self._load_dictionaries()
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """Get this thread's pooled SQLite connection, opening it on first use.
+
+        Connections are reused for the lifetime of the thread (and reopened
+        after a fork), keep a cache of prepared statements and can still be
+        used as ``with`` blocks to commit or roll back a transaction.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout,
+                               cached_statements=self.cached_statements)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        # Raw text is stored compressed; resume_documents (FTS snippets and rebuilds) reads it through this.
+        conn.create_function('decompress_text', 3, self.text_codec.decompress, deterministic=True)
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def close_connection(self):
+        """Close this thread's pooled connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+    
+    def init_database(self):
+        """Initialize SQLite database tables.
+
+        A new database gets the current schema directly; an existing one is
+        brought up to date by :attr:`MIGRATIONS`.
+        """
+        with self.get_connection() as conn:
+            fresh = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'resumes'"
+            ).fetchone() is None
+            conn.executescript("""
+            CREATE TABLE IF NOT EXISTS resumes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                email TEXT,
+                phone TEXT,
+                address TEXT,
+                linkedin TEXT,
+                skills TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                extractor_version TEXT
+            );
+            
+            CREATE TABLE IF NOT EXISTS education (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                resume_id INTEGER,
+                degree TEXT,
+                institution TEXT,
+                year TEXT,
+                gpa TEXT,
+                FOREIGN KEY (resume_id) REFERENCES resumes (id)
+            );
+            
+            CREATE TABLE IF NOT EXISTS experience (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                resume_id INTEGER,
+                title TEXT,
+                company TEXT,
+                duration TEXT,
+                description TEXT,
+                FOREIGN KEY (resume_id) REFERENCES resumes (id)
+            );
+            
+            CREATE TABLE IF NOT EXISTS ingest_log (
+                path TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                resume_id INTEGER,
+                error TEXT,
+                ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (resume_id) REFERENCES resumes (id)
+            );
+
+            CREATE TABLE IF NOT EXISTS upload_jobs (
+                id TEXT PRIMARY KEY,
+                filename TEXT,
+                file_path TEXT,
+                status TEXT NOT NULL,
+                resume_id INTEGER,
+                error TEXT,
+                result TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP,
+                FOREIGN KEY (resume_id) REFERENCES resumes (id)
+            );
+
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                content_hash TEXT NOT NULL,
+                parser_version TEXT NOT NULL,
+                parsed TEXT NOT NULL,
+                resume_id INTEGER,
+                size_bytes INTEGER NOT NULL,
+                hits INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                text_codec TEXT,
+                text_dictionary_id INTEGER,
+                text_data BLOB,
+                PRIMARY KEY (content_hash, parser_version)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_upload_jobs_status ON upload_jobs(status);
+            CREATE INDEX IF NOT EXISTS idx_parse_cache_last_used ON parse_cache(last_used_at);
+            CREATE INDEX IF NOT EXISTS idx_resumes_email ON resumes(email);
+            CREATE INDEX IF NOT EXISTS idx_education_resume ON education(resume_id);
+            CREATE INDEX IF NOT EXISTS idx_experience_resume ON experience(resume_id);
+
+            CREATE TABLE IF NOT EXISTS resume_skills (
+                skill TEXT NOT NULL,
+                resume_id INTEGER NOT NULL,
+                PRIMARY KEY (skill, resume_id),
+                FOREIGN KEY (resume_id) REFERENCES resumes (id)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_resume_skills_resume ON resume_skills(resume_id);
+            """)
+            self._migrate(conn, fresh=fresh)
+            self._has_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'resumes_fts'"
+            ).fetchone() is not None
+
+    # Data migrations, applied in order and tracked with PRAGMA user_version.
+    MIGRATIONS = (
+        '_migrate_skill_index',
+        '_migrate_fulltext_index',
+        '_migrate_stats_tables',
+        '_migrate_duplicate_index',
+        '_migrate_text_table',
+        '_migrate_extractor_version',
+        '_migrate_parse_cache_text',
+    )
+
+    def _migrate(self, conn: sqlite3.Connection, fresh: bool = False):
+        """Apply pending migrations, each in its own transaction together with its user_version bump."""
+        if fresh:
+            steps = [(len(self.MIGRATIONS), '_create_schema')]
+        else:
+            steps = list(enumerate(self.MIGRATIONS, start=1))
+        for target, name in steps:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= target:
+                continue
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-checked under the write lock in case another process got here first.
+                if conn.execute("PRAGMA user_version").fetchone()[0] < target:
+                    getattr(self, name)(conn)
+                    conn.execute(f"PRAGMA user_version = {target}")
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create the tables the migrations add on top of the base schema, for a new database."""
+        self._migrate_stats_tables(conn)
+        self._migrate_duplicate_index(conn)
+        self._create_text_tables(conn)
+        self._create_fulltext_index(conn)
+
+    @staticmethod
+    def _execute_script(conn: sqlite3.Connection, script: str):
+        """Run a multi-statement script inside the open transaction.
+
+        ``executescript`` would commit first, splitting a migration over
+        several transactions.
+        """
+        statement = ''
+        for line in script.splitlines(keepends=True):
+            statement += line
+            if sqlite3.complete_statement(statement):
+                conn.execute(statement)
+                statement = ''
+        if statement.strip():
+            conn.execute(statement)
+
+    def _migrate_skill_index(self, conn: sqlite3.Connection):
+        """Backfill resume_skills from the JSON skills column."""
+        conn.execute("DROP INDEX IF EXISTS idx_resumes_skills")
+        rows = conn.execute("SELECT id, skills FROM resumes WHERE skills IS NOT NULL").fetchall()
+        for resume_id, skills_json in rows:
+            try:
+                skills = json.loads(skills_json)
+            except ValueError:
+                continue
+            conn.executemany(
+                "INSERT OR IGNORE INTO resume_skills (skill, resume_id) VALUES (?, ?)",
+                [(normalize_skill(skill), resume_id) for skill in skills if normalize_skill(skill)]
+            )
+
+    def _migrate_fulltext_index(self, conn: sqlite3.Connection):
+        """Create the FTS5 index over name and raw_text and backfill it."""
+        try:
+            self._execute_script(conn, """
+            CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(
+                name, raw_text, content='resumes', content_rowid='id'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS resumes_fts_insert AFTER INSERT ON resumes BEGIN
+                INSERT INTO resumes_fts (rowid, name, raw_text) VALUES (new.id, new.name, new.raw_text);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS resumes_fts_delete AFTER DELETE ON resumes BEGIN
+                INSERT INTO resumes_fts (resumes_fts, rowid, name, raw_text)
+                VALUES ('delete', old.id, old.name, old.raw_text);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS resumes_fts_update AFTER UPDATE OF name, raw_text ON resumes BEGIN
+                INSERT INTO resumes_fts (resumes_fts, rowid, name, raw_text)
+                VALUES ('delete', old.id, old.name, old.raw_text);
+                INSERT INTO resumes_fts (rowid, name, raw_text) VALUES (new.id, new.name, new.raw_text);
+            END;
+
+            INSERT INTO resumes_fts (resumes_fts) VALUES ('rebuild');
+            """)
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  Full-text search unavailable ({e}), falling back to LIKE queries")
+
+    # Normalised key for the degree distribution: "B.S." and "bs" count together.
+    DEGREE_KEY_SQL = "lower(replace(replace(trim(COALESCE({0}, 'unknown')), '.', ''), ' ', ''))"
+
+    def _migrate_stats_tables(self, conn: sqlite3.Connection):
+        """Create the aggregate tables behind /api/stats, the triggers that maintain them, and fill them."""
+        new_degree = self.DEGREE_KEY_SQL.format('new.degree')
+        old_degree = self.DEGREE_KEY_SQL.format('old.degree')
+        self._execute_script(conn, f"""
+        CREATE TABLE IF NOT EXISTS stats_totals (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS stats_skills (
+            skill TEXT PRIMARY KEY,
+            resumes INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_stats_skills_resumes ON stats_skills(resumes);
+
+        CREATE TABLE IF NOT EXISTS stats_degrees (
+            degree TEXT PRIMARY KEY,
+            records INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS stats_daily (
+            day TEXT PRIMARY KEY,
+            resumes INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS stats_resumes_insert AFTER INSERT ON resumes BEGIN
+            INSERT INTO stats_totals (name, value) VALUES ('resumes', 1)
+                ON CONFLICT (name) DO UPDATE SET value = value + 1;
+            INSERT INTO stats_daily (day, resumes) VALUES (date(COALESCE(new.created_at, CURRENT_TIMESTAMP)), 1)
+                ON CONFLICT (day) DO UPDATE SET resumes = resumes + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS stats_resumes_delete AFTER DELETE ON resumes BEGIN
+            UPDATE stats_totals SET value = value - 1 WHERE name = 'resumes';
+            UPDATE stats_daily SET resumes = resumes - 1 WHERE day = date(old.created_at);
+            DELETE FROM stats_daily WHERE day = date(old.created_at) AND resumes <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS stats_skills_insert AFTER INSERT ON resume_skills BEGIN
+            INSERT INTO stats_totals (name, value) VALUES ('skills', 1)
+                ON CONFLICT (name) DO UPDATE SET value = value + 1;
+            INSERT INTO stats_skills (skill, resumes) VALUES (new.skill, 1)
+                ON CONFLICT (skill) DO UPDATE SET resumes = resumes + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS stats_skills_delete AFTER DELETE ON resume_skills BEGIN
+            UPDATE stats_totals SET value = value - 1 WHERE name = 'skills';
+            UPDATE stats_skills SET resumes = resumes - 1 WHERE skill = old.skill;
+            DELETE FROM stats_skills WHERE skill = old.skill AND resumes <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS stats_education_insert AFTER INSERT ON education BEGIN
+            INSERT INTO stats_totals (name, value) VALUES ('education', 1)
+                ON CONFLICT (name) DO UPDATE SET value = value + 1;
+            INSERT INTO stats_degrees (degree, records) VALUES ({new_degree}, 1)
+                ON CONFLICT (degree) DO UPDATE SET records = records + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS stats_education_delete AFTER DELETE ON education BEGIN
+            UPDATE stats_totals SET value = value - 1 WHERE name = 'education';
+            UPDATE stats_degrees SET records = records - 1 WHERE degree = {old_degree};
+            DELETE FROM stats_degrees WHERE degree = {old_degree} AND records <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS stats_experience_insert AFTER INSERT ON experience BEGIN
+            INSERT INTO stats_totals (name, value) VALUES ('experience', 1)
+                ON CONFLICT (name) DO UPDATE SET value = value + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS stats_experience_delete AFTER DELETE ON experience BEGIN
+            UPDATE stats_totals SET value = value - 1 WHERE name = 'experience';
+        END;
+        """)
+        self._fill_stats(conn)
+
+    def _fill_stats(self, conn: sqlite3.Connection):
+        """Recompute every aggregate table from the base tables."""
+        degree = self.DEGREE_KEY_SQL.format('degree')
+        for statement in (
+            "DELETE FROM stats_totals",
+            "DELETE FROM stats_skills",
+            "DELETE FROM stats_degrees",
+            "DELETE FROM stats_daily",
+            """INSERT INTO stats_totals (name, value)
+               SELECT 'resumes', COUNT(*) FROM resumes
+               UNION ALL SELECT 'skills', COUNT(*) FROM resume_skills
+               UNION ALL SELECT 'education', COUNT(*) FROM education
+               UNION ALL SELECT 'experience', COUNT(*) FROM experience""",
+            "INSERT INTO stats_skills (skill, resumes) SELECT skill, COUNT(*) FROM resume_skills GROUP BY skill",
+            f"INSERT INTO stats_degrees (degree, records) SELECT {degree}, COUNT(*) FROM education GROUP BY 1",
+            "INSERT INTO stats_daily (day, resumes) SELECT date(created_at), COUNT(*) FROM resumes GROUP BY 1",
+        ):
+            conn.execute(statement)
+
+    def _migrate_duplicate_index(self, conn: sqlite3.Connection):
+        """Create the MinHash signature and LSH bucket tables.
+
+        Existing rows are not hashed here; run ``flask backfill-minhash``.
+        """
+        self._execute_script(conn, """
+        CREATE TABLE IF NOT EXISTS resume_minhash (
+            resume_id INTEGER PRIMARY KEY,
+            signature BLOB,
+            duplicate_of INTEGER,
+            similarity REAL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_resume_minhash_duplicate
+            ON resume_minhash(duplicate_of) WHERE duplicate_of IS NOT NULL;
+
+        CREATE TABLE IF NOT EXISTS resume_lsh (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            resume_id INTEGER NOT NULL,
+            PRIMARY KEY (band, bucket, resume_id)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS idx_resume_lsh_resume ON resume_lsh(resume_id);
+
+        -- When a cluster root is deleted, its oldest remaining member becomes the new root.
+        CREATE TRIGGER IF NOT EXISTS resume_minhash_delete AFTER DELETE ON resumes BEGIN
+            DELETE FROM resume_lsh WHERE resume_id = old.id;
+            DELETE FROM resume_minhash WHERE resume_id = old.id;
+            UPDATE resume_minhash
+            SET duplicate_of = (SELECT MIN(resume_id) FROM resume_minhash WHERE duplicate_of = old.id)
+            WHERE duplicate_of = old.id
+              AND resume_id > (SELECT MIN(resume_id) FROM resume_minhash WHERE duplicate_of = old.id);
+            UPDATE resume_minhash SET duplicate_of = NULL, similarity = NULL WHERE duplicate_of = old.id;
+        END;
+        """)
+
+    def _migrate_text_table(self, conn: sqlite3.Connection):
+        """Move raw_text out of ``resumes`` into compressed ``resume_text`` rows.
+
+        The full-text index is recreated over the ``resume_documents`` view
+        and refilled from the plain text as it is moved. Dropping the column
+        leaves free pages behind; ``flask compact-db`` returns them to the
+        filesystem. SQLite before 3.35 cannot drop columns, so there the
+        column is only emptied.
+        """
+        for trigger in ('resumes_fts_insert', 'resumes_fts_delete', 'resumes_fts_update'):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        self._create_text_tables(conn)
+        has_fts = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'resumes_fts'").fetchone() is not None
+        if has_fts:
+            conn.execute("DROP TABLE resumes_fts")
+            self._create_fulltext_index(conn)
+
+        last_id, moved = 0, 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, name, raw_text FROM resumes WHERE id > ? ORDER BY id LIMIT 1000", (last_id,)
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                "INSERT OR REPLACE INTO resume_text (resume_id, codec, dictionary_id, size, data) VALUES (?, ?, ?, ?, ?)",
+                [(resume_id, *self._compress_text(raw_text)) for resume_id, _, raw_text in rows]
+            )
+            if has_fts:
+                conn.executemany(
+                    "INSERT INTO resumes_fts (rowid, name, raw_text) VALUES (?, ?, ?)",
+                    [(resume_id, name, raw_text or '') for resume_id, name, raw_text in rows]
+                )
+            last_id = rows[-1][0]
+            moved += len(rows)
+
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            conn.execute("ALTER TABLE resumes DROP COLUMN raw_text")
+        else:
+            conn.execute("UPDATE resumes SET raw_text = NULL")
+        if moved:
+            print(f"🗜️  Compressed raw text of {moved} resumes; run 'flask compact-db' to reclaim the space")
+
+    def _create_text_tables(self, conn: sqlite3.Connection):
+        """Create the compressed text tables and the ``resume_documents`` view that decompresses them."""
+        self._execute_script(conn, """
+        CREATE TABLE IF NOT EXISTS resume_text (
+            resume_id INTEGER PRIMARY KEY,
+            codec TEXT NOT NULL,
+            dictionary_id INTEGER,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS text_dictionaries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            codec TEXT NOT NULL,
+            data BLOB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE VIEW IF NOT EXISTS resume_documents AS
+            SELECT r.id AS id, r.name AS name,
+                   decompress_text(t.codec, t.dictionary_id, t.data) AS raw_text
+            FROM resumes r LEFT JOIN resume_text t ON t.resume_id = r.id;
+
+        CREATE TRIGGER IF NOT EXISTS resume_text_delete AFTER DELETE ON resumes BEGIN
+            DELETE FROM resume_text WHERE resume_id = old.id;
+        END;
+        """)
+
+    def _create_fulltext_index(self, conn: sqlite3.Connection):
+        """Create the FTS5 index over ``resume_documents``.
+
+        There are no triggers behind it: indexing needs the decompressed
+        text, and a trigger calling ``decompress_text`` would break writes
+        from any SQLite client without that function. The index is kept in
+        step by :meth:`_insert_resumes`, :meth:`update_resumes` and
+        :meth:`delete_resumes`; ``flask rebuild-fulltext`` repairs it after
+        rows were changed by other clients.
+        """
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(
+                    name, raw_text, content='resume_documents', content_rowid='id'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  Full-text search unavailable ({e}), falling back to LIKE queries")
+
+    def _migrate_extractor_version(self, conn: sqlite3.Connection):
+        """Record which extractor version produced each row; existing rows are left NULL (unknown)."""
+        conn.execute("ALTER TABLE resumes ADD COLUMN extractor_version TEXT")
+
+    def _migrate_parse_cache_text(self, conn: sqlite3.Connection):
+        """Give cached parses compressed text columns; existing entries hold the text inline and are dropped."""
+        conn.execute("DELETE FROM parse_cache")
+        # A database older than the cache table got it from the base schema, columns included.
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(parse_cache)")}
+        for column in ('text_codec TEXT', 'text_dictionary_id INTEGER', 'text_data BLOB'):
+            if column.split()[0] not in existing:
+                conn.execute(f"ALTER TABLE parse_cache ADD COLUMN {column}")
+
+    def _compress_text(self, text: Optional[str]) -> Tuple[str, Optional[int], int, bytes]:
+        """``(codec, dictionary_id, size, data)`` values for a resume_text row."""
+        codec, dictionary_id, data = self.text_codec.compress(text)
+        return codec, dictionary_id, len((text or '').encode('utf-8')), data
+
+    def _load_dictionaries(self):
+        """Register stored dictionaries with the codec; the newest for its codec compresses new text."""
+        with self.get_connection() as conn:
+            rows = conn.execute("SELECT id, codec, data FROM text_dictionaries ORDER BY id").fetchall()
+        for dictionary_id, codec, data in rows:
+            self.text_codec.add_dictionary(dictionary_id, data, use=codec == self.text_codec.codec)
+
+    def _load_dictionary(self, dictionary_id: int) -> Optional[bytes]:
+        # Runs inside decompress_text, so it must not reuse the connection executing the query.
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+        try:
+            row = conn.execute("SELECT data FROM text_dictionaries WHERE id = ?", (dictionary_id,)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def train_text_dictionary(self, sample: int = 2000, size: int = 32 * 1024) -> Optional[int]:
+        """Train a dictionary on a random sample of stored resumes and use it for new text.
+
+        Existing rows keep the dictionary they were written with. Returns the
+        new dictionary id, or None when there is nothing to sample.
+        """
+        with self.get_connection() as conn:
+            texts = [text for text, in conn.execute("""
+                SELECT decompress_text(codec, dictionary_id, data) FROM resume_text
+                WHERE resume_id IN (SELECT resume_id FROM resume_text ORDER BY random() LIMIT ?)
+            """, (sample,))]
+        if not texts:
+            return None
+        data = self.text_codec.train(texts, size)
+        with self.get_connection() as conn:
+            dictionary_id = conn.execute(
+                "INSERT INTO text_dictionaries (codec, data) VALUES (?, ?)", (self.text_codec.codec, data)
+            ).lastrowid
+        self.text_codec.add_dictionary(dictionary_id, data, use=True)
+        return dictionary_id
+
+    def text_stats(self) -> Dict:
+        """Stored raw text volume before and after compression, and the database file size."""
+        with self.get_connection() as conn:
+            rows, size, stored = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(length(data)), 0) FROM resume_text"
+            ).fetchone()
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            pages = conn.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return {
+            'documents': rows,
+            'text_bytes': size,
+            'compressed_bytes': stored,
+            'ratio': round(size / stored, 2) if stored else None,
+            'database_bytes': page_size * pages,
+            'free_bytes': page_size * free_pages,
+        }
+
+    def compact(self):
+        """VACUUM the database, returning free pages (e.g. after the raw_text migration) to the filesystem."""
+        conn = self.get_connection()
+        conn.commit()
+        conn.execute("VACUUM")
+
+    def rebuild_stats(self):
+        """Recompute the /api/stats aggregate tables in one write transaction.
+
+        The triggers keep them current; this is for repairs, such as after
+        rows were changed with the triggers dropped.
+        """
+        with self.get_connection() as conn:
+            self._begin_write(conn)
+            self._fill_stats(conn)
+
+    def get_stats(self, top_skills: int = 20, days: int = 30) -> Dict:
+        """Dashboard figures read from the aggregate tables, independent of corpus size."""
+        with self.get_connection() as conn:
+            totals = dict(conn.execute("SELECT name, value FROM stats_totals").fetchall())
+            skills = conn.execute(
+                "SELECT skill, resumes FROM stats_skills ORDER BY resumes DESC, skill LIMIT ?", (top_skills,)
+            ).fetchall()
+            degrees = conn.execute(
+                "SELECT degree, records FROM stats_degrees ORDER BY records DESC, degree"
+            ).fetchall()
+            daily = conn.execute(
+                "SELECT day, resumes FROM stats_daily WHERE day >= date('now', ?) ORDER BY day",
+                (f"-{max(days - 1, 0)} days",)
+            ).fetchall()
+        resumes = totals.get('resumes', 0)
+        return {
+            'total_resumes': resumes,
+            'total_education_records': totals.get('education', 0),
+            'total_experience_records': totals.get('experience', 0),
+            'average_skills_per_resume': round(totals.get('skills', 0) / resumes, 2) if resumes else 0.0,
+            'top_skills': [{'skill': skill, 'resumes': count} for skill, count in skills],
+            'degrees': [{'degree': degree, 'records': count} for degree, count in degrees],
+            'resumes_per_day': [{'day': day, 'resumes': count} for day, count in daily],
+        }
+
+    @property
+    def has_fulltext_index(self) -> bool:
+        """Whether the FTS5 index exists in this database."""
+        if self._has_fts is None:
+            with self.get_connection() as conn:
+                self._has_fts = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'resumes_fts'"
+                ).fetchone() is not None
+        return self._has_fts
+
+    def _insert_resumes(self, cursor: sqlite3.Cursor, parsed_resumes: List[ParsedResume],
+                        signatures: Optional[List[Optional[List[int]]]] = None) -> List[int]:
+        """Insert parsed resumes and their child rows with ``executemany``.
+
+        Must run inside a write transaction: ids are allocated up front from
+        the AUTOINCREMENT sequence so child rows can be inserted in bulk.
+        ``signatures`` are the resumes' MinHash signatures, computed here when
+        not given; pass them to keep the hashing outside the write lock.
+        """
+        if not parsed_resumes:
+            return []
+        if signatures is None:
+            signatures = self._signatures(parsed_resumes)
+
+        first_id = cursor.execute("""
+            SELECT MAX(
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'resumes'), 0),
+                COALESCE((SELECT MAX(id) FROM resumes), 0)
+            ) + 1
+        """).fetchone()[0]
+        resume_ids = list(range(first_id, first_id + len(parsed_resumes)))
+
+        cursor.executemany("""
+            INSERT INTO resumes (id, name, email, phone, address, linkedin, skills, extractor_version)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                resume_id,
+                parsed_resume.contact_info.name,
+                parsed_resume.contact_info.email,
+                parsed_resume.contact_info.phone,
+                parsed_resume.contact_info.address,
+                parsed_resume.contact_info.linkedin,
+                json.dumps(parsed_resume.skills),
+                parsed_resume.extractor_version,
+            )
+            for resume_id, parsed_resume in zip(resume_ids, parsed_resumes)
+        ])
+        cursor.executemany(
+            "INSERT INTO resume_text (resume_id, codec, dictionary_id, size, data) VALUES (?, ?, ?, ?, ?)",
+            [(resume_id, *self._compress_text(parsed_resume.raw_text))
+             for resume_id, parsed_resume in zip(resume_ids, parsed_resumes)]
+        )
+        if self.has_fulltext_index:
+            cursor.executemany(
+                "INSERT INTO resumes_fts (rowid, name, raw_text) VALUES (?, ?, ?)",
+                [(resume_id, parsed_resume.contact_info.name, parsed_resume.raw_text or '')
+                 for resume_id, parsed_resume in zip(resume_ids, parsed_resumes)]
+            )
+        self._insert_children(cursor, resume_ids, parsed_resumes)
+        self._index_duplicates(cursor, list(zip(resume_ids, signatures)))
+        return resume_ids
+
+    def _insert_children(self, cursor: sqlite3.Cursor, resume_ids: List[int], parsed_resumes: List[ParsedResume]):
+        """Insert the resume_skills, education and experience rows of stored resumes."""
+        skill_rows, education_rows, experience_rows = [], [], []
+        for resume_id, parsed_resume in zip(resume_ids, parsed_resumes):
+            skill_rows.extend(
+                (normalize_skill(skill), resume_id) for skill in parsed_resume.skills if normalize_skill(skill)
+            )
+            education_rows.extend(
+                (resume_id, edu.degree, edu.institution, edu.year, edu.gpa) for edu in parsed_resume.education
+            )
+            experience_rows.extend(
+                (resume_id, exp.title, exp.company, exp.duration, exp.description) for exp in parsed_resume.experience
+            )
+
+        cursor.executemany(
+            "INSERT OR IGNORE INTO resume_skills (skill, resume_id) VALUES (?, ?)",
+            skill_rows
+        )
+        cursor.executemany("""
+            INSERT INTO education (resume_id, degree, institution, year, gpa)
+            VALUES (?, ?, ?, ?, ?)
+        """, education_rows)
+        cursor.executemany("""
+            INSERT INTO experience (resume_id, title, company, duration, description)
+            VALUES (?, ?, ?, ?, ?)
+        """, experience_rows)
+
+    def outdated_resumes(self, version: str, after_id: int = 0, limit: int = 500) -> List[Tuple[int, str]]:
+        """``(id, raw_text)`` of resumes extracted with a version other than ``version``, in id order."""
+        with self.get_connection() as conn:
+            return conn.execute(f"""
+                SELECT r.id, COALESCE({self.RAW_TEXT_SQL}, '') FROM resumes r
+                WHERE r.id > ? AND r.extractor_version IS NOT ?
+                ORDER BY r.id LIMIT ?
+            """, (after_id, version, limit)).fetchall()
+
+    def extractor_versions(self) -> Dict[Optional[str], int]:
+        """Number of resumes per extractor version (None for rows stored before versions were recorded)."""
+        with self.get_connection() as conn:
+            return dict(conn.execute(
+                "SELECT extractor_version, COUNT(*) FROM resumes GROUP BY extractor_version"
+            ).fetchall())
+
+    @timed('update_resumes')
+    def update_resumes(self, updates: List[Tuple[int, ParsedResume]]) -> int:
+        """Replace the extracted fields and child rows of stored resumes in one transaction.
+
+        Raw text, MinHash signatures and ids are kept. The aggregate tables
+        follow through their triggers; the FTS index is only touched for
+        resumes whose name changed. Returns the number of rows updated.
+        """
+        if not updates:
+            return 0
+        resume_ids = [resume_id for resume_id, _ in updates]
+        parsed_resumes = [parsed_resume for _, parsed_resume in updates]
+        with self.get_connection() as conn:
+            self._begin_write(conn)
+            cursor = conn.cursor()
+            cursor.executemany("""
+                UPDATE resumes SET email = ?, phone = ?, address = ?, linkedin = ?, skills = ?, extractor_version = ?
+                WHERE id = ?
+            """, [
+                (
+                    parsed_resume.contact_info.email,
+                    parsed_resume.contact_info.phone,
+                    parsed_resume.contact_info.address,
+                    parsed_resume.contact_info.linkedin,
+                    json.dumps(parsed_resume.skills),
+                    parsed_resume.extractor_version,
+                    resume_id,
+                )
+                for resume_id, parsed_resume in updates
+            ])
+            placeholders = ', '.join('?' * len(resume_ids))
+            names = dict(cursor.execute(f"SELECT id, name FROM resumes WHERE id IN ({placeholders})", resume_ids))
+            renamed = [resume_id for resume_id, parsed_resume in updates
+                       if resume_id in names and names[resume_id] != parsed_resume.contact_info.name]
+            if renamed and self.has_fulltext_index:
+                self._unindex_fulltext(cursor, renamed)
+            cursor.executemany(
+                "UPDATE resumes SET name = ? WHERE id = ? AND name IS NOT ?",
+                [(parsed_resume.contact_info.name, resume_id, parsed_resume.contact_info.name)
+                 for resume_id, parsed_resume in updates]
+            )
+            if renamed and self.has_fulltext_index:
+                self._index_fulltext(cursor, renamed)
+            for table in ('resume_skills', 'education', 'experience'):
+                cursor.execute(f"DELETE FROM {table} WHERE resume_id IN ({placeholders})", resume_ids)
+            self._insert_children(cursor, resume_ids, parsed_resumes)
+        return len(updates)
+
+    def delete_resumes(self, resume_ids: List[int]) -> int:
+        """Delete stored resumes with their child rows, text and index entries in one transaction.
+
+        Returns the number of resumes deleted.
+        """
+        if not resume_ids:
+            return 0
+        placeholders = ', '.join('?' * len(resume_ids))
+        with self.get_connection() as conn:
+            self._begin_write(conn)
+            cursor = conn.cursor()
+            if self.has_fulltext_index:
+                self._unindex_fulltext(cursor, resume_ids)
+            for table in ('resume_skills', 'education', 'experience'):
+                cursor.execute(f"DELETE FROM {table} WHERE resume_id IN ({placeholders})", resume_ids)
+            # resume_text, the MinHash tables and the aggregates follow through their triggers.
+            return cursor.execute(f"DELETE FROM resumes WHERE id IN ({placeholders})", resume_ids).rowcount
+
+    def _fulltext_rows(self, cursor: sqlite3.Cursor, resume_ids: List[int]) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """``(id, name, raw_text)`` of stored resumes as ``resume_documents`` presents them to the FTS index."""
+        placeholders = ', '.join('?' * len(resume_ids))
+        rows = cursor.execute(f"""
+            SELECT r.id, r.name, t.codec, t.dictionary_id, t.data
+            FROM resumes r LEFT JOIN resume_text t ON t.resume_id = r.id
+            WHERE r.id IN ({placeholders})
+        """, resume_ids).fetchall()
+        return [(resume_id, name, self.text_codec.decompress(codec, dictionary_id, data))
+                for resume_id, name, codec, dictionary_id, data in rows]
+
+    def _index_fulltext(self, cursor: sqlite3.Cursor, resume_ids: List[int]):
+        cursor.executemany(
+            "INSERT INTO resumes_fts (rowid, name, raw_text) VALUES (?, ?, ?)",
+            self._fulltext_rows(cursor, resume_ids)
+        )
+
+    def _unindex_fulltext(self, cursor: sqlite3.Cursor, resume_ids: List[int]):
+        # An external-content FTS5 table must be given the indexed values to delete a row.
+        cursor.executemany(
+            "INSERT INTO resumes_fts (resumes_fts, rowid, name, raw_text) VALUES ('delete', ?, ?, ?)",
+            self._fulltext_rows(cursor, resume_ids)
+        )
+
+    def rebuild_fulltext_index(self):
+        """Rebuild the FTS index from ``resume_documents``, e.g. after rows were changed by another client."""
+        if not self.has_fulltext_index:
+            return
+        with self.get_connection() as conn:
+            self._begin_write(conn)
+            conn.execute("INSERT INTO resumes_fts (resumes_fts) VALUES ('rebuild')")
+
+    @timed('minhash')
+    def _signatures(self, parsed_resumes: List[ParsedResume]) -> List[Optional[List[int]]]:
+        return [self.minhasher.signature(parsed_resume.raw_text) for parsed_resume in parsed_resumes]
+
+    # Candidates verified per resume; buckets of very common boilerplate are cut off here.
+    DUPLICATE_CANDIDATES = 200
+
+    def _index_duplicates(self, cursor: sqlite3.Cursor, entries: List[Tuple[int, Optional[List[int]]]]):
+        """Add ``(resume_id, signature)`` pairs to the LSH index and flag near-duplicates.
+
+        Each resume is compared only with resumes sharing an LSH bucket, and
+        is marked as a duplicate of the cluster root of its most similar
+        candidate at or above ``duplicate_threshold``. Candidates are limited
+        to lower ids (earlier in the batch included), so ``entries`` must be
+        in id order and a cluster's root is always its lowest id.
+        """
+        hasher = self.minhasher
+        cursor.executemany(
+            "INSERT OR REPLACE INTO resume_minhash (resume_id, signature) VALUES (?, ?)",
+            [(resume_id, hasher.pack(signature) if signature else None) for resume_id, signature in entries]
+        )
+        entries = [(resume_id, signature, hasher.band_keys(signature))
+                   for resume_id, signature in entries if signature]
+        cursor.executemany(
+            "INSERT OR IGNORE INTO resume_lsh (band, bucket, resume_id) VALUES (?, ?, ?)",
+            [(band, bucket, resume_id) for resume_id, _, keys in entries for band, bucket in keys]
+        )
+
+        placeholders = ', '.join(['(?, ?)'] * hasher.bands)
+        candidates_sql = f"""
+            SELECT m.resume_id, m.signature, m.duplicate_of
+            FROM resume_minhash m
+            WHERE m.resume_id IN (
+                SELECT DISTINCT l.resume_id
+                FROM (VALUES {placeholders}) k
+                JOIN resume_lsh l ON l.band = k.column1 AND l.bucket = k.column2
+                WHERE l.resume_id < ?
+                LIMIT {self.DUPLICATE_CANDIDATES}
+            )
+        """
+        flagged = 0
+        for resume_id, signature, keys in entries:
+            params = [value for key in keys for value in key] + [resume_id]
+            best = None
+            for candidate_id, blob, root in cursor.execute(candidates_sql, params).fetchall():
+                similarity = hasher.similarity(signature, hasher.unpack(blob))
+                if similarity >= self.duplicate_threshold and (best is None or similarity > best[1]):
+                    best = (root or candidate_id, similarity)
+            if best is not None and best[0] != resume_id:
+                cursor.execute(
+                    "UPDATE resume_minhash SET duplicate_of = ?, similarity = ? WHERE resume_id = ?",
+                    (best[0], round(best[1], 4), resume_id)
+                )
+                flagged += 1
+        if flagged:
+            METRICS.inc('duplicates_total', flagged)
+
+    def _begin_write(self, conn: sqlite3.Connection):
+        """Take the write lock up front so id allocation cannot race another writer."""
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+
+    @timed('store_resume')
+    def store_resume(self, parsed_resume: ParsedResume) -> int:
+        """Store parsed resume in SQLite database."""
+        return self.store_resumes([parsed_resume])[0]
+
+    @timed('store_resumes')
+    def store_resumes(self, parsed_resumes: List[ParsedResume]) -> List[int]:
+        """Store many parsed resumes in a single transaction."""
+        signatures = self._signatures(parsed_resumes)
+        with self.get_connection() as conn:
+            self._begin_write(conn)
+            return self._insert_resumes(conn.cursor(), parsed_resumes, signatures)
+
+    def duplicate_of(self, resume_id: int) -> Optional[Dict]:
+        """The resume a stored resume was flagged as a near-duplicate of, if any."""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT duplicate_of, similarity FROM resume_minhash WHERE resume_id = ? AND duplicate_of IS NOT NULL",
+                (resume_id,)
+            ).fetchone()
+        return {'resume_id': row[0], 'similarity': row[1]} if row else None
+
+    def duplicate_clusters(self, limit: int = 50, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Groups of near-duplicate resumes, newest cluster root first.
+
+        Returns the clusters and a cursor for the next page, or None on the
+        last page.
+        """
+        after = decode_cursor(cursor)[0] if cursor else None
+        with self.get_connection() as conn:
+            if after is None:
+                roots = conn.execute("""
+                    SELECT DISTINCT duplicate_of FROM resume_minhash WHERE duplicate_of IS NOT NULL
+                    ORDER BY duplicate_of DESC LIMIT ?
+                """, (limit,)).fetchall()
+            else:
+                roots = conn.execute("""
+                    SELECT DISTINCT duplicate_of FROM resume_minhash WHERE duplicate_of < ?
+                    ORDER BY duplicate_of DESC LIMIT ?
+                """, (after, limit)).fetchall()
+            roots = [root for root, in roots]
+            if not roots:
+                return [], None
+            placeholders = ', '.join('?' * len(roots))
+            rows = conn.execute(f"""
+                SELECT m.resume_id, m.duplicate_of, m.similarity, r.name, r.email, r.created_at
+                FROM resume_minhash m JOIN resumes r ON r.id = m.resume_id
+                WHERE m.duplicate_of IN ({placeholders}) OR m.resume_id IN ({placeholders})
+                ORDER BY m.resume_id
+            """, roots + roots).fetchall()
+
+        clusters = {root: {'resume_id': root, 'name': None, 'email': None, 'created_at': None, 'duplicates': []}
+                    for root in roots}
+        for resume_id, root, similarity, name, email, created_at in rows:
+            entry = {'resume_id': resume_id, 'name': name, 'email': email, 'created_at': created_at}
+            if root is None:
+                clusters[resume_id].update(entry)
+            else:
+                clusters[root]['duplicates'].append({**entry, 'similarity': similarity})
+        next_cursor = encode_cursor([roots[-1]]) if len(roots) == limit else None
+        return [clusters[root] for root in roots], next_cursor
+
+    def backfill_minhash(self, batch_size: int = 500) -> Iterator[int]:
+        """Hash and index resumes stored without a MinHash signature.
+
+        Works through them in id order, one transaction per batch, and yields
+        the number of resumes done after each batch, so an interrupted run
+        simply picks up where it stopped. Like new uploads, each resume is
+        only compared with lower ids; a resume hashed at insert time is not
+        regrouped under an older one hashed here.
+        """
+        last_id = 0
+        while True:
+            with self.get_connection() as conn:
+                rows = conn.execute("""
+                    SELECT r.id, (SELECT decompress_text(codec, dictionary_id, data)
+                                  FROM resume_text WHERE resume_id = r.id)
+                    FROM resumes r
+                    LEFT JOIN resume_minhash m ON m.resume_id = r.id
+                    WHERE r.id > ? AND m.resume_id IS NULL
+                    ORDER BY r.id LIMIT ?
+                """, (last_id, batch_size)).fetchall()
+            if not rows:
+                return
+            entries = [(resume_id, self.minhasher.signature(raw_text)) for resume_id, raw_text in rows]
+            with self.get_connection() as conn:
+                self._begin_write(conn)
+                self._index_duplicates(conn.cursor(), entries)
+            last_id = rows[-1][0]
+            yield len(rows)
+
+    def resume_exists(self, resume_id: int) -> bool:
+        """Check whether a resume row is still present."""
+        with self.get_connection() as conn:
+            return conn.execute("SELECT 1 FROM resumes WHERE id = ?", (resume_id,)).fetchone() is not None
+
+    def ingested_paths(self, include_failed: bool = True) -> set:
+        """Return source paths already recorded by bulk ingestion."""
+        with self.get_connection() as conn:
+            if include_failed:
+                rows = conn.execute("SELECT path FROM ingest_log")
+            else:
+                rows = conn.execute("SELECT path FROM ingest_log WHERE status = 'done'")
+            return {row[0] for row in rows}
+
+    def store_ingest_batch(self, results: List[Tuple[str, Optional[ParsedResume], Optional[str]]]) -> List[Optional[int]]:
+        """Store a batch of bulk ingestion results in a single transaction.
+
+        Each result is ``(path, parsed_resume, error)``. Resumes and their
+        ``ingest_log`` entries are committed together, so an interrupted run
+        can be restarted and will only redo the batch that was in flight.
+        """
+        parsed_resumes = [parsed_resume for _, parsed_resume, error in results if error is None]
+        signatures = self._signatures(parsed_resumes)
+        with self.get_connection() as conn:
+            self._begin_write(conn)
+            cursor = conn.cursor()
+            stored_ids = iter(self._insert_resumes(cursor, parsed_resumes, signatures))
+            resume_ids = [next(stored_ids) if error is None else None for _, _, error in results]
+            cursor.executemany("""
+                INSERT OR REPLACE INTO ingest_log (path, status, resume_id, error)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (path, 'done' if error is None else 'failed', resume_id, error)
+                for (path, _, error), resume_id in zip(results, resume_ids)
+            ])
+        return resume_ids
+
+    # Raw text is decompressed per row, and only when asked for.
+    RAW_TEXT_SQL = "(SELECT decompress_text(codec, dictionary_id, data) FROM resume_text WHERE resume_id = r.id)"
+
+    # Columns /search can return; raw_text is only included when asked for.
+    SEARCH_FIELDS = {
+        'id': 'r.id',
+        'name': 'r.name',
+        'email': 'r.email',
+        'phone': 'r.phone',
+        'address': 'r.address',
+        'linkedin': 'r.linkedin',
+        'skills': 'r.skills',
+        'raw_text': RAW_TEXT_SQL,
+        'created_at': 'r.created_at',
+        'degrees': '(SELECT GROUP_CONCAT(degree) FROM education WHERE resume_id = r.id)',
+        'job_titles': '(SELECT GROUP_CONCAT(title) FROM experience WHERE resume_id = r.id)',
+    }
+    DEFAULT_SEARCH_FIELDS = tuple(field for field in SEARCH_FIELDS if field != 'raw_text')
+
+    def search_resumes(self, query: str = None, skills: List[str] = None,
+                       match: str = 'any', min_match: Optional[int] = None,
+                       limit: Optional[int] = None, cursor: Optional[str] = None,
+                       fields: Optional[List[str]] = None) -> List[Dict]:
+        """Search resumes by text query or skills.
+
+        Skill searches use the ``resume_skills`` index. ``match='any'`` returns
+        resumes with at least ``min_match`` (default 1) of the skills,
+        ``match='all'`` requires every skill. Results are ordered by the
+        number of matched skills.
+        """
+        return list(self.iter_resumes(query, skills, match, min_match, limit, cursor, fields))
+
+    @timed('search_resumes')
+    def iter_resumes(self, query: str = None, skills: List[str] = None,
+                     match: str = 'any', min_match: Optional[int] = None,
+                     limit: Optional[int] = None, cursor: Optional[str] = None,
+                     fields: Optional[List[str]] = None):
+        """Yield search results one row at a time straight from the SQLite cursor.
+
+        Results are keyset-paginated: pass the ``cursor`` from
+        :meth:`next_cursor` of the last row to continue after it. ``fields``
+        selects the columns to return (``id`` is always included).
+        """
+        fields = list(dict.fromkeys(['id', *(fields or self.DEFAULT_SEARCH_FIELDS)]))
+        unknown = [field for field in fields if field not in self.SEARCH_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        after = decode_cursor(cursor) if cursor else None
+        columns = ', '.join(f"{self.SEARCH_FIELDS[field]} AS {field}" for field in fields)
+        limit_sql = "LIMIT ?" if limit else ""
+
+        if skills:
+            wanted = list(dict.fromkeys(normalize_skill(skill) for skill in skills if normalize_skill(skill)))
+            if match == 'all':
+                required = len(wanted)
+            else:
+                required = max(1, min(min_match or 1, len(wanted)))
+
+            placeholders = ', '.join('?' for _ in wanted)
+            params = [*wanted, required]
+            keyset = ""
+            if after:
+                keyset = "WHERE m.matched_skills < ? OR (m.matched_skills = ? AND r.id < ?)"
+                params += [after[0], after[0], after[1]]
+            sql = f"""
+            WITH matched AS (
+                SELECT resume_id, COUNT(*) AS matched_skills
+                FROM resume_skills
+                WHERE skill IN ({placeholders})
+                GROUP BY resume_id
+                HAVING COUNT(*) >= ?
+            )
+            SELECT {columns}, m.matched_skills
+            FROM matched m
+            JOIN resumes r ON r.id = m.resume_id
+            {keyset}
+            ORDER BY m.matched_skills DESC, r.id DESC
+            {limit_sql}
+            """
+            if limit:
+                params.append(limit)
+
+        elif query and self.has_fulltext_index:
+            rank = "bm25(resumes_fts, 10.0, 1.0)"
+            fts_query = build_fts_query(query)
+            params = [fts_query]
+            keyset = ""
+            if after:
+                keyset = f"AND ({rank} > ? OR ({rank} = ? AND rowid < ?))"
+                params += [after[0], after[0], after[1]]
+            if limit:
+                params.append(limit)
+            params.append(fts_query)
+            # Rank in the inner query so columns and snippets (which decompress
+            # the text) are only built for the rows on this page.
+            sql = f"""
+            WITH hits AS (
+                SELECT rowid AS id, {rank} AS rank
+                FROM resumes_fts
+                WHERE resumes_fts MATCH ? {keyset}
+                ORDER BY rank, rowid DESC
+                {limit_sql}
+            )
+            SELECT {columns}, h.rank AS rank,
+                   snippet(resumes_fts, 1, '<mark>', '</mark>', '…', 24) AS snippet
+            FROM hits h
+            JOIN resumes_fts ON resumes_fts.rowid = h.id
+            JOIN resumes r ON r.id = h.id
+            WHERE resumes_fts MATCH ?
+            ORDER BY h.rank, h.id DESC
+            """
+
+        else:
+            conditions, params = [], []
+            if query:
+                conditions.append(f"(r.name LIKE ? OR {self.RAW_TEXT_SQL} LIKE ?)")
+                params += [f"%{query}%", f"%{query}%"]
+            if after:
+                conditions.append("r.id < ?")
+                params.append(after[-1])
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            sql = f"""
+            SELECT {columns}
+            FROM resumes r
+            {where}
+            ORDER BY r.id DESC
+            {limit_sql}
+            """
+            if limit:
+                params.append(limit)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(sql, params)
+            for row in cursor:
+                result_dict = dict(row)
+                
+                if result_dict.get('skills'):
+                    try:
+                        result_dict['skills'] = json.loads(result_dict['skills'])
+                    except:
+                        result_dict['skills'] = []
+                yield result_dict
+
+    @staticmethod
+    def next_cursor(row: Dict) -> str:
+        """Build the pagination cursor that continues after ``row``."""
+        if 'matched_skills' in row:
+            return encode_cursor([row['matched_skills'], row['id']])
+        if 'rank' in row:
+            return encode_cursor([row['rank'], row['id']])
+        return encode_cursor([row['id']])
+
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+_worker_parser = None
+
+
+def _init_ingest_worker(parser_options: Optional[Dict] = None):
+    """Load the parser (and its spaCy model) once per worker process."""
+    global _worker_parser
+    _worker_parser = ResumeParser(**(parser_options or {}))
+    _worker_parser.load()
+
+
+def _parse_for_ingest(paths: List[str]) -> List[Tuple[str, Optional[ParsedResume], Optional[str]]]:
+    """Parse a chunk of files in a worker with batched NER, returning errors instead of raising."""
+    try:
+        return _worker_parser.parse_resumes(paths)
+    except Exception as e:
+        return [(path, None, f"{type(e).__name__}: {e}") for path in paths]
+
+
+def collect_resume_paths(sources: List[str], manifest: Optional[str] = None) -> List[str]:
+    """Expand directories, glob patterns, files and a manifest into resume paths."""
+    candidates = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _, files in os.walk(source):
+                candidates.extend(os.path.join(root, name) for name in files)
+        elif glob.has_magic(source):
+            candidates.extend(glob.glob(source, recursive=True))
+        else:
+            candidates.append(source)
+
+    if manifest:
+        with open(manifest, encoding='utf-8') as f:
+            candidates.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+
+    paths = []
+    for candidate in candidates:
+        if candidate.lower().endswith(SUPPORTED_EXTENSIONS) and os.path.isfile(candidate):
+            paths.append(os.path.abspath(candidate))
+    return sorted(dict.fromkeys(paths))
+
+
+class BulkIngestor:
+    """Parse many resumes across worker processes and store them in batches.
+
+    Workers only parse; the calling process is the single SQLite writer and
+    commits every ``batch_size`` results in one transaction. Progress is
+    tracked in ``ingest_log`` so a crashed or interrupted run can be resumed.
+    """
+
+    def __init__(self, db_manager: 'SQLiteDatabaseManager', workers: Optional[int] = None,
+                 batch_size: int = 50, chunksize: int = 16, progress_interval: float = 5.0,
+                 parser_options: Optional[Dict] = None):
+        self.db_manager = db_manager
+        # Keyword arguments for the ResumeParser built in each worker.
+        self.parser_options = parser_options or {}
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        # Files handed to a worker at once; their NER runs in one nlp.pipe call.
+        self.chunksize = chunksize
+        self.progress_interval = progress_interval
+
+    def run(self, paths: List[str], retry_failed: bool = False) -> Dict:
+        """Ingest ``paths``, skipping files a previous run already recorded."""
+        already_done = self.db_manager.ingested_paths(include_failed=not retry_failed)
+        pending = [path for path in paths if path not in already_done]
+        stats = {
+            'total': len(paths),
+            'skipped': len(paths) - len(pending),
+            'pending': len(pending),
+            'stored': 0,
+            'failed': 0,
+            'failures': [],
+        }
+        if not pending:
+            stats['elapsed_seconds'] = 0.0
+            return stats
+
+        started = time.monotonic()
+        last_report = started
+        batch = []
+
+        chunks = [pending[i:i + self.chunksize] for i in range(0, len(pending), self.chunksize)]
+        with multiprocessing.Pool(self.workers, initializer=_init_ingest_worker,
+                                  initargs=(self.parser_options,)) as pool:
+            for results in pool.imap_unordered(_parse_for_ingest, chunks):
+                batch.extend(results)
+                for path, _, error in results:
+                    if error is not None:
+                        stats['failed'] += 1
+                        stats['failures'].append({'path': path, 'error': error})
+                        print(f"❌ {path}: {error}")
+
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, stats)
+
+                now = time.monotonic()
+                if now - last_report >= self.progress_interval:
+                    self._report(stats, now - started)
+                    last_report = now
+
+        self._flush(batch, stats)
+        stats['elapsed_seconds'] = time.monotonic() - started
+        self._report(stats, stats['elapsed_seconds'])
+        return stats
+
+    def _flush(self, batch: List, stats: Dict):
+        if not batch:
+            return
+        self.db_manager.store_ingest_batch(batch)
+        stats['stored'] += sum(1 for _, parsed, error in batch if error is None)
+        batch.clear()
+
+    def _report(self, stats: Dict, elapsed: float):
+        processed = stats['stored'] + stats['failed']
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        print(f"📈 {processed}/{stats['pending']} processed "
+              f"({stats['stored']} stored, {stats['failed']} failed) - {rate:.1f} files/s")
+
+
+def _reextract_chunk(rows: List[Tuple[int, str]]) -> List[Tuple[int, Optional[ParsedResume], Optional[str]]]:
+    """Rerun the text-level extractors over stored ``(id, raw_text)`` rows in a worker."""
+    try:
+        parsed = _worker_parser.parse_texts([text for _, text in rows])
+    except Exception as e:
+        return [(resume_id, None, f"{type(e).__name__}: {e}") for resume_id, _ in rows]
+    return [(resume_id, parsed_resume, None) for (resume_id, _), parsed_resume in zip(rows, parsed)]
+
+
+class Reextractor:
+    """Refresh extracted fields of stored resumes after the extractors change.
+
+    Only the text-level extractors run, over the stored raw text, so no
+    file is read again. Rows whose ``extractor_version`` differs from the
+    current parser's are fetched ``workers * chunksize`` at a time in id
+    order, parsed across worker processes and written back in one
+    transaction per round. Finished rows carry the new version, so an
+    interrupted run resumes where it stopped. ``max_rate`` (resumes per
+    second) and ``pause`` (seconds between rounds) keep the write lock free
+    for live uploads.
+    """
+
+    def __init__(self, db_manager: 'SQLiteDatabaseManager', workers: Optional[int] = None,
+                 chunksize: int = 64, max_rate: Optional[float] = None, pause: float = 0.0,
+                 progress_interval: float = 5.0, parser_options: Optional[Dict] = None):
+        self.db_manager = db_manager
+        self.parser_options = parser_options or {}
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.max_rate = max_rate
+        self.pause = pause
+        self.progress_interval = progress_interval
+        # Only the taxonomy is loaded here; the spaCy model loads in the workers.
+        self.version = ResumeParser(**self.parser_options).version
+
+    def pending(self) -> int:
+        """Number of resumes not yet extracted with the current version."""
+        return sum(count for version, count in self.db_manager.extractor_versions().items()
+                   if version != self.version)
+
+    def run(self, limit: Optional[int] = None) -> Dict:
+        """Re-extract outdated resumes, at most ``limit`` of them."""
+        stats = {'version': self.version, 'pending': self.pending(), 'updated': 0, 'failed': 0, 'failures': []}
+        started = time.monotonic()
+        last_report = started
+        last_id = 0
+        round_size = self.workers * self.chunksize
+        with multiprocessing.Pool(self.workers, initializer=_init_ingest_worker,
+                                  initargs=(self.parser_options,)) as pool:
+            while limit is None or stats['updated'] + stats['failed'] < limit:
+                round_started = time.monotonic()
+                size = round_size if limit is None else min(round_size, limit - stats['updated'] - stats['failed'])
+                rows = self.db_manager.outdated_resumes(self.version, after_id=last_id, limit=size)
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+
+                chunks = [rows[i:i + self.chunksize] for i in range(0, len(rows), self.chunksize)]
+                updates = []
+                for results in pool.map(_reextract_chunk, chunks):
+                    for resume_id, parsed_resume, error in results:
+                        if error is None:
+                            updates.append((resume_id, parsed_resume))
+                        else:
+                            stats['failed'] += 1
+                            stats['failures'].append({'resume_id': resume_id, 'error': error})
+                            print(f"❌ Resume {resume_id}: {error}")
+                stats['updated'] += self.db_manager.update_resumes(updates)
+
+                # Hold the round to max_rate, then leave the database alone for a moment.
+                wait = self.pause
+                if self.max_rate:
+                    wait += len(rows) / self.max_rate - (time.monotonic() - round_started)
+                if wait > 0:
+                    time.sleep(wait)
+
+                now = time.monotonic()
+                if now - last_report >= self.progress_interval:
+                    self._report(stats, now - started)
+                    last_report = now
+
+        stats['elapsed_seconds'] = time.monotonic() - started
+        self._report(stats, stats['elapsed_seconds'])
+        return stats
+
+    def _report(self, stats: Dict, elapsed: float):
+        processed = stats['updated'] + stats['failed']
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        print(f"📈 {processed}/{stats['pending']} re-extracted "
+              f"({stats['updated']} updated, {stats['failed']} failed) - {rate:.1f} resumes/s")
+
+
+class _ExportSink:
+    """Write-only binary sink that hands back what has been written since the last drain."""
+
+    def __init__(self):
+        self.closed = False
+        self._parts = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+class ResumeExporter:
+    """Stream resumes, their child rows and normalized skills out of SQLite as flat tables.
+
+    Rows are read ``chunk_size`` resumes at a time with keyset queries and
+    written straight out (one Parquet row group or CSV block per chunk),
+    so memory stays bounded whatever the corpus size. ``since_id`` and
+    ``since`` (a ``created_at`` timestamp) restrict an export to newer
+    resumes, and ``until_id`` pins its upper end. Every table of one export
+    therefore covers the same resumes, even while new ones are being stored.
+    The ``until_id`` of one export is the ``since_id`` of the next.
+    Parquet and Arrow need the optional ``pyarrow`` package; CSV does not.
+    """
+
+    FORMATS = ('parquet', 'arrow', 'csv')
+    EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow', 'csv': '.csv'}
+    MIMETYPES = {
+        'parquet': 'application/vnd.apache.parquet',
+        'arrow': 'application/vnd.apache.arrow.stream',
+        'csv': 'text/csv',
+    }
+
+    # Table name -> (columns as (name, type), SELECT over rows of the chunk's resume ids).
+    # Types are Arrow type names; ``timestamp`` columns hold SQLite's 'YYYY-MM-DD HH:MM:SS' text.
+    TABLES = {
+        'resumes': (
+            [('id', 'int64'), ('name', 'string'), ('email', 'string'), ('phone', 'string'),
+             ('address', 'string'), ('linkedin', 'string'), ('extractor_version', 'string'),
+             ('created_at', 'timestamp')],
+            "SELECT r.id, r.name, r.email, r.phone, r.address, r.linkedin, r.extractor_version, "
+            "r.created_at{text} FROM resumes r WHERE r.id IN ({ids}) ORDER BY r.id",
+        ),
+        'education': (
+            [('id', 'int64'), ('resume_id', 'int64'), ('degree', 'string'), ('institution', 'string'),
+             ('year', 'string'), ('gpa', 'string')],
+            "SELECT id, resume_id, degree, institution, year, gpa "
+            "FROM education WHERE resume_id IN ({ids}) ORDER BY resume_id, id",
+        ),
+        'experience': (
+            [('id', 'int64'), ('resume_id', 'int64'), ('title', 'string'), ('company', 'string'),
+             ('duration', 'string'), ('description', 'string')],
+            "SELECT id, resume_id, title, company, duration, description "
+            "FROM experience WHERE resume_id IN ({ids}) ORDER BY resume_id, id",
+        ),
+        'skills': (
+            [('resume_id', 'int64'), ('skill', 'string')],
+            "SELECT resume_id, skill FROM resume_skills WHERE resume_id IN ({ids}) ORDER BY resume_id, skill",
+        ),
+    }
+
+    def __init__(self, db_manager: 'SQLiteDatabaseManager', chunk_size: int = 5000, include_text: bool = False):
+        self.db_manager = db_manager
+        # Resumes per chunk; also bounds the number of SQL parameters per child query.
+        self.chunk_size = min(chunk_size, 30000)
+        self.include_text = include_text
+
+    @staticmethod
+    def normalize_since(value: Optional[str]) -> Optional[str]:
+        """Turn an ISO date or date-time into the form ``created_at`` is stored in."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value).strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            raise ValueError(f"Invalid since timestamp {value!r}; use an ISO date such as 2024-01-31")
+
+    @staticmethod
+    def default_format() -> str:
+        """Parquet when pyarrow is installed, otherwise CSV."""
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            return 'csv'
+        return 'parquet'
+
+    def columns(self, table: str) -> List[Tuple[str, str]]:
+        if table not in self.TABLES:
+            raise ValueError(f"Unknown table {table!r}; expected one of {', '.join(self.TABLES)}")
+        columns = list(self.TABLES[table][0])
+        if table == 'resumes' and self.include_text:
+            columns.append(('raw_text', 'string'))
+        return columns
+
+    def watermark(self) -> int:
+        """The highest resume id right now, to pin as ``until_id``."""
+        with self.db_manager.get_connection() as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM resumes").fetchone()[0]
+
+    def iter_chunks(self, table: str, since_id: int = 0, until_id: Optional[int] = None,
+                    since: Optional[str] = None) -> Iterator[List[Tuple]]:
+        """Yield the rows of ``table`` for successive chunks of matching resumes."""
+        self.columns(table)
+        sql = self.TABLES[table][1]
+        text = f", {self.db_manager.RAW_TEXT_SQL}" if self.include_text else ""
+        until_id = self.watermark() if until_id is None else until_id
+        conditions = "id > ? AND id <= ?" + (" AND created_at >= ?" if since else "")
+
+        last_id = since_id
+        while True:
+            with self.db_manager.get_connection() as conn:
+                params = [last_id, until_id] + ([since] if since else []) + [self.chunk_size]
+                ids = [row[0] for row in conn.execute(
+                    f"SELECT id FROM resumes WHERE {conditions} ORDER BY id LIMIT ?", params
+                )]
+                if not ids:
+                    return
+                rows = conn.execute(sql.format(ids=', '.join('?' * len(ids)), text=text), ids).fetchall()
+            last_id = ids[-1]
+            if rows:
+                yield rows
+
+    def write(self, table: str, sink: BinaryIO, fmt: str, since_id: int = 0,
+              until_id: Optional[int] = None, since: Optional[str] = None) -> Iterator[int]:
+        """Write ``table`` to a binary sink, yielding the number of rows after each chunk."""
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(self.FORMATS)}")
+        columns = self.columns(table)
+        chunks = self.iter_chunks(table, since_id, until_id, since)
+        if fmt == 'csv':
+            yield from self._write_csv(columns, chunks, sink)
+        else:
+            yield from self._write_arrow(columns, chunks, sink, fmt)
+
+    @staticmethod
+    def _write_csv(columns: List[Tuple[str, str]], chunks: Iterator[List[Tuple]], sink: BinaryIO) -> Iterator[int]:
+        import csv
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([name for name, _ in columns])
+        sink.write(buffer.getvalue().encode('utf-8'))
+        for rows in chunks:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            sink.write(buffer.getvalue().encode('utf-8'))
+            yield len(rows)
+
+    @staticmethod
+    def _write_arrow(columns: List[Tuple[str, str]], chunks: Iterator[List[Tuple]], sink: BinaryIO,
+                     fmt: str) -> Iterator[int]:
+        import pyarrow as pa
+
+        types = {'int64': pa.int64(), 'string': pa.string(), 'timestamp': pa.timestamp('s')}
+        schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        if fmt == 'parquet':
+            import pyarrow.parquet as pq
+            writer = pq.ParquetWriter(sink, schema, compression='zstd')
+        else:
+            writer = pa.ipc.new_stream(sink, schema)
+        try:
+            for rows in chunks:
+                arrays = []
+                for index, (name, kind) in enumerate(columns):
+                    values = [row[index] for row in rows]
+                    if kind == 'timestamp':
+                        arrays.append(pa.array(values, type=pa.string()).cast(schema.field(name).type))
+                    else:
+                        arrays.append(pa.array(values, type=schema.field(name).type))
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                yield len(rows)
+        finally:
+            writer.close()
+
+    def export(self, directory: str, fmt: Optional[str] = None, tables: Optional[List[str]] = None,
+               since_id: int = 0, since: Optional[str] = None) -> Dict:
+        """Write one file per table into ``directory`` plus a ``manifest.json``; return the manifest.
+
+        Each file is written under a temporary name and renamed when complete.
+        """
+        fmt = fmt or self.default_format()
+        since = self.normalize_since(since)
+        tables = tables or list(self.TABLES)
+        for table in tables:
+            self.columns(table)
+        os.makedirs(directory, exist_ok=True)
+        until_id = self.watermark()
+        manifest = {
+            'format': fmt,
+            'since_id': since_id,
+            'until_id': until_id,
+            'since': since,
+            'exported_at': datetime.now().isoformat(timespec='seconds'),
+            'tables': {},
+        }
+        for table in tables:
+            path = os.path.join(directory, table + self.EXTENSIONS[fmt])
+            rows = 0
+            with open(path + '.tmp', 'wb') as sink:
+                for count in self.write(table, sink, fmt, since_id=since_id, until_id=until_id, since=since):
+                    rows += count
+            os.replace(path + '.tmp', path)
+            manifest['tables'][table] = {'file': os.path.basename(path), 'rows': rows,
+                                         'columns': dict(self.columns(table))}
+        with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+class ParseCache:
+    """Content-addressed cache of parsed resumes stored in SQLite.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes and the parser
+    version, so changing the extractors or the skill taxonomy invalidates
+    them. The raw text is stored compressed beside the JSON payload. The
+    cache is bounded by entry count and total payload size; least recently
+    used entries are evicted first.
+    """
+
+    def __init__(self, db_manager: 'SQLiteDatabaseManager', max_entries: int = 10000,
+                 max_bytes: int = 256 * 1024 * 1024):
+        self.db_manager = db_manager
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        """Return the cache key for an uploaded file's bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, content_hash: str, parser_version: str) -> Optional[Tuple[ParsedResume, Optional[int]]]:
+        """Return ``(parsed_resume, resume_id)`` for a cached file, or None."""
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute("""
+                SELECT parsed, resume_id, text_codec, text_dictionary_id, text_data FROM parse_cache
+                WHERE content_hash = ? AND parser_version = ?
+            """, (content_hash, parser_version)).fetchone()
+            if row is not None:
+                conn.execute("""
+                    UPDATE parse_cache SET hits = hits + 1, last_used_at = CURRENT_TIMESTAMP
+                    WHERE content_hash = ? AND parser_version = ?
+                """, (content_hash, parser_version))
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        data = json.loads(row[0])
+        data['raw_text'] = self.db_manager.text_codec.decompress(*row[2:])
+        return parsed_resume_from_dict(data), row[1]
+
+    def put(self, content_hash: str, parser_version: str, parsed_resume: ParsedResume,
+            resume_id: Optional[int] = None):
+        """Cache a parse result and evict old entries if over the limits."""
+        data = asdict(parsed_resume)
+        codec, dictionary_id, text = self.db_manager.text_codec.compress(data.pop('raw_text'))
+        payload = json.dumps(data)
+        with self.db_manager.get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO parse_cache
+                    (content_hash, parser_version, parsed, text_codec, text_dictionary_id, text_data,
+                     resume_id, size_bytes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (content_hash, parser_version, payload, codec, dictionary_id, text, resume_id,
+                  len(payload) + len(text)))
+            self._evict(conn)
+
+    def link(self, content_hash: str, parser_version: str, resume_id: int):
+        """Point a cache entry at the resumes row it was stored as."""
+        with self.db_manager.get_connection() as conn:
+            conn.execute("""
+                UPDATE parse_cache SET resume_id = ?
+                WHERE content_hash = ? AND parser_version = ?
+            """, (resume_id, content_hash, parser_version))
+
+    def _evict(self, conn: sqlite3.Connection):
+        entries, total_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM parse_cache"
+        ).fetchone()
+        evicted = 0
+        while entries > self.max_entries or total_bytes > self.max_bytes:
+            # Enough of the oldest entries to get under both limits, going by
+            # the average entry size for bytes; repeated if that falls short.
+            excess = max(entries - self.max_entries,
+                         math.ceil((total_bytes - self.max_bytes) * entries / total_bytes))
+            oldest = "SELECT rowid FROM parse_cache ORDER BY last_used_at, rowid LIMIT ?"
+            count, size = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM parse_cache WHERE rowid IN ({oldest})", (excess,)
+            ).fetchone()
+            conn.execute(f"DELETE FROM parse_cache WHERE rowid IN ({oldest})", (excess,))
+            entries -= count
+            total_bytes -= size
+            evicted += count
+        with self._lock:
+            self.evictions += evicted
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the current cache size."""
+        with self.db_manager.get_connection() as conn:
+            entries, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM parse_cache"
+            ).fetchone()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': entries,
+                'size_bytes': total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+class StatsCache:
+    """Short-lived in-process cache of :meth:`SQLiteDatabaseManager.get_stats` results.
+
+    Dashboards polling /api/stats share one read per ``ttl`` seconds for
+    each distinct set of parameters.
+    """
+
+    def __init__(self, db_manager: 'SQLiteDatabaseManager', ttl: float = 10.0):
+        self.db_manager = db_manager
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, top_skills: int = 20, days: int = 30) -> Tuple[Dict, float]:
+        """Return ``(stats, age_seconds)``, reading the database only when the entry is stale."""
+        key = (top_skills, days)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1], now - entry[0]
+        stats = self.db_manager.get_stats(top_skills=top_skills, days=days)
+        with self._lock:
+            self._entries[key] = (now, stats)
+        return stats, 0.0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class MatchEngine:
+    """Rank stored resumes against a job description with sparse TF-IDF.
+
+    Every resume is a row of log-scaled term counts over its text plus
+    ``skill:<name>`` features for its normalised skills. The rows live in one
+    SciPy CSR matrix, and document frequencies are kept alongside it. A query
+    is one sparse matrix-vector product and an ``argpartition``, so no Python
+    loop runs per resume. The latency target is a p95 under 100 ms at 100k
+    resumes on one core; ``python benchmark.py match`` measures it.
+
+    The index grows incrementally. :meth:`sync` pulls resumes with an id
+    above the last one indexed, and runs before every :meth:`match`. It can
+    be saved to and loaded from disk so a restart does not re-tokenize
+    everything. Deleted resumes are dropped from results; ``flask
+    build-match-index`` rebuilds from scratch. NumPy and SciPy are imported
+    on first use.
+    """
+
+    STOPWORDS = frozenset("""
+        a about above after again against all also am an and any are as at be because been before being
+        below between both but by can could did do does doing down during each etc few for from further had
+        has have having he her here hers him his how i if in into is it its itself just me more most my no
+        nor not now of off on once only or other our ours out over own per same she should so some such than
+        that the their them then there these they this those through to too under until up upon us very via
+        was we were what when where which while who whom why will with would you your yours
+        ability experience work worked working responsible responsibilities role team using used years year
+        strong good excellent knowledge skills skill requirements required preferred plus looking candidate
+    """.split())
+    SKILL_PREFIX = 'skill:'
+
+    def __init__(self, db_manager: 'SQLiteDatabaseManager', skill_matcher: SkillMatcher,
+                 skill_weight: float = 3.0, max_terms: int = 256, index_path: Optional[str] = None):
+        self.db_manager = db_manager
+        self.skill_matcher = skill_matcher
+        # Term frequency given to each skill feature, so skills outweigh prose.
+        self.skill_weight = skill_weight
+        # Highest-frequency terms kept per resume; bounds memory at ~8 bytes per term.
+        self.max_terms = max_terms
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._vocabulary = {}
+        self._terms = []
+        self._df = []
+        self._matrix = None
+        self._tail = None
+        self._pending = []
+        self._ids = []
+        self._norms = None
+        self._norm_docs = 0
+        self._last_id = 0
+        self._loaded = False
+
+    # -- building ---------------------------------------------------------
+
+    def tokenize(self, text: str) -> List[str]:
+        """Lowercase terms with stopwords, numbers and single characters removed."""
+        return [
+            token for token in SkillMatcher.tokenize(text)
+            if len(token) > 1 and not token.isdigit() and token not in self.STOPWORDS
+        ]
+
+    def _features(self, text: str, skills: List[str]) -> Dict[int, float]:
+        """Column -> weight for one document, growing the vocabulary as needed."""
+        counts = {}
+        for token in self.tokenize(text or ''):
+            counts[token] = counts.get(token, 0) + 1
+        if self.max_terms and len(counts) > self.max_terms:
+            counts = dict(sorted(counts.items(), key=lambda item: -item[1])[:self.max_terms])
+        weights = {term: 1.0 + math.log(count) for term, count in counts.items()}
+        for skill in skills:
+            key = normalize_skill(skill)
+            if key:
+                weights[self.SKILL_PREFIX + key] = self.skill_weight
+
+        features = {}
+        for term, weight in weights.items():
+            column = self._vocabulary.get(term)
+            if column is None:
+                column = self._vocabulary[term] = len(self._terms)
+                self._terms.append(term)
+                self._df.append(0)
+            features[column] = weight
+        return features
+
+    def add(self, resume_ids: List[int], texts: List[str], skills: List[List[str]]):
+        """Append resumes to the index."""
+        with self._lock:
+            for resume_id, text, resume_skills in zip(resume_ids, texts, skills):
+                features = self._features(text, resume_skills)
+                for column in features:
+                    self._df[column] += 1
+                self._pending.append(features)
+                self._ids.append(resume_id)
+                self._last_id = max(self._last_id, resume_id)
+
+    def sync(self, batch_size: int = 1000) -> int:
+        """Index resumes stored since the last sync and return how many were added."""
+        self._ensure_loaded()
+        added = 0
+        while True:
+            with self.db_manager.get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT r.id, {self.db_manager.RAW_TEXT_SQL}, r.skills FROM resumes r "
+                    "WHERE r.id > ? ORDER BY r.id LIMIT ?",
+                    (self._last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return added
+            self.add(
+                [row[0] for row in rows],
+                [row[1] for row in rows],
+                [self._load_skills(row[2]) for row in rows],
+            )
+            added += len(rows)
+
+    def rebuild(self) -> int:
+        """Drop the index and rebuild it from the database."""
+        with self._lock:
+            self._reset()
+            self._loaded = True
+        return self.sync()
+
+    def _reset(self):
+        self._vocabulary, self._terms, self._df = {}, [], []
+        self._matrix, self._tail, self._pending, self._ids = None, None, [], []
+        self._norms, self._norm_docs, self._last_id = None, 0, 0
+
+    @staticmethod
+    def _load_skills(skills_json: Optional[str]) -> List[str]:
+        try:
+            return json.loads(skills_json) if skills_json else []
+        except ValueError:
+            return []
+
+    def _snapshot(self):
+        """Fold pending rows into the matrices and return ``(blocks, ids, idf, norms)``.
+
+        New rows go into a small tail matrix, which is merged into the main
+        one once it holds 10% as many rows. Most updates therefore copy only
+        the tail. Row norms depend on IDF, which shifts as documents arrive.
+        Existing rows keep their norms until the corpus has grown by 10%
+        since the last full refresh; only new rows are normalised in between.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        with self._lock:
+            columns = len(self._terms)
+            if self._pending:
+                indptr, indices, data = [0], [], []
+                for features in self._pending:
+                    indices.extend(features.keys())
+                    data.extend(features.values())
+                    indptr.append(len(indices))
+                block = sparse.csr_matrix(
+                    (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32),
+                     np.asarray(indptr, dtype=np.int64)),
+                    shape=(len(self._pending), columns)
+                )
+                self._tail = block if self._tail is None else self._stack(self._tail, block, columns)
+                self._pending = []
+            if self._tail is not None and (self._matrix is None or
+                                           self._tail.shape[0] >= self._matrix.shape[0] // 10):
+                self._matrix = self._tail if self._matrix is None else self._stack(self._matrix, self._tail, columns)
+                self._tail = None
+            # Earlier snapshots may still be in use by other requests, so the
+            # matrices are swapped for widened views, never resized in place.
+            if self._matrix is not None:
+                self._matrix = self._widen(self._matrix, columns)
+            if self._tail is not None:
+                self._tail = self._widen(self._tail, columns)
+            blocks = [matrix for matrix in (self._matrix, self._tail) if matrix is not None]
+            if not blocks:
+                return [], [], None, None
+
+            documents = len(self._ids)
+            df = np.asarray(self._df, dtype=np.float32)
+            idf = np.log((1.0 + documents) / (1.0 + df)) + 1.0
+            known = 0 if self._norms is None else len(self._norms)
+            if known == 0 or documents >= self._norm_docs * 1.1:
+                self._norms = np.concatenate([self._row_norms(matrix, idf) for matrix in blocks])
+                self._norm_docs = documents
+            elif known < documents:
+                new_rows = sparse.vstack(blocks, format='csr')[known:] if len(blocks) > 1 else blocks[0][known:]
+                self._norms = np.concatenate([self._norms, self._row_norms(new_rows, idf)])
+            return blocks, np.asarray(self._ids, dtype=np.int64), idf, self._norms
+
+    @classmethod
+    def _stack(cls, top, bottom, columns):
+        from scipy import sparse
+
+        return sparse.vstack([cls._widen(top, columns), cls._widen(bottom, columns)], format='csr')
+
+    @staticmethod
+    def _widen(matrix, columns):
+        """``matrix`` with ``columns`` columns, sharing its arrays rather than resizing it."""
+        from scipy import sparse
+
+        if matrix.shape[1] >= columns:
+            return matrix
+        return sparse.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], columns))
+
+    @staticmethod
+    def _row_norms(matrix, idf):
+        import numpy as np
+
+        weighted = matrix.copy()
+        weighted.data = (weighted.data * idf[weighted.indices]) ** 2
+        norms = np.sqrt(np.asarray(weighted.sum(axis=1), dtype=np.float32).ravel())
+        norms[norms == 0] = 1.0
+        return norms
+
+    # -- querying ---------------------------------------------------------
+
+    @timed('match')
+    def match(self, description: str, top_k: int = 10, explain: bool = True, top_terms: int = 5) -> Dict:
+        """Return the ``top_k`` stored resumes most similar to ``description``.
+
+        Each result has its cosine ``score``; with ``explain`` it also lists
+        the job's skills the resume has (``matched_skills``) and lacks
+        (``missing_skills``), and the terms that contributed most.
+        """
+        import numpy as np
+
+        self.sync()
+        blocks, ids, idf, norms = self._snapshot()
+        job_skills = [match.name for match in self.skill_matcher.find(description)]
+        if not blocks:
+            return {'results': [], 'job_skills': job_skills, 'indexed': 0}
+
+        counts = {}
+        for token in self.tokenize(description):
+            counts[token] = counts.get(token, 0) + 1
+        query = {term: 1.0 + math.log(count) for term, count in counts.items()}
+        for skill in job_skills:
+            query[self.SKILL_PREFIX + normalize_skill(skill)] = self.skill_weight
+
+        weights = np.zeros(blocks[0].shape[1], dtype=np.float32)
+        for term, weight in query.items():
+            column = self._vocabulary.get(term)
+            if column is not None and column < len(weights):
+                weights[column] = weight * idf[column]
+        query_norm = float(np.linalg.norm(weights))
+        if not query_norm:
+            return {'results': [], 'job_skills': job_skills, 'indexed': len(ids)}
+        weights *= idf[:len(weights)] / query_norm
+
+        scores = np.concatenate([matrix @ weights for matrix in blocks]) / norms
+        # Over-fetch a little so deleted resumes can be skipped.
+        wanted = min(len(scores), top_k + 10)
+        candidates = np.argpartition(-scores, wanted - 1)[:wanted]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+        candidates = [row for row in candidates if scores[row] > 0]
+
+        details = self._fetch([int(ids[row]) for row in candidates])
+        results = []
+        for row in candidates:
+            resume_id = int(ids[row])
+            if resume_id not in details:
+                continue
+            result = {'resume_id': resume_id, 'score': round(float(scores[row]), 4), **details[resume_id]}
+            if explain:
+                result.update(self._explain(blocks, row, weights, norms[row], job_skills, top_terms))
+            results.append(result)
+            if len(results) == top_k:
+                break
+        return {'results': results, 'job_skills': job_skills, 'indexed': len(ids)}
+
+    def _explain(self, blocks, row, weights, norm, job_skills, top_terms) -> Dict:
+        matrix = blocks[0]
+        if row >= matrix.shape[0]:
+            row -= matrix.shape[0]
+            matrix = blocks[1]
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        columns = matrix.indices[start:end]
+        contributions = matrix.data[start:end] * weights[columns] / norm
+        have = {self._terms[column][len(self.SKILL_PREFIX):]
+                for column in columns if self._terms[column].startswith(self.SKILL_PREFIX)}
+        terms = []
+        for position in contributions.argsort()[::-1]:
+            if contributions[position] <= 0 or len(terms) == top_terms:
+                break
+            term = self._terms[columns[position]]
+            if not term.startswith(self.SKILL_PREFIX):
+                terms.append({'term': term, 'weight': round(float(contributions[position]), 4)})
+        return {
+            'matched_skills': [skill for skill in job_skills if normalize_skill(skill) in have],
+            'missing_skills': [skill for skill in job_skills if normalize_skill(skill) not in have],
+            'top_terms': terms,
+        }
+
+    def _fetch(self, resume_ids: List[int]) -> Dict[int, Dict]:
+        if not resume_ids:
+            return {}
+        placeholders = ', '.join('?' for _ in resume_ids)
+        with self.db_manager.get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT id, name, email FROM resumes WHERE id IN ({placeholders})", resume_ids
+            ).fetchall()
+        return {resume_id: {'name': name, 'email': email} for resume_id, name, email in rows}
+
+    # -- persistence ------------------------------------------------------
+
+    def save(self, path: Optional[str] = None):
+        """Write the index to ``path`` (a ``.npz`` file plus a ``.json`` sidecar)."""
+        from scipy import sparse
+
+        path = path or self.index_path
+        blocks, ids, _, _ = self._snapshot()
+        with self._lock:
+            if blocks:
+                sparse.save_npz(path + '.npz', sparse.vstack(blocks, format='csr'))
+            meta = {
+                'terms': self._terms,
+                'df': self._df,
+                'ids': [int(resume_id) for resume_id in ids],
+                'last_id': self._last_id,
+                'skill_weight': self.skill_weight,
+                'max_terms': self.max_terms,
+            }
+        with open(path + '.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def _ensure_loaded(self):
+        """Load the saved index once, if there is one; :meth:`sync` then catches up."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not (self.index_path and os.path.exists(self.index_path + '.json')):
+                return
+            from scipy import sparse
+
+            try:
+                with open(self.index_path + '.json', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if meta['skill_weight'] != self.skill_weight or meta['max_terms'] != self.max_terms:
+                    print("⚠️  Saved match index was built with other settings, rebuilding")
+                    return
+                matrix = sparse.load_npz(self.index_path + '.npz').tocsr() if meta['ids'] else None
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️  Could not load match index ({e}), rebuilding")
+                return
+            self._terms = meta['terms']
+            self._vocabulary = {term: column for column, term in enumerate(self._terms)}
+            self._df = meta['df']
+            self._ids = meta['ids']
+            self._last_id = meta['last_id']
+            self._matrix = matrix
+
+    def stats(self) -> Dict:
+        with self._lock:
+            matrices = [matrix for matrix in (self._matrix, self._tail) if matrix is not None]
+            return {
+                'indexed': len(self._ids),
+                'terms': len(self._terms),
+                'nonzeros': sum(int(matrix.nnz) for matrix in matrices),
+                'last_id': self._last_id,
+            }
+
+
+def spool_upload(stream: BinaryIO, max_memory: int = 1024 * 1024,
+                 chunk_size: int = 64 * 1024) -> Tuple[BinaryIO, str]:
+    """Copy an upload stream into a spooled temp file, hashing it on the way.
+
+    Uploads up to ``max_memory`` bytes stay in memory; larger ones roll
+    over to an anonymous temp file that is removed when closed. Returns the
+    rewound spool and the upload's :meth:`ParseCache.content_hash`.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        digest.update(chunk)
+        spool.write(chunk)
+    spool.seek(0)
+    return spool, digest.hexdigest()
+
+
+class UploadArchive:
+    """Optional on-disk copies of uploaded originals with a retention policy.
+
+    Files older than ``max_age_days`` are deleted first, then the oldest
+    remaining files until the directory holds at most ``max_bytes``; 0
+    disables a limit. Pruning runs from :meth:`save` at most once every
+    ``prune_interval`` seconds, or on demand with :meth:`prune`.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1024 * 1024 * 1024, max_age_days: float = 30,
+                 prune_interval: float = 300.0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._last_pruned = 0.0
+
+    def save(self, stream: BinaryIO, filename: str) -> str:
+        """Write a copy of an upload stream into the archive and return its path."""
+        os.makedirs(self.directory, exist_ok=True)
+        file_path = os.path.join(self.directory, f"resume_{datetime.now().timestamp()}_{secure_filename(filename)}")
+        stream.seek(0)
+        with open(file_path, 'wb') as f:
+            shutil.copyfileobj(stream, f)
+        stream.seek(0)
+        self._maybe_prune()
+        return file_path
+
+    def adopt(self, file_path: str) -> str:
+        """Move an existing file (such as a processed queue upload) into the archive."""
+        os.makedirs(self.directory, exist_ok=True)
+        archived = os.path.join(self.directory, os.path.basename(file_path))
+        os.replace(file_path, archived)
+        self._maybe_prune()
+        return archived
+
+    def prune(self) -> Dict:
+        """Apply the age and size limits now and report what was removed."""
+        now = time.time()
+        files = []
+        if not os.path.isdir(self.directory):
+            return {'deleted': 0, 'freed_bytes': 0, 'files': 0, 'size_bytes': 0}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort()
+
+        expired = []
+        if self.max_age_days:
+            cutoff = now - self.max_age_days * 86400
+            expired = [f for f in files if f[0] < cutoff]
+            files = files[len(expired):]
+        total = sum(size for _, size, _ in files)
+        while self.max_bytes and files and total > self.max_bytes:
+            oldest = files.pop(0)
+            expired.append(oldest)
+            total -= oldest[1]
+
+        deleted, freed = 0, 0
+        for _, size, path in expired:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            deleted += 1
+            freed += size
+        with self._lock:
+            self._last_pruned = now
+        return {'deleted': deleted, 'freed_bytes': freed, 'files': len(files), 'size_bytes': total}
+
+    def _maybe_prune(self):
+        with self._lock:
+            due = time.time() - self._last_pruned >= self.prune_interval
+            if due:
+                self._last_pruned = time.time()
+        if due:
+            self.prune()
+
+
+class QueueFullError(Exception):
+    """Raised when the upload job queue has no room for another job."""
+
+
+class UploadJobQueue:
+    """Bounded background worker pool for parsing uploaded resumes.
+
+    Jobs are persisted in the ``upload_jobs`` table and their files in
+    ``spool_dir``, so their state can be polled from any request and jobs
+    still queued when the process stops are picked up again on the next
+    start. A job's file is deleted once it has been processed, or moved
+    into ``archive`` when one is configured. Each job has its own
+    ``job_timeout``, checked between parsing stages; a job that overruns is
+    marked ``timed_out`` and its result is discarded without affecting the
+    rest of its batch.
+    """
+
+    def __init__(self, db_manager: 'SQLiteDatabaseManager', parser: 'ResumeParser',
+                 workers: int = 2, max_queued: int = 100, job_timeout: float = 120.0,
+                 parse_cache: Optional[ParseCache] = None, batch_size: int = 8,
+                 spool_dir: str = os.path.join('uploads', 'pending'), archive: Optional[UploadArchive] = None):
+        self.db_manager = db_manager
+        self.parser = parser
+        self.parse_cache = parse_cache
+        self.spool_dir = spool_dir
+        self.archive = archive
+        # Jobs a worker drains from the queue at once so NER runs batched.
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_queued = max_queued
+        self.job_timeout = job_timeout
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._lock = threading.Lock()
+        self._threads = []
+        self._running = 0
+
+    def start(self):
+        """Start the worker threads and re-queue jobs left over from a previous run."""
+        with self._lock:
+            if self._threads:
+                return
+            with self.db_manager.get_connection() as conn:
+                conn.execute("UPDATE upload_jobs SET status = 'queued', started_at = NULL WHERE status = 'running'")
+                leftovers = conn.execute(
+                    "SELECT id, file_path FROM upload_jobs WHERE status = 'queued' ORDER BY created_at"
+                ).fetchall()
+            for job_id, file_path in leftovers:
+                try:
+                    self._queue.put_nowait((job_id, file_path, None))
+                except queue.Full:
+                    self._finish(job_id, 'failed', error='Queue full on restart')
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"upload-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, stream: BinaryIO, filename: str, content_hash: Optional[str] = None) -> str:
+        """Save an upload stream to the spool directory, queue it for parsing and return its job id."""
+        self.start()
+        if self._queue.full():
+            raise QueueFullError(f"Upload queue is full ({self.max_queued} jobs waiting)")
+        job_id = uuid.uuid4().hex
+        os.makedirs(self.spool_dir, exist_ok=True)
+        file_path = os.path.join(self.spool_dir, f"{job_id}_{secure_filename(filename)}")
+        stream.seek(0)
+        with open(file_path, 'wb') as f:
+            shutil.copyfileobj(stream, f)
+        with self.db_manager.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO upload_jobs (id, filename, file_path, status)
+                VALUES (?, ?, ?, 'queued')
+            """, (job_id, filename, file_path))
+        try:
+            self._queue.put_nowait((job_id, file_path, content_hash))
+        except queue.Full:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("DELETE FROM upload_jobs WHERE id = ?", (job_id,))
+            os.remove(file_path)
+            raise QueueFullError(f"Upload queue is full ({self.max_queued} jobs waiting)")
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Return the stored state of a job, or None if it does not exist."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            row = cursor.execute("""
+                SELECT id, filename, status, resume_id, error, result,
+                       created_at, started_at, finished_at
+                FROM upload_jobs WHERE id = ?
+            """, (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    def metrics(self) -> Dict:
+        """Return queue depth, active workers and job counts by status."""
+        with self.db_manager.get_connection() as conn:
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM upload_jobs GROUP BY status").fetchall())
+        return {
+            'queue_depth': self._queue.qsize(),
+            'queue_capacity': self.max_queued,
+            'running': self._running,
+            'workers': self.workers,
+            'job_timeout_seconds': self.job_timeout,
+            'jobs_by_status': counts,
+        }
+
+    def _worker(self):
+        while True:
+            jobs = [self._queue.get()]
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            with self._lock:
+                self._running += len(jobs)
+            try:
+                self._process(jobs)
+            except Exception as e:
+                # A failing batch must not take the worker thread down with it.
+                print(f"❌ Upload worker error: {type(e).__name__}: {e}")
+                self._fail_unfinished(jobs, f"Processing failed: {e}")
+            finally:
+                self._release(jobs)
+                with self._lock:
+                    self._running -= len(jobs)
+                for _ in jobs:
+                    self._queue.task_done()
+
+    def _process(self, jobs: List[Tuple[str, str, Optional[str]]]):
+        with self.db_manager.get_connection() as conn:
+            conn.executemany(
+                "UPDATE upload_jobs SET status = 'running', started_at = CURRENT_TIMESTAMP WHERE id = ?",
+                [(job_id,) for job_id, _, _ in jobs]
+            )
+
+        extracted = []
+        traces = {}
+        for job_id, file_path, content_hash in jobs:
+            deadline = time.monotonic() + self.job_timeout
+            budget = min(self.parser.time_budget, self.job_timeout) if self.parser.time_budget else self.job_timeout
+            started = time.perf_counter()
+            try:
+                with METRICS.trace() as stages:
+                    extraction = self.parser.extract(file_path, time_budget=budget)
+                traces[job_id] = (file_path, time.perf_counter() - started, stages)
+            except Exception as e:
+                self._finish(job_id, 'failed', error=f"Processing failed: {e}")
+                continue
+            if extraction.status == 'error':
+                self._finish(job_id, 'failed', error=f"Could not extract text: {extraction.error}",
+                             result={'extraction': extraction_summary(extraction)})
+            else:
+                # Budget left once this job's own extraction is done; time spent
+                # extracting the rest of the batch is not charged to it.
+                extracted.append((job_id, content_hash, extraction, deadline - time.monotonic()))
+
+        batch_started = time.monotonic()
+        with METRICS.trace() as batch_stages:
+            pending = self._expire(extracted, batch_started)
+            parsed = self._run_isolated(pending, lambda entries: self.parser.parse_texts(
+                [entry[2].text for entry in entries], extractions=[entry[2] for entry in entries]
+            ))
+            pending = self._expire(parsed, batch_started)
+            stored = self._run_isolated(pending, lambda entries: self.db_manager.store_resumes(
+                [entry[4] for entry in entries]
+            ))
+        batch_elapsed = time.monotonic() - batch_started
+
+        for job_id, content_hash, extraction, _, parsed_resume, resume_id in stored:
+            if self.parser.slow_log is not None:
+                # Text parsing and storage run once for the whole batch, so
+                # their timings are batch totals rather than per document.
+                file_path, elapsed, stages = traces[job_id]
+                self.parser.slow_log.record(elapsed + batch_elapsed, os.path.basename(file_path),
+                                            {**stages, **batch_stages}, extraction,
+                                            job_id=job_id, batch_size=len(extracted))
+            if self.parse_cache is not None and content_hash:
+                try:
+                    self.parse_cache.put(content_hash, self.parser.version, parsed_resume, resume_id)
+                except Exception as e:
+                    print(f"⚠️  Could not cache parse of job {job_id}: {e}")
+            self._finish(job_id, 'done', resume_id=resume_id, result=summarize_parsed_resume(parsed_resume))
+
+    def _expire(self, entries: List[Tuple], batch_started: float) -> List[Tuple]:
+        """Time out the jobs whose remaining budget the batch stages have used up; return the rest."""
+        elapsed = time.monotonic() - batch_started
+        alive = []
+        for entry in entries:
+            job_id, remaining = entry[0], entry[3]
+            if elapsed > remaining:
+                self._finish(job_id, 'timed_out', error=f"Parsing exceeded {self.job_timeout:.0f}s")
+            else:
+                alive.append(entry)
+        return alive
+
+    def _run_isolated(self, entries: List[Tuple], stage: Callable[[List[Tuple]], List]) -> List[Tuple]:
+        """Run a batch stage over ``entries`` and append its result to each entry.
+
+        When the batch raises, the stage is retried job by job so only the
+        jobs that fail on their own are marked as failed.
+        """
+        if not entries:
+            return []
+        try:
+            return [entry + (result,) for entry, result in zip(entries, stage(entries))]
+        except Exception as e:
+            if len(entries) == 1:
+                self._finish(entries[0][0], 'failed', error=f"Processing failed: {e}")
+                return []
+            print(f"⚠️  Batch of {len(entries)} uploads failed ({e}), retrying one by one")
+        results = []
+        for entry in entries:
+            try:
+                results.append(entry + (stage([entry])[0],))
+            except Exception as e:
+                self._finish(entry[0], 'failed', error=f"Processing failed: {e}")
+        return results
+
+    def _fail_unfinished(self, jobs: List[Tuple[str, str, Optional[str]]], error: str):
+        """Mark the jobs of a batch that never reached a final state as failed."""
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.executemany("""
+                    UPDATE upload_jobs SET status = 'failed', error = ?, finished_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND status IN ('queued', 'running')
+                """, [(error, job_id) for job_id, _, _ in jobs])
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not record failed upload jobs: {e}")
+
+    def _release(self, jobs: List[Tuple[str, str, Optional[str]]]):
+        """Archive or delete the files of processed jobs."""
+        for _, file_path, _ in jobs:
+            try:
+                if self.archive is not None:
+                    self.archive.adopt(file_path)
+                else:
+                    os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"⚠️  Could not release upload {file_path}: {e}")
+
+    def _finish(self, job_id: str, status: str, resume_id: Optional[int] = None,
+                error: Optional[str] = None, result: Optional[Dict] = None):
+        with self.db_manager.get_connection() as conn:
+            conn.execute("""
+                UPDATE upload_jobs
+                SET status = ?, resume_id = ?, error = ?, result = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (status, resume_id, error, json.dumps(result) if result else None, job_id))
+
+
+def summarize_parsed_resume(parsed_resume: ParsedResume) -> Dict:
+    """Short summary of a parsed resume for API responses."""
+    return {
+        'name': parsed_resume.contact_info.name,
+        'email': parsed_resume.contact_info.email,
+        'skills_count': len(parsed_resume.skills),
+        'skills': parsed_resume.skills[:5],  # First 5 skills
+        'education_count': len(parsed_resume.education),
+        'experience_count': len(parsed_resume.experience),
+        'extraction': extraction_summary(parsed_resume.extraction) if parsed_resume.extraction else None
+    }
+
+
+def extraction_summary(extraction: ExtractionResult) -> Dict:
+    """Extraction outcome without the text, for API responses."""
+    summary = asdict(extraction)
+    del summary['text']
+    summary['elapsed'] = round(summary['elapsed'], 3)
+    return summary
+
+
+@dataclass
+class ResumeServices:
+    parser: ResumeParser
+    db_manager: SQLiteDatabaseManager
+    parse_cache: ParseCache
+    job_queue: UploadJobQueue
+    stats_cache: StatsCache
+    match_engine: MatchEngine
+    archive: Optional[UploadArchive] = None
+
+    def warm_up(self, background: bool = True):
+        """Load the NLP model ahead of the first upload."""
+        if background:
+            threading.Thread(target=self.parser.load, name="parser-warmup", daemon=True).start()
+        else:
+            self.parser.load()
+
+
+bp = Blueprint('resumes', __name__, cli_group=None)
+
+
+def create_app(config: Optional[Dict] = None) -> Flask:
+    """Application factory.
+
+    Only the SQLite database is opened here. The spaCy model and the PDF and
+    Word libraries load on the first upload, or in the background when
+    ``PARSER_WARMUP`` is set; ``/ready`` reports when that has happened.
+    """
+    app = Flask(__name__)
+    app.config.from_mapping(
+        DATABASE=os.environ.get('RESUME_DB_PATH', 'resumes.db'),
+        SKILL_TAXONOMY=SKILL_TAXONOMY_PATH,
+        UPLOAD_MODE=os.environ.get('RESUME_UPLOAD_MODE', 'sync'),
+        QUEUE_WORKERS=int(os.environ.get('RESUME_QUEUE_WORKERS', 2)),
+        QUEUE_SIZE=int(os.environ.get('RESUME_QUEUE_SIZE', 100)),
+        QUEUE_BATCH=int(os.environ.get('RESUME_QUEUE_BATCH', 8)),
+        JOB_TIMEOUT=float(os.environ.get('RESUME_JOB_TIMEOUT', 120)),
+        CACHE_MAX_ENTRIES=int(os.environ.get('RESUME_CACHE_MAX_ENTRIES', 10000)),
+        CACHE_MAX_BYTES=int(os.environ.get('RESUME_CACHE_MAX_BYTES', 256 * 1024 * 1024)),
+        # Repeat uploads of a cached file return the existing row instead of a new one.
+        CACHE_LINK_EXISTING=os.environ.get('RESUME_CACHE_LINK_EXISTING', '1') == '1',
+        PARSER_WARMUP=os.environ.get('RESUME_PARSER_WARMUP', '0') == '1',
+        PDF_MAX_PAGES=int(os.environ.get('RESUME_PDF_MAX_PAGES', 50)),
+        PDF_TIME_BUDGET=float(os.environ.get('RESUME_PDF_TIME_BUDGET', 30)),
+        MAX_TEXT_CHARS=int(os.environ.get('RESUME_MAX_TEXT_CHARS', 500_000)),
+        # JSON-lines log of parses slower than SLOW_PARSE_SECONDS; empty disables it.
+        SLOW_PARSE_LOG=os.environ.get('RESUME_SLOW_PARSE_LOG', ''),
+        SLOW_PARSE_SECONDS=float(os.environ.get('RESUME_SLOW_PARSE_SECONDS', 5)),
+        STATS_TTL=float(os.environ.get('RESUME_STATS_TTL', 10)),
+        # Saved TF-IDF index for /match (PATH.npz + PATH.json); empty keeps it in memory only.
+        MATCH_INDEX_PATH=os.environ.get('RESUME_MATCH_INDEX', ''),
+        MATCH_SKILL_WEIGHT=float(os.environ.get('RESUME_MATCH_SKILL_WEIGHT', 3.0)),
+        MATCH_MAX_TERMS=int(os.environ.get('RESUME_MATCH_MAX_TERMS', 256)),
+        # Estimated Jaccard similarity of word shingles above which a new resume is flagged as a duplicate.
+        DUPLICATE_THRESHOLD=float(os.environ.get('RESUME_DUPLICATE_THRESHOLD', 0.8)),
+        # Raw text compression: 'zlib', or 'zstd' with the zstandard package installed.
+        TEXT_CODEC=os.environ.get('RESUME_TEXT_CODEC', 'zlib'),
+        # Uploads are parsed from memory; bigger ones spill to an anonymous temp file.
+        UPLOAD_SPOOL_BYTES=int(os.environ.get('RESUME_UPLOAD_SPOOL_BYTES', 1024 * 1024)),
+        UPLOAD_FOLDER=os.environ.get('RESUME_UPLOAD_FOLDER', 'uploads'),
+        # Keep a copy of each original in UPLOAD_FOLDER, pruned by age and total size.
+        ARCHIVE_UPLOADS=os.environ.get('RESUME_ARCHIVE_UPLOADS', '0') == '1',
+        ARCHIVE_MAX_BYTES=int(os.environ.get('RESUME_ARCHIVE_MAX_BYTES', 1024 * 1024 * 1024)),
+        ARCHIVE_MAX_AGE_DAYS=float(os.environ.get('RESUME_ARCHIVE_MAX_AGE_DAYS', 30)),
+    )
+    if config:
+        app.config.update(config)
+
+    slow_log = None
+    if app.config['SLOW_PARSE_LOG']:
+        slow_log = SlowParseLog(app.config['SLOW_PARSE_LOG'], threshold=app.config['SLOW_PARSE_SECONDS'])
+    parser = ResumeParser(**parser_options(app.config), slow_log=slow_log)
+    db_manager = SQLiteDatabaseManager(
+        app.config['DATABASE'],
+        duplicate_threshold=app.config['DUPLICATE_THRESHOLD'],
+        text_codec=TextCodec(app.config['TEXT_CODEC']),
+    )
+    parse_cache = ParseCache(
+        db_manager,
+        max_entries=app.config['CACHE_MAX_ENTRIES'],
+        max_bytes=app.config['CACHE_MAX_BYTES'],
+    )
+    archive = None
+    if app.config['ARCHIVE_UPLOADS']:
+        archive = UploadArchive(
+            app.config['UPLOAD_FOLDER'],
+            max_bytes=app.config['ARCHIVE_MAX_BYTES'],
+            max_age_days=app.config['ARCHIVE_MAX_AGE_DAYS'],
+        )
+    job_queue = UploadJobQueue(
+        db_manager,
+        parser,
+        workers=app.config['QUEUE_WORKERS'],
+        max_queued=app.config['QUEUE_SIZE'],
+        job_timeout=app.config['JOB_TIMEOUT'],
+        parse_cache=parse_cache,
+        batch_size=app.config['QUEUE_BATCH'],
+        spool_dir=os.path.join(app.config['UPLOAD_FOLDER'], 'pending'),
+        archive=archive,
+    )
+    stats_cache = StatsCache(db_manager, ttl=app.config['STATS_TTL'])
+    match_engine = MatchEngine(
+        db_manager,
+        parser.skill_matcher,
+        skill_weight=app.config['MATCH_SKILL_WEIGHT'],
+        max_terms=app.config['MATCH_MAX_TERMS'],
+        index_path=app.config['MATCH_INDEX_PATH'] or None,
+    )
+    services = ResumeServices(parser, db_manager, parse_cache, job_queue, stats_cache, match_engine, archive)
+    app.extensions['resume_parser'] = services
+    app.register_blueprint(bp)
+
+    if app.config['PARSER_WARMUP']:
+        services.warm_up()
+    return app
+
+
+def parser_options(config) -> Dict:
+    """ResumeParser keyword arguments taken from the app config."""
+    return {
+        'taxonomy_path': config['SKILL_TAXONOMY'],
+        'max_pages': config['PDF_MAX_PAGES'],
+        'time_budget': config['PDF_TIME_BUDGET'],
+        'max_chars': config['MAX_TEXT_CHARS'],
+    }
+
+
+def get_services() -> ResumeServices:
+    """Services attached to the current app by :func:`create_app`."""
+    return current_app.extensions['resume_parser']
+
+@bp.route('/')
+def index():
+    """Main page with upload form and search."""
+    html_template = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Resume Parser - VS Code Version</title>
+        <style>
+            body { 
+                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
+                margin: 0; padding: 20px; background: #f5f5f5; 
+            }
+            .container { 
+                max-width: 1000px; margin: 0 auto; background: white; 
+                padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            }
+            .header { text-align: center; margin-bottom: 40px; }
+            .header h1 { color: #007ACC; margin: 0; }
+            .header p { color: #666; margin: 10px 0 0 0; }
+            .section { 
+                margin: 30px 0; padding: 25px; border: 2px solid #e1e1e1; 
+                border-radius: 8px; background: #fafafa;
+            }
+            .section h2 { color: #333; margin-top: 0; }
+            input[type="file"], input[type="text"] { 
+                padding: 12px; margin: 8px; border: 2px solid #ddd; 
+                border-radius: 5px; font-size: 14px; width: 300px;
+            }
+            button { 
+                padding: 12px 20px; margin: 8px; background: #007ACC; 
+                color: white; border: none; border-radius: 5px; 
+                cursor: pointer; font-size: 14px; font-weight: bold;
+            }
+            button:hover { background: #005a9e; }
+            .status { 
+                padding: 15px; margin: 15px 0; border-radius: 5px; 
+                font-weight: bold;
+            }
+            .success { background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
+            .error { background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
+            .info { background: #d1ecf1; color: #0c5460; border: 1px solid #bee5eb; }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>📄 Resume Parser System</h1>
+                <p>VS Code Ready • SQLite Database • No PostgreSQL Required</p>
+            </div>
+            
+            <div class="section">
+                <h2>📤 Upload Resume</h2>
+                <p>Upload a PDF or Word document to extract candidate information.</p>
+                <form action="/upload" method="post" enctype="multipart/form-data">
+                    <input type="file" name="resume" accept=".pdf,.docx,.doc" required>
+                    <button type="submit">Parse Resume</button>
+                </form>
+            </div>
+            
+            <div class="section">
+                <h2>🔍 Search Resumes</h2>
+                <p>Search through all parsed resumes in your database.</p>
+                
+                <form action="/search" method="get" style="margin-bottom: 15px;">
+                    <input type="text" name="q" placeholder="Search by name, skills, or content">
+                    <button type="submit">Search All</button>
+                </form>
+                
+                <form action="/search" method="get">
+                    <input type="text" name="skills" placeholder="Search by skills (e.g., python,javascript,react)">
+                    <button type="submit">Search by Skills</button>
+                </form>
+            </div>
+            
+            <div class="section">
+                <h2>📊 Quick Actions</h2>
+                <a href="/api/stats" style="text-decoration: none;">
+                    <button type="button">View Database Stats</button>
+                </a>
+                <a href="/search" style="text-decoration: none;">
+                    <button type="button">View All Resumes</button>
+                </a>
+            </div>
+        </div>
+        
+        <script>
+            // Add some basic client-side functionality
+            document.querySelector('form[action="/upload"]').onsubmit = function() {
+                const button = this.querySelector('button');
+                button.textContent = 'Processing...';
+                button.disabled = true;
+            };
+        </script>
+    </body>
+    </html>
+    """
+    return render_template_string(html_template)
+
+@bp.route('/upload', methods=['POST'])
+def upload_resume():
+    """Handle resume upload and parsing."""
+    services = get_services()
+    if 'resume' not in request.files:
+        return jsonify({'error': 'No file uploaded'}), 400
+    
+    file = request.files['resume']
+    if file.filename == '':
+        return jsonify({'error': 'No file selected'}), 400
+    
+    spool = None
+    try:
+        spool, content_hash = spool_upload(file.stream, current_app.config['UPLOAD_SPOOL_BYTES'])
+        parser_version = services.parser.version
+
+        cached = services.parse_cache.get(content_hash, parser_version)
+        if cached is not None:
+            parsed_resume, resume_id = cached
+            if not (current_app.config['CACHE_LINK_EXISTING'] and resume_id and services.db_manager.resume_exists(resume_id)):
+                resume_id = services.db_manager.store_resume(parsed_resume)
+                services.parse_cache.link(content_hash, parser_version, resume_id)
+            return jsonify({
+                'success': True,
+                'message': f'Resume already parsed. Resume ID: {resume_id}',
+                'resume_id': resume_id,
+                'cached': True,
+                'duplicate_of': services.db_manager.duplicate_of(resume_id),
+                'extracted_data': summarize_parsed_resume(parsed_resume)
+            })
+
+        if request.args.get('mode', current_app.config['UPLOAD_MODE']) == 'queue':
+            try:
+                job_id = services.job_queue.submit(spool, file.filename, content_hash)
+            except QueueFullError as e:
+                return jsonify({'error': str(e)}), 429
+            return jsonify({
+                'success': True,
+                'message': 'Resume queued for parsing',
+                'job_id': job_id,
+                'status_url': f'/jobs/{job_id}'
+            }), 202
+
+        if services.archive is not None:
+            services.archive.save(spool, file.filename)
+
+        try:
+            parsed_resume = services.parser.parse_resume_bytes(spool, file.filename)
+        except ExtractionError as e:
+            return jsonify({'error': str(e), 'extraction': extraction_summary(e.result)}), 422
+        
+       
+        resume_id = services.db_manager.store_resume(parsed_resume)
+        services.parse_cache.put(content_hash, parser_version, parsed_resume, resume_id)
+        
+        return jsonify({
+            'success': True,
+            'message': f'Resume parsed successfully! Resume ID: {resume_id}',
+            'resume_id': resume_id,
+            'cached': False,
+            'duplicate_of': services.db_manager.duplicate_of(resume_id),
+            'extracted_data': summarize_parsed_resume(parsed_resume)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Processing failed: {str(e)}'}), 500
+    finally:
+        if spool is not None:
+            spool.close()
+
+@bp.route('/jobs/<job_id>')
+def get_job(job_id):
+    """Report the state of a queued upload job."""
+    services = get_services()
+    job = services.job_queue.get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
+
+@bp.route('/jobs')
+def get_job_metrics():
+    """Report upload queue depth and job counts."""
+    services = get_services()
+    return jsonify({'success': True, 'queue': services.job_queue.metrics()})
+
+@bp.route('/ready')
+def readiness():
+    """Readiness probe: search is ready once the app is up, uploads once the parser is loaded.
+
+    ``/ready?require=parser`` answers 503 until the NLP model has loaded.
+    """
+    services = get_services()
+    parser_loaded = services.parser.is_loaded
+    status = 200
+    if request.args.get('require') == 'parser' and not parser_loaded:
+        status = 503
+    return jsonify({
+        'ready': status == 200,
+        'search_ready': True,
+        'parser_loaded': parser_loaded
+    }), status
+
+@bp.route('/api/cache')
+def get_cache_stats():
+    """Report parse cache hits, misses and size."""
+    services = get_services()
+    return jsonify({'success': True, 'cache': services.parse_cache.stats()})
+
+@bp.route('/metrics')
+def prometheus_metrics():
+    """Stage timing histograms and counters in Prometheus text format."""
+    services = get_services()
+    queue_metrics = services.job_queue.metrics()
+    cache = services.parse_cache.stats()
+    gauges = [
+        ('queue_depth', 'Upload jobs waiting in the queue.', queue_metrics['queue_depth']),
+        ('queue_running', 'Upload jobs being processed.', queue_metrics['running']),
+        ('parse_cache_hits', 'Parse cache hits since start.', cache['hits']),
+        ('parse_cache_misses', 'Parse cache misses since start.', cache['misses']),
+        ('parse_cache_entries', 'Entries in the parse cache.', cache['entries']),
+        ('parser_loaded', 'Whether the NLP model has been loaded.', int(services.parser.is_loaded)),
+    ]
+    return Response(METRICS.render(gauges), mimetype='text/plain; version=0.0.4')
+
+# Default and maximum page size for /search.
+SEARCH_PAGE_SIZE = 100
+SEARCH_MAX_PAGE_SIZE = 1000
+
+@bp.route('/search')
+def search_resumes():
+    """Search resumes endpoint.
+
+    Supports ``limit`` and ``cursor`` for keyset pagination, ``fields`` to
+    choose the returned columns and ``format=ndjson`` to stream one JSON
+    object per line as rows are read.
+    """
+    services = get_services()
+    query = request.args.get('q')
+    skills_param = request.args.get('skills')
+    
+    match = request.args.get('match', 'any')
+    min_match = request.args.get('min_match', type=int)
+    if match not in ('any', 'all'):
+        return jsonify({'error': "match must be 'any' or 'all'"}), 400
+
+    stream = request.args.get('format') == 'ndjson' or request.accept_mimetypes.best == 'application/x-ndjson'
+    limit = request.args.get('limit', type=int)
+    if limit is None and not stream:
+        limit = SEARCH_PAGE_SIZE
+    if limit is not None:
+        limit = max(1, min(limit, SEARCH_MAX_PAGE_SIZE))
+    cursor = request.args.get('cursor')
+    fields = None
+    if request.args.get('fields'):
+        fields = [f.strip() for f in request.args['fields'].split(',') if f.strip()]
+    
+    skills = None
+    if skills_param:
+        skills = [s.strip() for s in skills_param.split(',') if s.strip()]
+        skills = [services.parser.skill_matcher.canonical(s) or s for s in skills]
+
+    search_args = dict(query=query, skills=skills, match=match, min_match=min_match,
+                       limit=limit, cursor=cursor, fields=fields)
+    try:
+        if stream:
+            rows = services.db_manager.iter_resumes(**search_args)
+            first = next(rows, None)
+
+            def generate():
+                if first is not None:
+                    yield json.dumps(first) + '\n'
+                for row in rows:
+                    yield json.dumps(row) + '\n'
+
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        results = services.db_manager.search_resumes(**search_args)
+        next_cursor = None
+        if limit and len(results) == limit:
+            next_cursor = services.db_manager.next_cursor(results[-1])
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'query': query,
+            'skills_filter': skills,
+            'skills_match': match if skills else None,
+            'next_cursor': next_cursor,
+            'results': results
+        })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Default and maximum number of /match results.
+MATCH_TOP_K = 10
+MATCH_MAX_TOP_K = 100
+
+@bp.route('/match', methods=['GET', 'POST'])
+def match_resumes():
+    """Rank stored resumes against a job description.
+
+    Takes ``description`` as JSON, form data or a query parameter, plus
+    optional ``top_k`` and ``explain`` (default on).
+    """
+    services = get_services()
+    payload = request.get_json(silent=True) or {}
+    description = payload.get('description') or request.values.get('description', '')
+    if not description.strip():
+        return jsonify({'error': 'A job description is required'}), 400
+    try:
+        top_k = int(payload.get('top_k') or request.values.get('top_k') or MATCH_TOP_K)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'top_k must be an integer'}), 400
+    top_k = min(max(top_k, 1), MATCH_MAX_TOP_K)
+    explain = str(payload.get('explain', request.values.get('explain', '1'))).lower() not in ('0', 'false', 'no')
+
+    started = time.perf_counter()
+    try:
+        result = services.match_engine.match(description, top_k=top_k, explain=explain)
+    except ImportError as e:
+        return jsonify({'error': f'Matching needs numpy and scipy: {e}'}), 501
+    except Exception as e:
+        return jsonify({'error': f'Matching failed: {str(e)}'}), 500
+    return jsonify({'success': True, 'took_ms': round((time.perf_counter() - started) * 1000, 1), **result})
+
+# Default and maximum number of clusters per /duplicates page.
+DUPLICATES_PAGE_SIZE = 50
+DUPLICATES_MAX_PAGE_SIZE = 500
+
+@bp.route('/duplicates')
+def list_duplicates():
+    """List clusters of near-duplicate resumes, newest first, with ``limit`` and ``cursor`` paging."""
+    services = get_services()
+    limit = min(max(request.args.get('limit', DUPLICATES_PAGE_SIZE, type=int), 1), DUPLICATES_MAX_PAGE_SIZE)
+    try:
+        clusters, next_cursor = services.db_manager.duplicate_clusters(limit, request.args.get('cursor'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'success': True,
+        'count': len(clusters),
+        'threshold': services.db_manager.duplicate_threshold,
+        'next_cursor': next_cursor,
+        'clusters': clusters,
+    })
+
+@bp.route('/export/<table>')
+def export_table(table):
+    """Stream one table (resumes, education, experience or skills) as Parquet, Arrow or CSV.
+
+    ``since_id`` and ``since`` limit the export to newer resumes; the
+    ``X-Export-Until-Id`` header is the ``since_id`` for the next
+    incremental export. ``include_text=1`` adds raw_text to ``resumes``.
+    """
+    services = get_services()
+    exporter = ResumeExporter(services.db_manager, include_text=request.args.get('include_text') == '1')
+    fmt = request.args.get('format') or exporter.default_format()
+    since_id = request.args.get('since_id', 0, type=int)
+    try:
+        since = exporter.normalize_since(request.args.get('since'))
+        exporter.columns(table)
+        if fmt not in exporter.FORMATS:
+            raise ValueError(f"format must be one of {', '.join(exporter.FORMATS)}")
+        if fmt != 'csv':
+            import pyarrow  # noqa: F401
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except ImportError as e:
+        return jsonify({'error': f'{fmt} export needs pyarrow: {e}'}), 501
+
+    until_id = exporter.watermark()
+    sink = _ExportSink()
+
+    def generate():
+        for _ in exporter.write(table, sink, fmt, since_id=since_id, until_id=until_id, since=since):
+            data = sink.drain()
+            if data:
+                yield data
+        yield sink.drain()
+
+    return Response(stream_with_context(generate()), mimetype=exporter.MIMETYPES[fmt], headers={
+        'Content-Disposition': f'attachment; filename={table}{exporter.EXTENSIONS[fmt]}',
+        'X-Export-Until-Id': str(until_id),
+    })
+
+# Default and maximum sizes for the /api/stats top-skills list and daily series.
+STATS_TOP_SKILLS = 20
+STATS_DAYS = 30
+STATS_MAX = 365
+
+@bp.route('/api/stats')
+def get_stats():
+    """Get database statistics.
+
+    Served from incrementally maintained aggregate tables through a short
+    TTL cache, so the cost does not grow with the number of resumes.
+    """
+    services = get_services()
+    try:
+        top = min(max(request.args.get('top', STATS_TOP_SKILLS, type=int), 1), STATS_MAX)
+        days = min(max(request.args.get('days', STATS_DAYS, type=int), 1), STATS_MAX)
+        stats, age = services.stats_cache.get(top_skills=top, days=days)
+
+        matcher = services.parser.skill_matcher
+        top_skills = []
+        for entry in stats['top_skills']:
+            name = matcher.canonical(entry['skill']) or entry['skill']
+            top_skills.append({**entry, 'skill': name, 'category': matcher.categories.get(name)})
+
+        return jsonify({
+            'success': True,
+            'stats': {
+                **stats,
+                'top_skills': top_skills,
+                'database_file': services.db_manager.db_path,
+                'cache_age_seconds': round(age, 3),
+            }
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.cli.command('ingest')
+@click.argument('sources', nargs=-1)
+@click.option('--manifest', type=click.Path(exists=True, dir_okay=False), help='File listing one resume path per line.')
+@click.option('--workers', type=int, default=None, help='Number of parser processes (default: CPU count).')
+@click.option('--batch-size', type=int, default=50, show_default=True, help='Resumes committed per transaction.')
+@click.option('--chunk-size', type=int, default=16, show_default=True, help='Files per worker task (NER batch size).')
+@click.option('--retry-failed', is_flag=True, help='Re-parse files that failed in a previous run.')
+def ingest_command(sources, manifest, workers, batch_size, chunk_size, retry_failed):
+    """Bulk-ingest resumes from directories, glob patterns or a manifest."""
+    services = get_services()
+    paths = collect_resume_paths(list(sources), manifest)
+    if not paths:
+        raise click.UsageError('No PDF or DOCX files found in the given sources.')
+
+    print(f"📂 Found {len(paths)} resume files")
+    ingestor = BulkIngestor(services.db_manager, workers=workers, batch_size=batch_size,
+                            chunksize=chunk_size, parser_options=parser_options(current_app.config))
+    stats = ingestor.run(paths, retry_failed=retry_failed)
+
+    elapsed = stats['elapsed_seconds']
+    rate = (stats['stored'] + stats['failed']) / elapsed if elapsed > 0 else 0.0
+    print(f"✅ Stored {stats['stored']}, failed {stats['failed']}, "
+          f"skipped {stats['skipped']} already ingested in {elapsed:.1f}s ({rate:.1f} files/s)")
+
+
+@bp.cli.command('contacts')
+@click.argument('sources', nargs=-1)
+@click.option('--manifest', type=click.Path(exists=True, dir_okay=False), help='File listing one resume path per line.')
+def contacts_command(sources, manifest):
+    """Print the contact details of resumes as JSON lines without storing them.
+
+    PDFs are only read until an email address and a phone number are found.
+    """
+    services = get_services()
+    paths = collect_resume_paths(list(sources), manifest)
+    if not paths:
+        raise click.UsageError('No PDF or DOCX files found in the given sources.')
+    for path in paths:
+        try:
+            contact_info, extraction = services.parser.extract_contact_from_file(path)
+        except Exception as e:
+            print(json.dumps({'path': path, 'error': f"{type(e).__name__}: {e}"}))
+            continue
+        print(json.dumps({'path': path, **asdict(contact_info), 'extraction': extraction_summary(extraction)}))
+
+
+@bp.cli.command('reextract')
+@click.option('--workers', type=int, default=None, help='Number of parser processes (default: CPU count).')
+@click.option('--chunk-size', type=int, default=64, show_default=True, help='Resumes per worker task (NER batch size).')
+@click.option('--max-rate', type=float, default=None, help='Upper bound on resumes re-extracted per second.')
+@click.option('--pause', type=float, default=0.0, show_default=True, help='Seconds to sleep between write transactions.')
+@click.option('--limit', type=int, default=None, help='Stop after this many resumes.')
+@click.option('--dry-run', is_flag=True, help='Only report how many resumes are out of date.')
+def reextract_command(workers, chunk_size, max_rate, pause, limit, dry_run):
+    """Rerun the text extractors over stored raw text for resumes extracted by an older version."""
+    services = get_services()
+    reextractor = Reextractor(services.db_manager, workers=workers, chunksize=chunk_size, max_rate=max_rate,
+                              pause=pause, parser_options=parser_options(current_app.config))
+    pending = reextractor.pending()
+    print(f"🔎 {pending} resumes are not at extractor version {reextractor.version}")
+    if dry_run or not pending:
+        return
+
+    stats = reextractor.run(limit=limit)
+    services.stats_cache.clear()
+    print(f"✅ Updated {stats['updated']}, failed {stats['failed']} in {stats['elapsed_seconds']:.1f}s")
+    # The TF-IDF index only picks up new ids, so refresh the saved copy for changed skills.
+    path = current_app.config['MATCH_INDEX_PATH']
+    if stats['updated'] and path:
+        services.match_engine.rebuild()
+        services.match_engine.save(path)
+        print(f"🧮 Rebuilt the match index -> {path}.npz")
+
+
+@bp.cli.command('export')
+@click.argument('directory')
+@click.option('--format', 'fmt', type=click.Choice(ResumeExporter.FORMATS), default=None,
+              help='Default: parquet when pyarrow is installed, otherwise csv.')
+@click.option('--table', 'tables', multiple=True, type=click.Choice(list(ResumeExporter.TABLES)),
+              help='Table to export; repeat for several (default: all).')
+@click.option('--since-id', type=int, default=0, show_default=True, help='Only resumes with a higher id.')
+@click.option('--since', default=None, help='Only resumes created at or after this ISO date/time.')
+@click.option('--since-manifest', type=click.Path(exists=True, dir_okay=False),
+              help="Continue after a previous export's manifest.json.")
+@click.option('--include-text', is_flag=True, help='Add raw_text to the resumes table.')
+@click.option('--chunk-size', type=int, default=5000, show_default=True, help='Resumes read per chunk.')
+def export_command(directory, fmt, tables, since_id, since, since_manifest, include_text, chunk_size):
+    """Export resumes, education, experience and skills as columnar files for analytics."""
+    services = get_services()
+    if since_manifest:
+        with open(since_manifest, encoding='utf-8') as f:
+            since_id = max(since_id, json.load(f)['until_id'])
+    exporter = ResumeExporter(services.db_manager, chunk_size=chunk_size, include_text=include_text)
+    started = time.monotonic()
+    try:
+        manifest = exporter.export(directory, fmt=fmt, tables=list(tables) or None, since_id=since_id, since=since)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    for table, info in manifest['tables'].items():
+        print(f"📦 {table}: {info['rows']} rows -> {os.path.join(directory, info['file'])}")
+    print(f"✅ Exported resumes {manifest['since_id'] + 1}-{manifest['until_id']} as {manifest['format']} "
+          f"in {time.monotonic() - started:.1f}s")
+
+
+@bp.cli.command('prune-uploads')
+@click.option('--max-bytes', type=int, default=None, help='Override ARCHIVE_MAX_BYTES (0 = no size limit).')
+@click.option('--max-age-days', type=float, default=None, help='Override ARCHIVE_MAX_AGE_DAYS (0 = no age limit).')
+def prune_uploads_command(max_bytes, max_age_days):
+    """Apply the upload archive's retention policy to UPLOAD_FOLDER now."""
+    config = current_app.config
+    archive = UploadArchive(
+        config['UPLOAD_FOLDER'],
+        max_bytes=config['ARCHIVE_MAX_BYTES'] if max_bytes is None else max_bytes,
+        max_age_days=config['ARCHIVE_MAX_AGE_DAYS'] if max_age_days is None else max_age_days,
+    )
+    report = archive.prune()
+    print(f"🧹 Deleted {report['deleted']} file(s), freed {report['freed_bytes']} bytes; "
+          f"{report['files']} file(s) / {report['size_bytes']} bytes kept in {config['UPLOAD_FOLDER']}")
+
+
+@bp.cli.command('rebuild-stats')
+def rebuild_stats_command():
+    """Recompute the aggregate tables behind /api/stats from scratch."""
+    started = time.monotonic()
+    services = get_services()
+    services.db_manager.rebuild_stats()
+    services.stats_cache.clear()
+    stats = services.db_manager.get_stats(top_skills=0, days=0)
+    print(f"📊 Rebuilt stats for {stats['total_resumes']} resumes in {time.monotonic() - started:.1f}s")
+
+
+@bp.cli.command('rebuild-fulltext')
+def rebuild_fulltext_command():
+    """Rebuild the full-text search index, e.g. after resumes were changed outside the app."""
+    services = get_services()
+    if not services.db_manager.has_fulltext_index:
+        raise click.UsageError("This database has no full-text index (SQLite built without FTS5)")
+    started = time.monotonic()
+    services.db_manager.rebuild_fulltext_index()
+    print(f"🔎 Rebuilt the full-text index in {time.monotonic() - started:.1f}s")
+
+
+@bp.cli.command('delete-resumes')
+@click.argument('resume_ids', nargs=-1, type=int, required=True)
+def delete_resumes_command(resume_ids):
+    """Delete stored resumes together with their text, child rows and index entries."""
+    services = get_services()
+    deleted = services.db_manager.delete_resumes(list(resume_ids))
+    services.stats_cache.clear()
+    print(f"🗑️  Deleted {deleted} resume(s)")
+    path = current_app.config['MATCH_INDEX_PATH']
+    if deleted and path:
+        services.match_engine.rebuild()
+        services.match_engine.save(path)
+        print(f"🧮 Rebuilt the match index -> {path}.npz")
+
+
+@bp.cli.command('build-match-index')
+@click.option('--output', default=None, help='Index path (default: MATCH_INDEX_PATH).')
+def build_match_index_command(output):
+    """Rebuild the /match TF-IDF index from every stored resume and save it."""
+    services = get_services()
+    path = output or current_app.config['MATCH_INDEX_PATH']
+    if not path:
+        raise click.UsageError("Set RESUME_MATCH_INDEX or pass --output")
+    started = time.monotonic()
+    services.match_engine.rebuild()
+    services.match_engine.save(path)
+    stats = services.match_engine.stats()
+    print(f"🧮 Indexed {stats['indexed']} resumes ({stats['terms']} terms, {stats['nonzeros']} non-zeros) "
+          f"in {time.monotonic() - started:.1f}s -> {path}.npz")
+
+
+@bp.cli.command('backfill-minhash')
+@click.option('--batch-size', type=int, default=500, show_default=True, help='Resumes hashed per transaction.')
+def backfill_minhash_command(batch_size):
+    """Hash resumes stored before duplicate detection and flag the near-duplicates among them."""
+    services = get_services()
+    started = time.monotonic()
+    done = 0
+    for count in services.db_manager.backfill_minhash(batch_size=batch_size):
+        done += count
+        print(f"🔁 Hashed {done} resumes")
+    print(f"✅ Backfilled {done} resumes in {time.monotonic() - started:.1f}s")
+
+
+@bp.cli.command('train-text-dictionary')
+@click.option('--sample', type=int, default=2000, show_default=True, help='Stored resumes to train on.')
+@click.option('--size', type=int, default=32 * 1024, show_default=True, help='Dictionary size in bytes (zlib uses at most 32 KiB).')
+def train_text_dictionary_command(sample, size):
+    """Train a raw text compression dictionary; resumes stored from now on use it."""
+    services = get_services()
+    dictionary_id = services.db_manager.train_text_dictionary(sample=sample, size=size)
+    if dictionary_id is None:
+        raise click.ClickException('No stored resumes to train on.')
+    print(f"📖 Trained {services.db_manager.text_codec.codec} dictionary {dictionary_id} from up to {sample} resumes")
+
+
+@bp.cli.command('compact-db')
+def compact_db_command():
+    """VACUUM the database and report raw text compression figures."""
+    services = get_services()
+    before = services.db_manager.text_stats()
+    started = time.monotonic()
+    services.db_manager.compact()
+    after = services.db_manager.text_stats()
+    print(f"🗜️  {after['documents']} documents: {after['text_bytes']} bytes of text stored in "
+          f"{after['compressed_bytes']} (x{after['ratio']})")
+    print(f"✅ Database {before['database_bytes']} -> {after['database_bytes']} bytes "
+          f"in {time.monotonic() - started:.1f}s")
+
+
+@bp.cli.command('warmup')
+def warmup_command():
+    """Load the NLP model and report how long it took."""
+    started = time.monotonic()
+    get_services().warm_up(background=False)
+    print(f"✅ Parser loaded in {time.monotonic() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    app = create_app()
+    print("🚀 Resume Parser System Starting...")
+    print(f"📂 Database: SQLite ({app.config['DATABASE']})")
+    print("🌐 Web Interface: http://localhost:5000")
+    print("💻 Perfect for VS Code development!")
+    print(f"📬 Upload mode: {app.config['UPLOAD_MODE']}")
+    print("\n" + "="*50)
+    
     app.run(debug=True, port=5000, host='0.0.0.0')
\ No newline at end of file
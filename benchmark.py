@@ -0,0 +1,584 @@
+"""Micro-benchmarks for the resume parser.
+
+Usage:
+    python benchmark.py skills [--skills 10000] [--words 1500] [--runs 20]
+    python benchmark.py ner [--docs 500] [--batch-size 32] [--n-process 1]
+    python benchmark.py sections [--jobs 40] [--runs 20]
+    python benchmark.py match [--resumes 100000] [--runs 50] [--top-k 10]
+    python benchmark.py docx [--jobs 50,500,5000] [--runs 5]
+    python benchmark.py suite [--docs 40] [--search-sizes 1000,10000,100000]
+                              [--output results.json] [--baseline baseline.json]
+                              [--save-baseline baseline.json] [--threshold 0.25]
+
+``suite`` exits with status 1 when a stage is slower than the baseline by
+more than ``--threshold`` (and ``--min-delta-ms``).
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app import MatchEngine, ResumeParser, SQLiteDatabaseManager, SkillMatcher
+
+
+def legacy_extract_skills(skill_keywords: Dict[str, List[str]], text: str) -> List[str]:
+    """The original nested substring loop, kept for comparison."""
+    text_lower = text.lower()
+    found_skills = []
+    for category, skills in skill_keywords.items():
+        for skill in skills:
+            if skill.lower() in text_lower:
+                found_skills.append(skill.title())
+    return list(dict.fromkeys(found_skills))
+
+
+def legacy_extract_docx(path: str) -> str:
+    """The python-docx extractor the streaming reader replaced: body paragraphs only."""
+    from docx import Document
+
+    return ''.join(paragraph.text + "\n" for paragraph in Document(path).paragraphs)
+
+
+def time_call(fn: Callable, runs: int) -> Dict:
+    """Run ``fn`` repeatedly and return latency statistics in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        'runs': runs,
+        'p50_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'max_ms': round(samples[-1], 3),
+    }
+
+
+def synthetic_taxonomy(size: int, rng: random.Random) -> Dict[str, Dict[str, List[str]]]:
+    """Build a taxonomy of ``size`` made-up skills, some multi-word, some with aliases."""
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    taxonomy = {f"category{i}": {} for i in range(20)}
+    names = set()
+    while len(names) < size:
+        words = [''.join(rng.choice(alphabet) for _ in range(rng.randint(3, 9)))
+                 for _ in range(rng.choice((1, 1, 1, 2, 3)))]
+        names.add(' '.join(words))
+    for name in sorted(names):
+        aliases = [name.replace(' ', '')] if ' ' in name else []
+        taxonomy[f"category{rng.randrange(20)}"][name] = aliases
+    return taxonomy
+
+
+def synthetic_text(taxonomy: Dict[str, Dict[str, List[str]]], words: int, rng: random.Random) -> str:
+    """Build resume-like text that mentions a sample of the taxonomy's skills."""
+    filler = ('experience team project developed built led designed implemented '
+              'using with and for the in of responsible improved').split()
+    skills = [name for skills in taxonomy.values() for name in skills]
+    tokens = []
+    while len(tokens) < words:
+        if rng.random() < 0.05:
+            tokens.append(rng.choice(skills))
+        else:
+            tokens.append(rng.choice(filler))
+    return ' '.join(tokens)
+
+
+FIRST_NAMES = ['Aarav', 'Priya', 'John', 'Maria', 'Wei', 'Fatima', 'Lucas', 'Ananya', 'David', 'Sofia']
+LAST_NAMES = ['Sharma', 'Smith', 'Garcia', 'Chen', 'Khan', 'Müller', 'Patel', 'Silva', 'Johnson', 'Das']
+
+
+def synthetic_resume_header(rng: random.Random) -> str:
+    """Build the first ~1000 characters of a resume: name, contact line and summary."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    summary = ' '.join(rng.choice(
+        'experienced engineer building scalable services with a focus on reliability data quality and teamwork'.split()
+    ) for _ in range(120))
+    return (f"{first} {last}\n{first.lower()}.{last.lower()}@example.com | +1 555 {rng.randint(100, 999)} "
+            f"{rng.randint(1000, 9999)}\nlinkedin.com/in/{first.lower()}{last.lower()}\n\nSUMMARY\n{summary}")
+
+
+JOB_TITLES = ['Software Engineer', 'Senior Developer', 'Data Analyst', 'Project Manager', 'Lead Engineer',
+              'Junior Developer', 'Research Intern', 'Product Specialist']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries', 'Wayne Tech']
+DEGREES = ['Bachelor of Technology in Computer Science', 'Master of Science in Data Science',
+           'B.Sc. Mathematics, Calcutta University', 'MBA in Operations Management']
+SKILL_NAMES = ['Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL', 'PostgreSQL', 'Docker', 'Kubernetes',
+               'AWS', 'Pandas', 'TensorFlow', 'Git', 'Jira', 'Machine Learning', 'Flask', 'Django']
+BULLETS = ['Designed and shipped features used by thousands of customers every day',
+           'Reduced report generation time by rewriting slow database queries',
+           'Mentored new team members and reviewed pull requests',
+           'Automated deployments and monitoring for a fleet of services',
+           'Worked with stakeholders to turn requirements into milestones']
+
+
+def synthetic_resume_text(rng: random.Random, jobs: int = 4, bullets: int = 4) -> str:
+    """Build a resume with the usual headed sections; ``jobs`` controls its length."""
+    lines = [synthetic_resume_header(rng).split('\n\nSUMMARY')[0], '', 'PROFESSIONAL SUMMARY',
+             'Engineer with experience in ' + ', '.join(rng.sample(SKILL_NAMES, 4)) + '.', '', 'WORK EXPERIENCE']
+    for _ in range(jobs):
+        lines.append(f"{rng.choice(JOB_TITLES)} - {rng.choice(COMPANIES)} ({rng.randint(2010, 2023)} - Present)")
+        for _ in range(bullets):
+            lines.append(f"- {rng.choice(BULLETS)} using {rng.choice(SKILL_NAMES)}")
+    lines += ['', 'EDUCATION', *rng.sample(DEGREES, 2), '', 'SKILLS', ', '.join(rng.sample(SKILL_NAMES, 8)),
+              '', 'PROJECTS', f"Built a {rng.choice(SKILL_NAMES)} dashboard for tracking applications"]
+    return '\n'.join(lines) + '\n'
+
+
+def bench_sections(args):
+    rng = random.Random(args.seed)
+    text = synthetic_resume_text(rng, jobs=args.jobs)
+    parser = ResumeParser()
+    parser.nlp = None
+    sections = parser.segment_sections(text)
+
+    def scope(*names):
+        return '\n'.join(sections[name] for name in names if name in sections)
+
+    stages = {
+        'extract_contact_info': (parser.extract_contact_info, scope('contact')),
+        'extract_skills': (parser.extract_skills, scope('skills', 'summary', 'experience', 'other')),
+        'extract_education': (parser.extract_education, scope('education')),
+        'extract_experience': (parser.extract_experience, scope('experience')),
+    }
+    results = {'segment_sections': time_call(lambda: parser.segment_sections(text), args.runs)}
+    for stage, (extractor, section_text) in stages.items():
+        results[stage] = {
+            'whole_text': time_call(lambda: extractor(text), args.runs),
+            'section_only': time_call(lambda: extractor(section_text), args.runs),
+        }
+    results['parse_text_total'] = time_call(lambda: parser.parse_text(text), args.runs)
+
+    print(json.dumps({
+        'benchmark': 'sections',
+        'characters': len(text),
+        'sections': {name: len(body) for name, body in sections.items()},
+        'stages': results,
+    }, indent=2))
+
+
+def write_pdf(path: str, pages: List[List[Tuple[int, List[str]]]], font_size: int = 11):
+    """Write a minimal text-only PDF.
+
+    Each page is a list of ``(x, lines)`` blocks; blocks at different ``x``
+    give a multi-column layout.
+    """
+    def escape(text):
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    leading = font_size + 3
+    kids = ' '.join(f'{4 + 2 * i} 0 R' for i in range(len(pages)))
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i, blocks in enumerate(pages):
+        stream = ' '.join(
+            f'BT /F1 {font_size} Tf {leading} TL {x} 780 Td '
+            + ' '.join(f'({escape(line)}) Tj T*' for line in lines) + ' ET'
+            for x, lines in blocks
+        )
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>')
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+
+    out = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1', 'replace')
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    out += b''.join(f'{offset:010d} 00000 n \n'.encode() for offset in offsets)
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+def write_docx(path: str, lines: List[str], layout: str):
+    """Write a DOCX resume; the ``table`` layout puts the skills into a table."""
+    from docx import Document
+
+    doc = Document()
+    in_skills = False
+    for line in lines:
+        heading = line.isupper() and len(line) < 40
+        if heading:
+            in_skills = line == 'SKILLS'
+            if layout == 'styled':
+                doc.add_heading(line.title(), level=2)
+                continue
+        if in_skills and layout == 'table' and not heading and line:
+            skills = [skill.strip() for skill in line.split(',')]
+            table = doc.add_table(rows=(len(skills) + 1) // 2, cols=2)
+            for index, skill in enumerate(skills):
+                table.cell(index // 2, index % 2).text = skill
+            continue
+        doc.add_paragraph(line)
+    doc.save(path)
+
+
+def build_corpus(directory: str, docs: int, seed: int) -> List[Dict]:
+    """Generate ``docs`` PDF and DOCX resumes of varied length and layout.
+
+    The same seed always produces the same files. Returns one entry per
+    file with its ``path``, ``format``, ``layout`` and line count.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    corpus = []
+    for i in range(docs):
+        jobs = rng.choice((1, 2, 4, 8, 16, 32))
+        lines = synthetic_resume_text(rng, jobs=jobs, bullets=rng.randint(2, 6)).split('\n')
+        if i % 2 == 0:
+            layout = rng.choice(('single', 'two_column', 'dense'))
+            path = os.path.join(directory, f'resume_{i:04d}.pdf')
+            write_pdf(path, pdf_pages(lines, layout), font_size=8 if layout == 'dense' else 11)
+        else:
+            layout = rng.choice(('plain', 'styled', 'table'))
+            path = os.path.join(directory, f'resume_{i:04d}.docx')
+            write_docx(path, lines, layout)
+        corpus.append({'path': path, 'format': path.rsplit('.', 1)[1], 'layout': layout, 'lines': len(lines)})
+    return corpus
+
+
+def pdf_pages(lines: List[str], layout: str) -> List[List[Tuple[int, List[str]]]]:
+    """Lay resume lines out on pages; ``two_column`` moves education and skills to a side column."""
+    per_page = 80 if layout == 'dense' else 50
+    side = []
+    if layout == 'two_column' and 'EDUCATION' in lines:
+        start = lines.index('EDUCATION')
+        side, lines = lines[start:], lines[:start]
+    pages = [[(50, lines[i:i + per_page])] for i in range(0, max(len(lines), 1), per_page)]
+    if side:
+        pages[0].append((360, side))
+    return pages
+
+
+def measure_stage(fn: Callable, items: List, repeat: int = 1) -> Dict:
+    """Time ``fn(item)`` for every item, then rerun once under tracemalloc for peak memory."""
+    samples = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            call_started = time.perf_counter()
+            fn(item)
+            samples.append((time.perf_counter() - call_started) * 1000)
+    total = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        for item in items:
+            fn(item)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    return {
+        'calls': len(samples),
+        'p50_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'max_ms': round(samples[-1], 3),
+        'throughput_per_sec': round(len(samples) / total, 1) if total else None,
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+SEARCH_QUERIES = {
+    'skills_any': {'skills': ['python', 'docker']},
+    'skills_all': {'skills': ['python', 'docker', 'sql'], 'match': 'all'},
+    'text': {'query': 'engineer'},
+    'browse': {},
+}
+
+
+def bench_search(db_path: str, parsed: List, sizes: List[int], runs: int, page_size: int) -> Dict:
+    """Grow one database to each size in turn and time every search query at that size."""
+    db = SQLiteDatabaseManager(db_path)
+    results = {}
+    rows = 0
+    for size in sorted(sizes):
+        while rows < size:
+            batch = [parsed[(rows + i) % len(parsed)] for i in range(min(1000, size - rows))]
+            db.store_resumes(batch)
+            rows += len(batch)
+        db.get_connection().execute("ANALYZE")
+        for name, kwargs in SEARCH_QUERIES.items():
+            results[f'search_resumes.{name}@{size}'] = measure_stage(
+                lambda _: db.search_resumes(limit=page_size, **kwargs), [None] * runs
+            )
+    db.close_connection()
+    return results
+
+
+def compare_to_baseline(results: Dict, baseline: Dict, threshold: float, min_delta_ms: float) -> List[Dict]:
+    """Return the stages whose p50 regressed past the threshold relative to the baseline."""
+    regressions = []
+    for stage, current in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous or not previous.get('p50_ms'):
+            continue
+        delta = current['p50_ms'] - previous['p50_ms']
+        ratio = current['p50_ms'] / previous['p50_ms']
+        if ratio > 1 + threshold and delta > min_delta_ms:
+            regressions.append({
+                'stage': stage,
+                'baseline_p50_ms': previous['p50_ms'],
+                'p50_ms': current['p50_ms'],
+                'ratio': round(ratio, 2),
+            })
+    return regressions
+
+
+def bench_suite(args):
+    parser = ResumeParser()
+    with contextlib.redirect_stdout(sys.stderr):
+        parser.load()  # keep model warnings out of the JSON on stdout
+    sizes = [int(size) for size in args.search_sizes.split(',') if size]
+    stages = {}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus = build_corpus(args.corpus or os.path.join(workdir, 'corpus'), args.docs, args.seed)
+        pdfs = [entry['path'] for entry in corpus if entry['format'] == 'pdf']
+        docxs = [entry['path'] for entry in corpus if entry['format'] == 'docx']
+
+        stages['extract_text_from_pdf'] = measure_stage(parser.extract_text_from_pdf, pdfs, args.repeat)
+        stages['extract_text_from_docx'] = measure_stage(parser.extract_text_from_docx, docxs, args.repeat)
+
+        texts = [parser.extract_text(entry['path']) for entry in corpus]
+        for stage in ('extract_contact_info', 'extract_skills', 'extract_education', 'extract_experience'):
+            stages[stage] = measure_stage(getattr(parser, stage), texts, args.repeat)
+
+        parsed = [parser.parse_text(text) for text in texts]
+        db = SQLiteDatabaseManager(os.path.join(workdir, 'store.db'))
+        stages['store_resume'] = measure_stage(db.store_resume, parsed, args.repeat)
+        db.close_connection()
+
+        if sizes:
+            stages.update(bench_search(os.path.join(workdir, 'search.db'), parsed, sizes,
+                                       args.search_runs, args.page_size))
+
+    results = {
+        'benchmark': 'suite',
+        'seed': args.seed,
+        'corpus': {
+            'docs': len(corpus),
+            'pdf': len(pdfs),
+            'docx': len(docxs),
+            'characters_p50': int(statistics.median(len(text) for text in texts)),
+            'characters_max': max(len(text) for text in texts),
+        },
+        'nlp_loaded': parser.nlp is not None,
+        'stages': stages,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.min_delta_ms)
+        results['baseline'] = {'path': args.baseline, 'threshold': args.threshold, 'regressions': regressions}
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w') as f:
+            f.write(output + '\n')
+
+    for regression in regressions:
+        print(f"❌ {regression['stage']}: p50 {regression['baseline_p50_ms']} ms -> "
+              f"{regression['p50_ms']} ms ({regression['ratio']}x)", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+JOB_DESCRIPTIONS = [
+    'Senior Python developer with Docker, Kubernetes and PostgreSQL experience to build data pipelines',
+    'Frontend engineer: React, JavaScript, Node.js; mentoring junior developers',
+    'Data analyst comfortable with SQL, Pandas and TensorFlow, reporting to stakeholders',
+    'Project manager for an agile team shipping features to customers, Jira and Git',
+]
+
+
+def bench_match(args):
+    rng = random.Random(args.seed)
+    parser = ResumeParser()
+    parser.nlp = None
+    templates = [parser.parse_text(synthetic_resume_text(rng, jobs=rng.choice((1, 2, 4, 8)))) for _ in range(200)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = SQLiteDatabaseManager(os.path.join(workdir, 'match.db'))
+        for start in range(0, args.resumes, 1000):
+            db.store_resumes([templates[(start + i) % len(templates)]
+                              for i in range(min(1000, args.resumes - start))])
+
+        engine = MatchEngine(db, parser.skill_matcher)
+        started = time.perf_counter()
+        engine.sync()
+        engine.match(JOB_DESCRIPTIONS[0], top_k=args.top_k)
+        build_seconds = time.perf_counter() - started
+
+        queries = [JOB_DESCRIPTIONS[i % len(JOB_DESCRIPTIONS)] for i in range(args.runs)]
+        results = {
+            'ranking_only': measure_stage(lambda jd: engine.match(jd, top_k=args.top_k, explain=False), queries),
+            'with_explanations': measure_stage(lambda jd: engine.match(jd, top_k=args.top_k), queries),
+        }
+
+        db.store_resumes(templates[:10])
+        started = time.perf_counter()
+        engine.match(JOB_DESCRIPTIONS[0], top_k=args.top_k)
+        incremental_ms = (time.perf_counter() - started) * 1000
+        db.close_connection()
+
+    print(json.dumps({
+        'benchmark': 'match',
+        'resumes': args.resumes,
+        'index': engine.stats(),
+        'build_seconds': round(build_seconds, 2),
+        'query_after_10_new_resumes_ms': round(incremental_ms, 1),
+        'queries': results,
+    }, indent=2))
+
+
+def bench_docx(args):
+    rng = random.Random(args.seed)
+    parser = ResumeParser()
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for jobs in (int(jobs) for jobs in args.jobs.split(',') if jobs):
+            path = os.path.join(workdir, f'resume-{jobs}.docx')
+            write_docx(path, synthetic_resume_text(rng, jobs=jobs).split('\n'), 'table')
+            streamed = parser.extract_docx(path, max_chars=0).text
+            legacy = legacy_extract_docx(path)
+            results[f'{jobs}_jobs'] = {
+                'file_kb': round(os.path.getsize(path) / 1024, 1),
+                'streaming_chars': len(streamed),
+                'python_docx_chars': len(legacy),
+                'streaming': measure_stage(lambda p: parser.extract_docx(p, max_chars=0), [path] * args.runs),
+                'python_docx': measure_stage(legacy_extract_docx, [path] * args.runs),
+            }
+
+    print(json.dumps({'benchmark': 'docx', 'results': results}, indent=2))
+
+
+def bench_ner(args):
+    import spacy
+
+    rng = random.Random(args.seed)
+    texts = [synthetic_resume_header(rng) for _ in range(args.docs)]
+
+    full_nlp = spacy.load("en_core_web_sm")
+    parser = ResumeParser()
+
+    started = time.perf_counter()
+    for text in texts:
+        doc = full_nlp(text[:1000])
+        [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
+    per_doc_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parser.extract_names(texts, batch_size=args.batch_size, n_process=args.n_process)
+    batched_seconds = time.perf_counter() - started
+
+    print(json.dumps({
+        'benchmark': 'ner',
+        'docs': args.docs,
+        'full_pipeline_pipes': full_nlp.pipe_names,
+        'trimmed_pipeline_pipes': [name for name, _ in parser.nlp.pipeline],
+        'per_doc_full_pipeline_docs_per_sec': round(args.docs / per_doc_seconds, 1),
+        'batched_trimmed_pipeline_docs_per_sec': round(args.docs / batched_seconds, 1),
+        'speedup': round(per_doc_seconds / batched_seconds, 2),
+    }, indent=2))
+
+
+def bench_skills(args):
+    rng = random.Random(args.seed)
+    taxonomy = synthetic_taxonomy(args.skills, rng)
+    text = synthetic_text(taxonomy, args.words, rng)
+    legacy_keywords = {category: list(skills) for category, skills in taxonomy.items()}
+
+    started = time.perf_counter()
+    matcher = SkillMatcher(taxonomy)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    legacy = time_call(lambda: legacy_extract_skills(legacy_keywords, text), args.runs)
+    compiled = time_call(lambda: matcher.find(text), args.runs)
+
+    print(json.dumps({
+        'benchmark': 'skills',
+        'skills': args.skills,
+        'words': args.words,
+        'matcher_compile_ms': round(compile_ms, 3),
+        'legacy_substring_loop': legacy,
+        'skill_matcher': compiled,
+        'speedup_p50': round(legacy['p50_ms'] / compiled['p50_ms'], 1) if compiled['p50_ms'] else None,
+    }, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    skills = subparsers.add_parser('skills', help='SkillMatcher vs the legacy substring loop')
+    skills.add_argument('--skills', type=int, default=10000, help='Taxonomy size')
+    skills.add_argument('--words', type=int, default=1500, help='Words per synthetic resume')
+    skills.add_argument('--runs', type=int, default=20)
+    skills.add_argument('--seed', type=int, default=7)
+    skills.set_defaults(func=bench_skills)
+
+    ner = subparsers.add_parser('ner', help='Batched nlp.pipe NER vs per-document calls')
+    ner.add_argument('--docs', type=int, default=500)
+    ner.add_argument('--batch-size', type=int, default=32)
+    ner.add_argument('--n-process', type=int, default=1)
+    ner.add_argument('--seed', type=int, default=7)
+    ner.set_defaults(func=bench_ner)
+
+    sections = subparsers.add_parser('sections', help='Per-stage timing of section-scoped vs whole-text extractors')
+    sections.add_argument('--jobs', type=int, default=40, help='Jobs in the synthetic resume (controls length)')
+    sections.add_argument('--runs', type=int, default=20)
+    sections.add_argument('--seed', type=int, default=7)
+    sections.set_defaults(func=bench_sections)
+
+    match = subparsers.add_parser('match', help='TF-IDF /match latency over a large stored corpus')
+    match.add_argument('--resumes', type=int, default=100000)
+    match.add_argument('--runs', type=int, default=50)
+    match.add_argument('--top-k', type=int, default=10)
+    match.add_argument('--seed', type=int, default=7)
+    match.set_defaults(func=bench_match)
+
+    docx = subparsers.add_parser('docx', help='Streaming DOCX reader vs the python-docx object model')
+    docx.add_argument('--jobs', default='50,500,5000', help='Jobs per synthetic resume, one file per value')
+    docx.add_argument('--runs', type=int, default=5)
+    docx.add_argument('--seed', type=int, default=7)
+    docx.set_defaults(func=bench_docx)
+
+    suite = subparsers.add_parser('suite', help='Per-stage timings on a synthetic PDF/DOCX corpus, with baseline checks')
+    suite.add_argument('--docs', type=int, default=40, help='Resumes in the corpus (half PDF, half DOCX)')
+    suite.add_argument('--corpus', help='Write the corpus here instead of a temporary directory')
+    suite.add_argument('--repeat', type=int, default=3, help='Passes over the corpus per stage')
+    suite.add_argument('--search-sizes', default='1000,10000,100000', help='Row counts to time search at')
+    suite.add_argument('--search-runs', type=int, default=20)
+    suite.add_argument('--page-size', type=int, default=100, help='Search limit, as used by /search')
+    suite.add_argument('--output', help='Also write the results JSON to this file')
+    suite.add_argument('--baseline', help='Results JSON to compare against')
+    suite.add_argument('--save-baseline', help='Write the results JSON here for later comparisons')
+    suite.add_argument('--threshold', type=float, default=0.25, help='Allowed p50 slowdown (0.25 = 25%%)')
+    suite.add_argument('--min-delta-ms', type=float, default=0.05, help='Ignore slowdowns smaller than this')
+    suite.add_argument('--seed', type=int, default=7)
+    suite.set_defaults(func=bench_suite)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
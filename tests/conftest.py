@@ -0,0 +1,123 @@
+import io
+import os
+import sys
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+SHIPPED_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resumes.db')
+
+
+RESUME_LINES = [
+    'Jane Doe',
+    'jane.doe@example.com | +1 555 123 4567 | linkedin.com/in/janedoe',
+    '',
+    'SUMMARY',
+    'Backend engineer building data pipelines.',
+    '',
+    'EXPERIENCE',
+    'Senior Software Engineer - Acme (2019 - Present)',
+    'Built services in Python and Go on Kubernetes.',
+    '',
+    'EDUCATION',
+    'Bachelor of Science in Computer Science from State University',
+    '',
+    'SKILLS',
+    'Python, Docker, PostgreSQL, AWS',
+]
+
+
+def docx_bytes(lines):
+    """A minimal Word document holding one paragraph per line."""
+    body = ''.join(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in lines)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('[Content_Types].xml', (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>'
+        ))
+        archive.writestr('word/document.xml', (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{body}</w:body></w:document>'
+        ))
+    return buffer.getvalue()
+
+
+def pdf_bytes(pages):
+    """A minimal PDF with one page per list of lines, set in Helvetica."""
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None, '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for lines in pages:
+        stream = 'BT /F1 11 Tf 14 TL 72 720 Td ' + ' '.join(f'({line}) Tj T*' for line in lines) + ' ET'
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+        objects.append('<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>')
+        kids.append(f'{len(objects)} 0 R')
+    objects[1] = f'<< /Type /Pages /Kids [{" ".join(kids)}] /Count {len(kids)} >>'
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1'))
+    xref = out.tell()
+    out.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode())
+    for offset in offsets:
+        out.write(f'{offset:010d} 00000 n \n'.encode())
+    out.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+    return out.getvalue()
+
+
+def wait_for_job(job_queue, job_id, timeout=10.0):
+    """Poll a queued upload until it leaves the queued/running states."""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = job_queue.get_job(job_id)
+        if job['status'] not in ('queued', 'running'):
+            return job
+        if time.monotonic() > deadline:
+            raise AssertionError(f"Job {job_id} still {job['status']} after {timeout}s")
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    db = app.SQLiteDatabaseManager(str(tmp_path / 'resumes.db'))
+    yield db
+    db.close_connection()
+
+
+@pytest.fixture
+def parser():
+    parser = app.ResumeParser()
+    parser.nlp = None  # names come from the first line; no spaCy model needed
+    return parser
+
+
+@pytest.fixture
+def job_queue(tmp_path, db_manager, parser):
+    return app.UploadJobQueue(
+        db_manager,
+        parser,
+        workers=1,
+        job_timeout=30,
+        parse_cache=app.ParseCache(db_manager),
+        spool_dir=str(tmp_path / 'pending'),
+    )
+
+
+@pytest.fixture
+def flask_app(tmp_path):
+    flask_app = app.create_app({'DATABASE': str(tmp_path / 'resumes.db'), 'UPLOAD_FOLDER': str(tmp_path / 'uploads')})
+    flask_app.extensions['resume_parser'].parser.nlp = None
+    return flask_app
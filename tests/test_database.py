@@ -0,0 +1,140 @@
+import shutil
+import sqlite3
+
+import pytest
+
+import app
+from conftest import RESUME_LINES, SHIPPED_DB
+
+def parsed(parser, name, extra=''):
+    return parser.parse_text('\n'.join([name] + RESUME_LINES[1:] + [extra]))
+
+
+def search_ids(db_manager, query):
+    return [row['id'] for row in db_manager.search_resumes(query=query, fields=['id'])]
+
+
+def name_ids(db_manager, name):
+    with db_manager.get_connection() as conn:
+        return [row[0] for row in conn.execute("SELECT rowid FROM resumes_fts WHERE resumes_fts MATCH ?",
+                                               (f'name:"{name}"',))]
+
+
+def assert_fulltext_consistent(db_manager):
+    with db_manager.get_connection() as conn:
+        conn.execute("INSERT INTO resumes_fts (resumes_fts, rank) VALUES ('integrity-check', 1)")
+
+
+def test_migrations_upgrade_the_shipped_database(tmp_path):
+    path = tmp_path / 'resumes.db'
+    shutil.copy(SHIPPED_DB, path)
+    with sqlite3.connect(path) as conn:
+        resumes = conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    db_manager = app.SQLiteDatabaseManager(str(path))
+    try:
+        with db_manager.get_connection() as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == len(db_manager.MIGRATIONS)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(resumes)")]
+            assert conn.execute("SELECT COUNT(*) FROM resume_text").fetchone()[0] == resumes
+        assert 'raw_text' not in columns
+        assert 'extractor_version' in columns
+        assert db_manager.get_stats()['total_resumes'] == resumes
+        assert_fulltext_consistent(db_manager)
+    finally:
+        db_manager.close_connection()
+
+    # Opening it again must find nothing left to migrate.
+    app.SQLiteDatabaseManager(str(path)).close_connection()
+
+
+def test_new_database_matches_the_migrated_schema(tmp_path):
+    shutil.copy(SHIPPED_DB, tmp_path / 'migrated.db')
+    schemas = {}
+    for name in ('migrated.db', 'new.db'):
+        db_manager = app.SQLiteDatabaseManager(str(tmp_path / name))
+        with db_manager.get_connection() as conn:
+            schemas[name] = {
+                'version': conn.execute("PRAGMA user_version").fetchone()[0],
+                'objects': set(conn.execute("SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'")),
+                'columns': {
+                    table: [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                    for table, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+                },
+            }
+        db_manager.close_connection()
+    assert schemas['new.db'] == schemas['migrated.db']
+
+
+def test_fulltext_index_follows_insert_update_and_delete(db_manager, parser):
+    first, second = db_manager.store_resumes([
+        parsed(parser, 'Alice Smith', 'Led the zeppelin project.'),
+        parsed(parser, 'Bob Jones', 'Maintained the dirigible fleet.'),
+    ])
+    assert search_ids(db_manager, 'zeppelin') == [first]
+    assert name_ids(db_manager, 'Alice') == [first]
+    assert_fulltext_consistent(db_manager)
+
+    renamed = parsed(parser, 'Alice Smith', 'Led the zeppelin project.')
+    renamed.contact_info.name = 'Carol White'
+    db_manager.update_resumes([(first, renamed)])
+    assert name_ids(db_manager, 'Alice') == []
+    assert name_ids(db_manager, 'Carol') == [first]
+    assert search_ids(db_manager, 'zeppelin') == [first]
+    assert_fulltext_consistent(db_manager)
+
+    assert db_manager.delete_resumes([first]) == 1
+    assert search_ids(db_manager, 'zeppelin') == []
+    assert search_ids(db_manager, 'dirigible') == [second]
+    assert not db_manager.resume_exists(first)
+    assert db_manager.get_stats()['total_resumes'] == 1
+    assert_fulltext_consistent(db_manager)
+
+
+def test_other_sqlite_clients_can_write(db_manager, parser):
+    resume_id, = db_manager.store_resumes([parsed(parser, 'Alice Smith')])
+
+    # A plain connection has no decompress_text function.
+    with sqlite3.connect(db_manager.db_path) as conn:
+        conn.execute("UPDATE resumes SET name = 'Alicia Smith' WHERE id = ?", (resume_id,))
+        conn.execute("INSERT INTO resumes (name) VALUES ('Dan Brown')")
+        conn.execute("DELETE FROM resumes WHERE id = ?", (resume_id,))
+        assert conn.execute("SELECT COUNT(*) FROM resume_text").fetchone()[0] == 0
+
+    db_manager.rebuild_fulltext_index()
+    assert search_ids(db_manager, 'Dan') == [resume_id + 1]
+    assert_fulltext_consistent(db_manager)
+
+
+def test_migration_keeps_an_empty_column_without_drop_column(tmp_path, monkeypatch):
+    path = tmp_path / 'resumes.db'
+    shutil.copy(SHIPPED_DB, path)
+    monkeypatch.setattr(app.sqlite3, 'sqlite_version_info', (3, 34, 1))
+
+    db_manager = app.SQLiteDatabaseManager(str(path))
+    try:
+        with db_manager.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM resumes WHERE raw_text IS NOT NULL").fetchone()[0] == 0
+            assert conn.execute("SELECT COUNT(*) FROM resume_text").fetchone()[0] > 0
+        assert_fulltext_consistent(db_manager)
+    finally:
+        db_manager.close_connection()
+
+
+def test_failed_migration_is_rolled_back(tmp_path, monkeypatch):
+    path = tmp_path / 'resumes.db'
+    shutil.copy(SHIPPED_DB, path)
+    migrate_text_table = app.SQLiteDatabaseManager._migrate_text_table
+
+    def interrupted(self, conn):
+        migrate_text_table(self, conn)
+        raise RuntimeError('interrupted')
+
+    monkeypatch.setattr(app.SQLiteDatabaseManager, '_migrate_text_table', interrupted)
+    with pytest.raises(RuntimeError):
+        app.SQLiteDatabaseManager(str(path))
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == app.SQLiteDatabaseManager.MIGRATIONS.index('_migrate_text_table')
+        assert 'raw_text' in [row[1] for row in conn.execute("PRAGMA table_info(resumes)")]
+        assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'resume_text'").fetchone() is None
@@ -0,0 +1,82 @@
+import shutil
+
+import app
+from conftest import RESUME_LINES, SHIPPED_DB
+
+
+def store_copies(db_manager, parser, names):
+    text = '\n'.join(RESUME_LINES[1:])
+    return db_manager.store_resumes([parser.parse_text(f"{name}\n{text}") for name in names])
+
+
+def test_near_duplicates_are_flagged_and_counted(db_manager, parser):
+    root, copy = store_copies(db_manager, parser, ['Jane Doe', 'Jane Doe'])
+
+    assert db_manager.duplicate_of(root) is None
+    assert db_manager.duplicate_of(copy)['resume_id'] == root
+    assert 'resume_parser_duplicates_total ' in app.METRICS.render()
+
+
+def test_deleting_a_root_promotes_the_oldest_member(db_manager, parser):
+    root, first, second = store_copies(db_manager, parser, ['Jane Doe'] * 3)
+    assert db_manager.duplicate_of(second)['resume_id'] == root
+
+    db_manager.delete_resumes([root])
+
+    assert db_manager.duplicate_of(first) is None
+    assert db_manager.duplicate_of(second)['resume_id'] == first
+    clusters, _ = db_manager.duplicate_clusters()
+    assert [cluster['resume_id'] for cluster in clusters] == [first]
+    assert [member['resume_id'] for member in clusters[0]['duplicates']] == [second]
+
+
+def forget_signatures(db_manager):
+    """Make stored resumes look as if they predate duplicate detection."""
+    with db_manager.get_connection() as conn:
+        conn.execute("DELETE FROM resume_lsh")
+        conn.execute("DELETE FROM resume_minhash")
+
+
+def test_backfill_makes_the_lowest_id_the_root(db_manager, parser):
+    ids = store_copies(db_manager, parser, ['Jane Doe'] * 3)
+    forget_signatures(db_manager)
+
+    assert sum(db_manager.backfill_minhash(batch_size=2)) == 3
+
+    with db_manager.get_connection() as conn:
+        rows = dict(conn.execute("SELECT resume_id, duplicate_of FROM resume_minhash"))
+    assert rows == {ids[0]: None, ids[1]: ids[0], ids[2]: ids[0]}
+    clusters, _ = db_manager.duplicate_clusters()
+    assert [cluster['resume_id'] for cluster in clusters] == [ids[0]]
+    assert clusters[0]['email'] == 'jane.doe@example.com'
+    assert sorted(member['resume_id'] for member in clusters[0]['duplicates']) == ids[1:]
+
+
+def test_backfill_links_old_resumes_to_already_hashed_ones_below_them(db_manager, parser):
+    first, second = store_copies(db_manager, parser, ['Jane Doe'] * 2)
+    with db_manager.get_connection() as conn:
+        conn.execute("DELETE FROM resume_lsh WHERE resume_id = ?", (second,))
+        conn.execute("DELETE FROM resume_minhash WHERE resume_id = ?", (second,))
+
+    list(db_manager.backfill_minhash())
+
+    assert db_manager.duplicate_of(first) is None
+    assert db_manager.duplicate_of(second)['resume_id'] == first
+
+
+def test_backfill_of_the_shipped_database_never_points_a_resume_at_itself(tmp_path):
+    shutil.copy(SHIPPED_DB, tmp_path / 'resumes.db')
+    db_manager = app.SQLiteDatabaseManager(str(tmp_path / 'resumes.db'))
+    try:
+        list(db_manager.backfill_minhash())
+        with db_manager.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT resume_id, duplicate_of FROM resume_minhash WHERE duplicate_of IS NOT NULL"
+            ).fetchall()
+        assert rows and all(root < resume_id for resume_id, root in rows)
+        clusters, _ = db_manager.duplicate_clusters()
+        for cluster in clusters:
+            assert cluster['name'] is not None
+            assert cluster['resume_id'] not in [member['resume_id'] for member in cluster['duplicates']]
+    finally:
+        db_manager.close_connection()
@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+
+import pytest
+
+import app
+from conftest import RESUME_LINES
+
+
+def store(db_manager, parser, names):
+    return db_manager.store_resumes([
+        parser.parse_text('\n'.join([name] + RESUME_LINES[1:])) for name in names
+    ])
+
+
+def read_table(path, fmt):
+    pa = pytest.importorskip('pyarrow')
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(path)
+    with open(path, 'rb') as f:
+        return pa.ipc.open_stream(f).read_all()
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_arrow_formats_hold_every_table_across_chunks(db_manager, parser, tmp_path, fmt):
+    pa = pytest.importorskip('pyarrow')
+    stored = store(db_manager, parser, ['Jane Doe', 'John Roe', 'Ann Poe'])
+    exporter = app.ResumeExporter(db_manager, chunk_size=2)
+
+    manifest = exporter.export(str(tmp_path / 'out'), fmt=fmt)
+
+    assert manifest['until_id'] == stored[-1]
+    assert {table: entry['rows'] for table, entry in manifest['tables'].items()} == {
+        'resumes': 3, 'education': 3, 'experience': 3, 'skills': 18,
+    }
+    assert json.loads((tmp_path / 'out' / 'manifest.json').read_text()) == manifest
+
+    resumes = read_table(tmp_path / 'out' / manifest['tables']['resumes']['file'], fmt)
+    assert resumes.column_names == [name for name, _ in app.ResumeExporter.TABLES['resumes'][0]]
+    assert resumes.column('id').to_pylist() == stored
+    assert resumes.column('name').to_pylist() == ['Jane Doe', 'John Roe', 'Ann Poe']
+    assert pa.types.is_timestamp(resumes.schema.field('created_at').type)  # Parquet widens seconds to ms
+
+    skills = read_table(tmp_path / 'out' / manifest['tables']['skills']['file'], fmt)
+    assert sorted(set(skills.column('skill').to_pylist()))[:2] == ['aws', 'docker']
+    assert not list((tmp_path / 'out').glob('*.tmp'))
+
+
+def test_csv_export_and_incremental_since_id(db_manager, parser, tmp_path):
+    first = store(db_manager, parser, ['Jane Doe'])
+    exporter = app.ResumeExporter(db_manager, include_text=True)
+    manifest = exporter.export(str(tmp_path / 'full'), fmt='csv', tables=['resumes', 'education'])
+
+    with open(tmp_path / 'full' / 'resumes.csv', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['id'] for row in rows] == [str(first[0])]
+    assert rows[0]['email'] == 'jane.doe@example.com'
+    assert rows[0]['raw_text'].startswith('Jane Doe\n')
+    assert set(manifest['tables']) == {'resumes', 'education'}
+
+    second = store(db_manager, parser, ['John Roe'])
+    delta = exporter.export(str(tmp_path / 'delta'), fmt='csv', since_id=manifest['until_id'])
+
+    assert delta['since_id'] == first[0]
+    assert delta['until_id'] == second[0]
+    assert delta['tables']['resumes']['rows'] == 1
+    with open(tmp_path / 'delta' / 'resumes.csv', newline='', encoding='utf-8') as f:
+        assert [row['name'] for row in csv.DictReader(f)] == ['John Roe']
+
+
+def test_export_rejects_unknown_tables_and_timestamps(db_manager, tmp_path):
+    exporter = app.ResumeExporter(db_manager)
+
+    with pytest.raises(ValueError):
+        exporter.export(str(tmp_path), fmt='csv', tables=['passwords'])
+    with pytest.raises(ValueError):
+        exporter.export(str(tmp_path), fmt='csv', since='yesterday')
+
+
+def test_export_endpoint_streams_a_table(flask_app):
+    pa = pytest.importorskip('pyarrow')
+    services = flask_app.extensions['resume_parser']
+    stored = store(services.db_manager, services.parser, ['Jane Doe', 'John Roe'])
+    client = flask_app.test_client()
+
+    response = client.get(f'/export/resumes?format=arrow&since_id={stored[0]}')
+
+    assert response.status_code == 200
+    assert response.headers['X-Export-Until-Id'] == str(stored[-1])
+    table = pa.ipc.open_stream(io.BytesIO(response.data)).read_all()
+    assert table.column('name').to_pylist() == ['John Roe']
+
+    assert client.get('/export/passwords').status_code == 400
+    assert client.get('/export/resumes?format=xlsx').status_code == 400
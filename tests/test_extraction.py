@@ -0,0 +1,131 @@
+import io
+import json
+
+import pytest
+
+import app
+from conftest import RESUME_LINES, docx_bytes, pdf_bytes
+
+PAGES = [
+    ['Jane Doe', 'jane.doe@example.com'],
+    ['Phone: +1 555 123 4567'],
+    ['Experience'],
+    ['Education'],
+]
+
+
+def record_pages(parser, monkeypatch):
+    pages = []
+    iter_pdf_pages = parser.iter_pdf_pages
+
+    def recording(source, max_pages=None):
+        for page in iter_pdf_pages(source, max_pages=max_pages):
+            pages.append(page[0])
+            yield page
+
+    monkeypatch.setattr(parser, 'iter_pdf_pages', recording)
+    return pages
+
+
+def test_page_limit_stops_reading_pages(parser, monkeypatch):
+    pages = record_pages(parser, monkeypatch)
+
+    result = parser.extract_pdf(io.BytesIO(pdf_bytes(PAGES)), max_pages=2)
+
+    assert result.status == 'truncated'
+    assert (result.pages_read, result.page_count) == (2, 4)
+    assert pages == [1, 2]
+
+
+def test_whole_document_within_the_page_limit_is_ok(parser):
+    result = parser.extract_pdf(io.BytesIO(pdf_bytes(PAGES)), max_pages=4)
+
+    assert result.status == 'ok'
+    assert result.pages_read == 4
+
+
+def test_contact_details_split_across_pages_stop_extraction(parser, monkeypatch):
+    pages = record_pages(parser, monkeypatch)
+
+    result = parser.extract_pdf(io.BytesIO(pdf_bytes(PAGES)), stop_when_contact_found=True)
+
+    assert result.status == 'stopped_early'
+    assert pages == [1, 2]
+    assert 'jane.doe@example.com' in result.text
+
+
+def test_contacts_command_prints_contact_details(tmp_path):
+    (tmp_path / 'jane.pdf').write_bytes(pdf_bytes(PAGES))
+    (tmp_path / 'john.docx').write_bytes(docx_bytes(['John Roe'] + RESUME_LINES[1:]))
+    flask_app = app.create_app({'DATABASE': str(tmp_path / 'resumes.db')})
+    flask_app.extensions['resume_parser'].parser.nlp = None
+
+    result = flask_app.test_cli_runner().invoke(args=['contacts', str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    rows = {json.loads(line)['path'].rsplit('/', 1)[-1]: json.loads(line) for line in result.output.splitlines()}
+    assert rows['jane.pdf']['email'] == 'jane.doe@example.com'
+    assert rows['jane.pdf']['extraction']['status'] == 'stopped_early'
+    assert rows['john.docx']['email'] == 'jane.doe@example.com'
+
+
+def test_pdf_without_pages_is_empty(parser):
+    result = parser.extract_pdf(io.BytesIO(pdf_bytes([])), max_pages=2)
+
+    assert result.status == 'empty'
+    assert result.error is None
+
+
+def python_docx_document():
+    docx = pytest.importorskip('docx')  # reference implementation only; the reader does not need it
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = 'Jane Doe - Curriculum Vitae'
+    document.add_paragraph('Jane Doe')
+    run = document.add_paragraph('jane.doe@example.com').add_run()
+    run.add_tab()
+    run.add_text('+1 555 123 4567')
+    table = document.add_table(rows=2, cols=2)
+    for row, cells in zip(table.rows, [('Skill', 'Years'), ('Python', '7')]):
+        for cell, text in zip(row.cells, cells):
+            cell.text = text
+    document.add_paragraph('Line one').add_run().add_break()
+    document.sections[0].footer.paragraphs[0].text = 'Page footer'
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return document, buffer
+
+
+def test_docx_reader_matches_python_docx(parser):
+    document, buffer = python_docx_document()
+    body = []
+    for block in document.iter_inner_content():
+        if hasattr(block, 'rows'):
+            body += [p.text for row in block.rows for cell in row.cells for p in cell.paragraphs]
+        else:
+            body.append(block.text)
+    section = document.sections[0]
+    expected = ([p.text for p in section.header.paragraphs] + body
+                + [p.text for p in section.footer.paragraphs])
+
+    buffer.seek(0)
+    result = parser.extract_docx(buffer)
+
+    assert result.status == 'ok'
+    assert result.text == '\n'.join(expected) + '\n'
+    assert 'jane.doe@example.com\t+1 555 123 4567' in result.text
+
+
+def test_docx_reader_stops_at_the_character_limit(parser):
+    result = parser.extract_docx(io.BytesIO(docx_bytes(RESUME_LINES)), max_chars=40)
+
+    assert result.status == 'memory_limit'
+    assert result.text == '\n'.join(RESUME_LINES)[:40]
+
+
+def test_legacy_doc_is_rejected(parser):
+    source = io.BytesIO(app.OLE_MAGIC + b'\0' * 512)
+
+    result = parser.extract(source, filename='resume.doc')
+
+    assert result.status == 'error'
+    assert '.doc' in result.error
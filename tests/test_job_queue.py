@@ -0,0 +1,116 @@
+import io
+import os
+import time
+
+from conftest import RESUME_LINES, docx_bytes, wait_for_job
+
+
+def test_job_is_parsed_and_stored(job_queue, db_manager):
+    job_id = job_queue.submit(io.BytesIO(docx_bytes(RESUME_LINES)), 'jane.docx', content_hash='abc')
+
+    job = wait_for_job(job_queue, job_id)
+    assert job['status'] == 'done'
+    assert db_manager.resume_exists(job['resume_id'])
+    assert job['result']['email'] == 'jane.doe@example.com'
+
+
+def test_worker_survives_a_failing_batch(job_queue, monkeypatch):
+    process = job_queue._process
+    batches = []
+
+    def fail_first_batch(jobs):
+        batches.append(jobs)
+        if len(batches) == 1:
+            raise RuntimeError('boom')
+        return process(jobs)
+
+    monkeypatch.setattr(job_queue, '_process', fail_first_batch)
+
+    first = job_queue.submit(io.BytesIO(docx_bytes(RESUME_LINES)), 'first.docx')
+    job = wait_for_job(job_queue, first)
+    assert job['status'] == 'failed'
+    assert 'boom' in job['error']
+
+    second = job_queue.submit(io.BytesIO(docx_bytes(RESUME_LINES)), 'second.docx')
+    assert wait_for_job(job_queue, second)['status'] == 'done'
+    assert all(thread.is_alive() for thread in job_queue._threads)
+
+
+def test_cache_failure_does_not_fail_the_job(job_queue, monkeypatch):
+    def broken_put(*args, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(job_queue.parse_cache, 'put', broken_put)
+
+    job_id = job_queue.submit(io.BytesIO(docx_bytes(RESUME_LINES)), 'jane.docx', content_hash='abc')
+    assert wait_for_job(job_queue, job_id)['status'] == 'done'
+
+
+def queue_jobs(job_queue, tmp_path, names):
+    """Create job rows and spooled files without handing them to a worker."""
+    jobs = []
+    for name in names:
+        file_path = tmp_path / name
+        file_path.write_bytes(docx_bytes([name.split('.')[0].title()] + RESUME_LINES[1:]))
+        job_id = name.split('.')[0]
+        with job_queue.db_manager.get_connection() as conn:
+            conn.execute("INSERT INTO upload_jobs (id, filename, file_path, status) VALUES (?, ?, ?, 'queued')",
+                         (job_id, name, str(file_path)))
+        jobs.append((job_id, str(file_path), None))
+    return jobs
+
+
+def test_parse_error_fails_only_the_offending_job(job_queue, tmp_path, monkeypatch):
+    jobs = queue_jobs(job_queue, tmp_path, ['alice.docx', 'poison.docx', 'carol.docx'])
+    parse_texts = job_queue.parser.parse_texts
+
+    def parse_texts_or_raise(texts, **kwargs):
+        if any(text.startswith('Poison') for text in texts):
+            raise ValueError('unparseable')
+        return parse_texts(texts, **kwargs)
+
+    monkeypatch.setattr(job_queue.parser, 'parse_texts', parse_texts_or_raise)
+    job_queue._process(jobs)
+
+    assert job_queue.get_job('poison')['status'] == 'failed'
+    assert 'unparseable' in job_queue.get_job('poison')['error']
+    assert job_queue.get_job('alice')['status'] == 'done'
+    assert job_queue.get_job('carol')['status'] == 'done'
+
+
+def test_store_error_fails_only_the_offending_job(job_queue, tmp_path, monkeypatch):
+    jobs = queue_jobs(job_queue, tmp_path, ['alice.docx', 'poison.docx'])
+    store_resumes = job_queue.db_manager.store_resumes
+
+    def store_or_raise(parsed_resumes):
+        if any(parsed.contact_info.name == 'Poison' for parsed in parsed_resumes):
+            raise ValueError('constraint failed')
+        return store_resumes(parsed_resumes)
+
+    monkeypatch.setattr(job_queue.db_manager, 'store_resumes', store_or_raise)
+    job_queue._process(jobs)
+
+    assert job_queue.get_job('poison')['status'] == 'failed'
+    alice = job_queue.get_job('alice')
+    assert alice['status'] == 'done'
+    assert job_queue.db_manager.resume_exists(alice['resume_id'])
+
+
+def test_slow_job_times_out_without_the_rest_of_its_batch(job_queue, tmp_path, monkeypatch):
+    jobs = queue_jobs(job_queue, tmp_path, ['slow.docx', 'bob.docx'])
+    job_queue.job_timeout = 0.5
+    extract = job_queue.parser.extract
+    budgets = {}
+
+    def slow_extract(file_path, time_budget=None):
+        budgets[os.path.basename(file_path)] = time_budget
+        if file_path.endswith('slow.docx'):
+            time.sleep(0.6)
+        return extract(file_path, time_budget=time_budget)
+
+    monkeypatch.setattr(job_queue.parser, 'extract', slow_extract)
+    job_queue._process(jobs)
+
+    assert job_queue.get_job('slow')['status'] == 'timed_out'
+    assert job_queue.get_job('bob')['status'] == 'done'
+    assert budgets['bob.docx'] == budgets['slow.docx'] <= 0.5
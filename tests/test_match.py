@@ -0,0 +1,50 @@
+import app
+
+
+def resume(parser, name, body):
+    return parser.parse_text(f"{name}\njane@example.com\n\nSKILLS\n{body}")
+
+
+def test_best_match_ranks_first_and_explains_skills(db_manager, parser):
+    backend, frontend = db_manager.store_resumes([
+        resume(parser, 'Alice Smith', 'Python, Django, PostgreSQL, Docker'),
+        resume(parser, 'Bob Jones', 'JavaScript, React, CSS, Figma'),
+    ])
+    engine = app.MatchEngine(db_manager, parser.skill_matcher)
+
+    result = engine.match('Backend engineer: Python, Django and Kubernetes', top_k=5)
+
+    assert result['indexed'] == 2
+    assert [row['resume_id'] for row in result['results']] == [backend]
+    top = result['results'][0]
+    assert 0 < top['score'] <= 1
+    assert set(top['matched_skills']) == {'Python', 'Django'}
+    assert top['missing_skills'] == ['Kubernetes']
+    assert frontend not in [row['resume_id'] for row in result['results']]
+
+
+def test_resumes_stored_later_are_appended_to_the_index(db_manager, parser):
+    engine = app.MatchEngine(db_manager, parser.skill_matcher)
+    db_manager.store_resumes([resume(parser, 'Alice Smith', 'Python, Django')])
+    assert engine.match('Python developer')['indexed'] == 1
+
+    later, = db_manager.store_resumes([resume(parser, 'Carol White', 'Rust, Terraform')])
+    result = engine.match('Terraform and Rust platform engineer')
+
+    assert result['indexed'] == 2
+    assert result['results'][0]['resume_id'] == later
+
+
+def test_snapshots_in_use_are_not_resized(db_manager, parser):
+    engine = app.MatchEngine(db_manager, parser.skill_matcher)
+    db_manager.store_resumes([resume(parser, 'Alice Smith', 'Python, Django')])
+    engine.sync()
+    blocks, _, _, _ = engine._snapshot()
+    shapes = [block.shape for block in blocks]
+
+    db_manager.store_resumes([resume(parser, 'Carol White', 'Rust, Terraform, Kubernetes, zeppelins')])
+    engine.sync()
+    wider, _, _, _ = engine._snapshot()
+
+    assert [block.shape for block in blocks] == shapes
+    assert wider[0].shape[1] > shapes[0][1]
@@ -0,0 +1,45 @@
+import json
+
+import app
+from conftest import RESUME_LINES
+
+
+def test_cached_parse_round_trips_with_compressed_text(db_manager, parser):
+    cache = app.ParseCache(db_manager)
+    parsed = parser.parse_text('\n'.join(RESUME_LINES))
+
+    cache.put('abc', parser.version, parsed, resume_id=7)
+    cached, resume_id = cache.get('abc', parser.version)
+
+    assert resume_id == 7
+    assert cached.raw_text == parsed.raw_text
+    assert cached.contact_info.email == parsed.contact_info.email
+    with db_manager.get_connection() as conn:
+        payload, = conn.execute("SELECT parsed FROM parse_cache").fetchone()
+    assert 'raw_text' not in json.loads(payload)
+
+
+def test_least_recently_used_entries_are_evicted(db_manager, parser):
+    cache = app.ParseCache(db_manager, max_entries=3)
+    parsed = parser.parse_text('\n'.join(RESUME_LINES))
+    for key in ('a', 'b', 'c', 'd', 'e'):
+        cache.put(key, parser.version, parsed)
+
+    assert [key for key in 'abcde' if cache.get(key, parser.version)] == ['c', 'd', 'e']
+    assert cache.stats()['evictions'] == 2
+
+
+def test_cache_stays_under_its_byte_limit(db_manager, parser):
+    parsed = parser.parse_text('\n'.join(RESUME_LINES))
+    cache = app.ParseCache(db_manager)
+    cache.put('probe', parser.version, parsed)
+    entry_bytes = cache.stats()['size_bytes']
+
+    cache = app.ParseCache(db_manager, max_bytes=entry_bytes * 4)
+    for key in range(10):
+        cache.put(str(key), parser.version, parsed)
+
+    stats = cache.stats()
+    assert stats['size_bytes'] <= entry_bytes * 4
+    assert stats['entries'] == 4
+    assert cache.get('9', parser.version) is not None
@@ -0,0 +1,52 @@
+import app
+from conftest import RESUME_LINES
+
+
+def store_outdated(db_manager, parser, count, version='0.old'):
+    """Store resumes as an older extractor would have: same text, no skills found."""
+    stale = []
+    for i in range(count):
+        parsed = parser.parse_text('\n'.join([f'Person{i} Smith'] + RESUME_LINES[1:]))
+        parsed.skills = []
+        parsed.extractor_version = version
+        stale.append(parsed)
+    return db_manager.store_resumes(stale)
+
+
+def test_outdated_resumes_and_version_counts(db_manager, parser):
+    old = store_outdated(db_manager, parser, 2)
+    legacy, = store_outdated(db_manager, parser, 1, version=None)
+    current, = db_manager.store_resumes([parser.parse_text('\n'.join(RESUME_LINES))])
+
+    assert db_manager.extractor_versions() == {'0.old': 2, None: 1, parser.version: 1}
+    rows = db_manager.outdated_resumes(parser.version)
+    assert [resume_id for resume_id, _ in rows] == old + [legacy]
+    assert rows[0][1].startswith('Person0 Smith')
+    next_page = db_manager.outdated_resumes(parser.version, after_id=old[0], limit=1)
+    assert [resume_id for resume_id, _ in next_page] == old[1:]
+    assert current not in [resume_id for resume_id, _ in rows]
+
+
+def test_run_brings_every_resume_to_the_current_version(db_manager, parser):
+    stored = store_outdated(db_manager, parser, 3) + store_outdated(db_manager, parser, 1, version=None)
+    reextractor = app.Reextractor(db_manager, workers=1, chunksize=2)
+    assert reextractor.pending() == 4
+
+    stats = reextractor.run()
+
+    assert (stats['updated'], stats['failed']) == (4, 0)
+    assert db_manager.extractor_versions() == {reextractor.version: 4}
+    assert reextractor.pending() == 0
+    assert [row['id'] for row in db_manager.search_resumes(skills=['Kubernetes'])] == stored[::-1]
+    assert app.Reextractor(db_manager, workers=1).run()['updated'] == 0
+
+
+def test_limited_runs_resume_where_the_last_one_stopped(db_manager, parser):
+    store_outdated(db_manager, parser, 3)
+    reextractor = app.Reextractor(db_manager, workers=1, chunksize=1)
+
+    assert reextractor.run(limit=2)['updated'] == 2
+    assert db_manager.extractor_versions() == {reextractor.version: 2, '0.old': 1}
+
+    assert reextractor.run()['updated'] == 1
+    assert reextractor.pending() == 0
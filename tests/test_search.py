@@ -0,0 +1,108 @@
+import json
+
+import app
+
+
+def resume(parser, name, skills, extra=''):
+    return parser.parse_text(f"{name}\n{name.split()[0].lower()}@example.com\n\nSKILLS\n{skills}\n\n{extra}")
+
+
+def store(db_manager, parser, *resumes):
+    return db_manager.store_resumes([resume(parser, *args) for args in resumes])
+
+
+def ids(rows):
+    return [row['id'] for row in rows]
+
+
+def test_skill_search_any_all_and_min_match(db_manager, parser):
+    alice, bob, carol = store(db_manager, parser,
+                              ('Alice Smith', 'Python, Docker, AWS'),
+                              ('Bob Jones', 'Python, React'),
+                              ('Carol White', 'Java, AWS'))
+
+    assert ids(db_manager.search_resumes(skills=['Python', 'AWS'])) == [alice, carol, bob]
+    assert ids(db_manager.search_resumes(skills=['python', 'aws'], match='all')) == [alice]
+    assert ids(db_manager.search_resumes(skills=['Python', 'AWS', 'Docker'], min_match=2)) == [alice]
+    assert db_manager.search_resumes(skills=['Python', 'AWS'])[0]['matched_skills'] == 2
+
+
+def test_skill_index_is_rebuilt_on_update(db_manager, parser):
+    alice, = store(db_manager, parser, ('Alice Smith', 'Python'))
+
+    db_manager.update_resumes([(alice, resume(parser, 'Alice Smith', 'Go, Rust'))])
+
+    assert db_manager.search_resumes(skills=['Python']) == []
+    assert ids(db_manager.search_resumes(skills=['Rust'])) == [alice]
+
+
+def test_build_fts_query_quotes_words_and_keeps_operators():
+    assert app.build_fts_query('python developer') == '"python" "developer"'
+    assert app.build_fts_query('"machine learning" OR pyth*') == '"machine learning" OR "pyth"*'
+    assert app.build_fts_query('c++ AND o"reilly') == '"c++" AND "o""reilly"'
+    assert app.build_fts_query('OR python NOT') == '"python"'
+    assert app.build_fts_query('***') == '""'
+
+
+def test_fulltext_search_ranks_phrases_prefixes_and_snippets(db_manager, parser):
+    alice, bob = store(db_manager, parser,
+                       ('Alice Smith', 'Python', 'Built machine learning pipelines for fraud detection.'),
+                       ('Bob Jones', 'Java', 'Learning new machines every day.'))
+
+    assert ids(db_manager.search_resumes(query='"machine learning"')) == [alice]
+    assert set(ids(db_manager.search_resumes(query='machin*'))) == {alice, bob}
+    assert ids(db_manager.search_resumes(query='fraud OR nonexistent')) == [alice]
+    assert ids(db_manager.search_resumes(query='Bob')) == [bob]
+
+    hit, = db_manager.search_resumes(query='fraud')
+    assert '<mark>fraud</mark>' in hit['snippet']
+    assert hit['rank'] < 0
+
+
+def test_punctuation_cannot_break_the_query(db_manager, parser):
+    store(db_manager, parser, ('Alice Smith', 'C++'))
+
+    assert db_manager.search_resumes(query='c++ (senior) "unterminated') == []
+
+
+def test_keyset_pages_cover_every_row_once(db_manager, parser):
+    stored = store(db_manager, parser, *[(f'Person{i} Smith', 'Python', 'zeppelin') for i in range(5)])
+
+    for search in ({}, {'skills': ['Python']}, {'query': 'zeppelin'}):
+        seen, cursor = [], None
+        while True:
+            page = db_manager.search_resumes(limit=2, cursor=cursor, **search)
+            seen += ids(page)
+            if len(page) < 2:
+                break
+            cursor = db_manager.next_cursor(page[-1])
+        assert sorted(seen) == sorted(stored), search
+
+
+def test_search_endpoint_pages_projects_and_rejects_bad_input(flask_app):
+    services = flask_app.extensions['resume_parser']
+    stored = store(services.db_manager, services.parser, *[(f'Person{i} Smith', 'Python') for i in range(3)])
+    client = flask_app.test_client()
+
+    first = client.get('/search?limit=2&fields=name,email').get_json()
+    assert first['count'] == 2
+    assert set(first['results'][0]) == {'id', 'name', 'email'}
+    second = client.get(f"/search?limit=2&cursor={first['next_cursor']}").get_json()
+    assert ids(first['results']) + ids(second['results']) == stored[::-1]
+    assert second['next_cursor'] is None
+
+    assert client.get('/search?cursor=not-a-cursor').status_code == 400
+    assert client.get('/search?fields=password').status_code == 400
+    assert client.get('/search?match=some').status_code == 400
+
+
+def test_search_endpoint_streams_ndjson(flask_app):
+    services = flask_app.extensions['resume_parser']
+    stored = store(services.db_manager, services.parser, *[(f'Person{i} Smith', 'Python') for i in range(3)])
+
+    response = flask_app.test_client().get('/search?skills=python&format=ndjson&fields=name')
+
+    assert response.mimetype == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert ids(rows) == stored[::-1]
+    assert rows[0]['name'] == 'Person2 Smith'
@@ -0,0 +1,28 @@
+import app
+
+
+def matcher():
+    return app.SkillMatcher({
+        'programming': {'Go': ['golang'], 'Java': [], 'JavaScript': ['js']},
+        'web': {'Spring Boot': ['spring framework']},
+    }, case_sensitive=['Go'])
+
+
+def test_case_sensitive_skills_ignore_the_english_word():
+    assert [match.name for match in matcher().find("Ready to go the extra mile")] == []
+    assert [match.name for match in matcher().find("GO team, let's go")] == []
+
+
+def test_case_sensitive_skills_match_as_written_and_by_alias():
+    found = matcher().find("Services in Go and Java; more golang later")
+    assert [(match.name, match.count) for match in found] == [('Go', 2), ('Java', 1)]
+
+
+def test_other_skills_stay_case_insensitive():
+    found = matcher().find("JAVASCRIPT, java and the SPRING FRAMEWORK")
+    assert [match.name for match in found] == ['JavaScript', 'Java', 'Spring Boot']
+
+
+def test_shipped_taxonomy_treats_go_as_case_sensitive(parser):
+    assert parser.extract_skills("Ready to go the extra mile with Python") == ['Python']
+    assert 'Go' in parser.extract_skills("Backend services in Go")
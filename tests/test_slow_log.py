@@ -0,0 +1,35 @@
+import io
+import json
+
+import app
+from conftest import RESUME_LINES, docx_bytes, wait_for_job
+
+
+def test_slow_parses_are_logged(tmp_path, parser):
+    log_path = tmp_path / 'slow.log'
+    parser.slow_log = app.SlowParseLog(str(log_path), threshold=0)
+
+    parser.parse_resume_bytes(docx_bytes(RESUME_LINES), 'jane.docx')
+
+    entry = json.loads(log_path.read_text().splitlines()[0])
+    assert entry['filename'] == 'jane.docx'
+    assert entry['status'] == 'ok'
+
+
+def test_unwritable_log_does_not_fail_the_parse(tmp_path, parser, capsys):
+    parser.slow_log = app.SlowParseLog(str(tmp_path / 'missing' / 'slow.log'), threshold=0)
+
+    parsed = parser.parse_resume_bytes(docx_bytes(RESUME_LINES), 'jane.docx')
+
+    assert parsed.contact_info.email == 'jane.doe@example.com'
+    assert 'Could not write slow parse log' in capsys.readouterr().out
+
+
+def test_unwritable_log_does_not_fail_queued_jobs(tmp_path, job_queue):
+    job_queue.parser.slow_log = app.SlowParseLog(str(tmp_path / 'missing' / 'slow.log'), threshold=0)
+
+    first = job_queue.submit(io.BytesIO(docx_bytes(RESUME_LINES)), 'first.docx')
+    second = job_queue.submit(io.BytesIO(docx_bytes(RESUME_LINES)), 'second.docx')
+
+    assert wait_for_job(job_queue, first)['status'] == 'done'
+    assert wait_for_job(job_queue, second)['status'] == 'done'
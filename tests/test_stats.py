@@ -0,0 +1,83 @@
+from conftest import RESUME_LINES
+
+
+def skills(stats):
+    return {entry['skill']: entry['resumes'] for entry in stats['top_skills']}
+
+
+def store_jane_and_bob(db_manager, parser):
+    return db_manager.store_resumes([
+        parser.parse_text('\n'.join(RESUME_LINES)),
+        parser.parse_text('Bob Jones\nbob@example.com\n\nSKILLS\nPython, React'),
+    ])
+
+
+def test_aggregates_follow_inserts(db_manager, parser):
+    store_jane_and_bob(db_manager, parser)
+
+    stats = db_manager.get_stats()
+    assert stats['total_resumes'] == 2
+    assert stats['total_education_records'] == 1
+    assert stats['total_experience_records'] == 1
+    assert stats['average_skills_per_resume'] == 4.0
+    assert stats['top_skills'][0] == {'skill': 'python', 'resumes': 2}
+    assert skills(stats)['react'] == 1
+    assert stats['degrees'] == [{'degree': 'bachelor', 'records': 1}]
+    today = db_manager.get_connection().execute("SELECT date('now')").fetchone()[0]
+    assert stats['resumes_per_day'] == [{'day': today, 'resumes': 2}]
+
+
+def test_aggregates_follow_updates_and_deletes(db_manager, parser):
+    jane, bob = store_jane_and_bob(db_manager, parser)
+
+    db_manager.update_resumes([(bob, parser.parse_text('Bob Jones\nbob@example.com\n\nSKILLS\nRust'))])
+    stats = db_manager.get_stats()
+    assert skills(stats)['python'] == 1
+    assert skills(stats)['rust'] == 1
+    assert 'react' not in skills(stats)
+
+    db_manager.delete_resumes([jane])
+    stats = db_manager.get_stats()
+    assert stats['total_resumes'] == 1
+    assert stats['total_education_records'] == 0
+    assert stats['degrees'] == []
+    assert skills(stats) == {'rust': 1}
+    assert stats['resumes_per_day'][0]['resumes'] == 1
+
+
+def test_rebuild_matches_the_trigger_maintained_figures(db_manager, parser):
+    jane, bob = store_jane_and_bob(db_manager, parser)
+    db_manager.delete_resumes([bob])
+    maintained = db_manager.get_stats()
+
+    with db_manager.get_connection() as conn:
+        conn.execute("DELETE FROM stats_skills")
+        conn.execute("UPDATE stats_totals SET value = 0")
+    db_manager.rebuild_stats()
+
+    assert db_manager.get_stats() == maintained
+
+
+def test_top_limits_skills_and_endpoint_canonicalizes_them(flask_app):
+    services = flask_app.extensions['resume_parser']
+    store_jane_and_bob(services.db_manager, services.parser)
+    client = flask_app.test_client()
+
+    stats = client.get('/api/stats?top=2').get_json()['stats']
+    assert stats['total_resumes'] == 2
+    assert len(stats['top_skills']) == 2
+    assert stats['top_skills'][0]['skill'] == 'Python'
+    assert 'category' in stats['top_skills'][0]
+    assert stats['cache_age_seconds'] == 0.0
+
+
+def test_endpoint_serves_cached_figures_until_cleared(flask_app):
+    services = flask_app.extensions['resume_parser']
+    client = flask_app.test_client()
+    assert client.get('/api/stats').get_json()['stats']['total_resumes'] == 0
+
+    store_jane_and_bob(services.db_manager, services.parser)
+    assert client.get('/api/stats').get_json()['stats']['total_resumes'] == 0
+
+    services.stats_cache.clear()
+    assert client.get('/api/stats').get_json()['stats']['total_resumes'] == 2